@@ -44,7 +44,7 @@ async function authenticatedFetch(endpoint, options = {}) {
 export const apiService = {
   /**
    * Fetch key requests with optional filter
-   * @param {string} filter - Filter by state: 'pending', 'review', 'all'
+   * @param {string} filter - Filter by state: 'pending', 'review', 'dead-letter', 'all'
    * @returns {Promise<Array>} - Array of key requests
    */
   async fetchRequests(filter = 'pending') {
@@ -82,5 +82,16 @@ export const apiService = {
       method: 'POST',
       body: JSON.stringify({ reason })
     })
+  },
+
+  /**
+   * Move a dead-lettered key request back to pending
+   * @param {string} requestId - Request ID to re-queue
+   * @returns {Promise<object>} - Action response
+   */
+  async requeueRequest(requestId) {
+    return authenticatedFetch(`/admin/requests/${requestId}/requeue`, {
+      method: 'POST'
+    })
   }
 }
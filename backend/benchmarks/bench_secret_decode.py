@@ -0,0 +1,104 @@
+"""
+Micro-benchmark for converting key request secrets to KeyRequestData.
+
+Compares the previous per-field decode with full validation against the
+trusted fast path used for secrets written by the service.
+
+Usage (from the backend directory):
+    uv run python -m benchmarks.bench_secret_decode [count ...]
+"""
+import base64
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from kubernetes.client import V1Secret, V1ObjectMeta
+
+from src.models.key_request import KeyRequestData, KeyRequestState
+from src.services.kubernetes_secret_service import KubernetesSecretService
+
+
+def legacy_decode(secret: V1Secret) -> KeyRequestData:
+    """Secret conversion as implemented before the fast path."""
+    data = {}
+    if secret.data:
+        for key, value in secret.data.items():
+            data[key] = base64.b64decode(value).decode('utf-8')
+
+    annotations = secret.metadata.annotations or {}
+
+    return KeyRequestData(
+        request_id=data.get('request_id', ''),
+        email=data.get('email', ''),
+        model=data.get('model', ''),
+        state=KeyRequestState(data.get('state', KeyRequestState.PENDING)),
+        created_at=datetime.fromisoformat(annotations.get('created_at', datetime.now().isoformat())),
+        updated_at=datetime.fromisoformat(annotations.get('updated_at', datetime.now().isoformat())),
+        api_key=data.get('api_key') if 'api_key' in data else None,
+        resource_version=secret.metadata.resource_version
+    )
+
+
+def make_secrets(count: int) -> list[V1Secret]:
+    """Build secrets shaped like the ones returned by the API server."""
+    states = list(KeyRequestState)
+    start = datetime(2024, 1, 1)
+    secrets = []
+    for i in range(count):
+        state = states[i % len(states)]
+        timestamp = (start + timedelta(minutes=i)).isoformat()
+        fields = {
+            'request_id': str(uuid.uuid4()),
+            'email': f'user{i}@example.com',
+            'model': f'model-{i % 20}',
+            'state': state.value,
+        }
+        if state == KeyRequestState.APPROVED:
+            fields['api_key'] = f'sk-{uuid.uuid4().hex}'
+        secrets.append(V1Secret(
+            metadata=V1ObjectMeta(
+                name=f"llm-key-request-{fields['request_id']}",
+                resource_version=str(i + 1),
+                annotations={
+                    'email': fields['email'],
+                    'model': fields['model'],
+                    'state': state.value,
+                    'created_at': timestamp,
+                    'updated_at': timestamp,
+                }
+            ),
+            data={key: base64.b64encode(value.encode('utf-8')).decode('ascii') for key, value in fields.items()}
+        ))
+    return secrets
+
+
+def measure(decode, secrets: list[V1Secret]) -> float:
+    """Return records per second for decoding all secrets once."""
+    begin = time.perf_counter()
+    for secret in secrets:
+        decode(secret)
+    return len(secrets) / (time.perf_counter() - begin)
+
+
+def main(counts: list[int]) -> None:
+    decoders = [
+        ('legacy (validated)', legacy_decode),
+        ('strict', lambda secret: KubernetesSecretService._secret_to_request_data(secret, validate=True)),
+        ('fast', KubernetesSecretService._secret_to_request_data),
+    ]
+    for count in counts:
+        secrets = make_secrets(count)
+        # Warm up imports and caches
+        for _, decode in decoders:
+            measure(decode, secrets[:100])
+        print(f"{count} secrets:")
+        baseline = None
+        for name, decode in decoders:
+            rate = measure(decode, secrets)
+            baseline = baseline or rate
+            print(f"  {name:<20} {rate:>12,.0f} records/s  ({rate / baseline:.1f}x)")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000])
@@ -14,9 +14,13 @@ from injector import Injector, Module, provider, singleton
 from src.models.key_request import EmailConfig
 from src.services.approval_plugins.base import ApprovalPlugin
 from src.services.email_service import EmailService
+from src.services.key_request_store import KeyRequestStore
 from src.services.kubernetes_secret_service import KubernetesSecretService
+from src.services.sqlite_key_request_store import SqliteKeyRequestStore
 from src.litellm.manager import KeyManagement
 from src.services.approval_service import ApprovalService
+from src.services.decision_cache import DecisionCache
+from src.background.leader_election import QueueCoordinator
 import importlib
 
 
@@ -64,6 +68,43 @@ class AdminConfig(BaseModel):
     password: str = Field(default="change-me-in-production")
 
 
+class RetentionPolicy(BaseModel):
+    """Retention limits for requests in one terminal state."""
+    
+    max_age: Optional[str] = Field(default=None)
+    max_count: Optional[int] = Field(default=None)
+
+
+class RetentionConfig(BaseModel):
+    """Retention and archival of finished key requests."""
+    
+    enabled: bool = Field(default=False)
+    interval: str = Field(default="1h")
+    action: str = Field(default="archive")
+    batch_size: int = Field(default=100)
+    approved: RetentionPolicy = Field(default_factory=RetentionPolicy)
+    denied: RetentionPolicy = Field(default_factory=RetentionPolicy)
+
+
+class QueueLaneConfig(BaseModel):
+    """Queue lane: pending requests for matching models, with their own worker budget."""
+    
+    name: str
+    models: list[str] = Field(default_factory=lambda: ['*'])
+    concurrency: Optional[int] = Field(default=None)
+    request_timeout: Optional[float] = Field(default=None)
+
+
+class PriorityConfig(BaseModel):
+    """Ordering and deadlines of pending queue work."""
+    
+    order: list[str] = Field(default_factory=lambda: ['age'])
+    models: dict[str, int] = Field(default_factory=dict)
+    domains: dict[str, int] = Field(default_factory=dict)
+    deadline: Optional[str] = Field(default=None)
+    escalate_to: str = Field(default="in-review")
+
+
 class ConfigModule(Module):
     """Injector module for providing configured services."""
     
@@ -98,20 +139,65 @@ class ConfigModule(Module):
     
     
     @provider
+    @singleton
     def provide_k8s_service(self) -> KubernetesSecretService:
         """
         Provide KubernetesSecretService instance.
         
+        A single instance is shared so that the informer cache (if enabled)
+        is only started once per process.
+        
         Returns:
             KubernetesSecretService configured with namespace from config
         """
-        return KubernetesSecretService(namespace=self.config_manager.get_kubernetes_namespace())
+        return KubernetesSecretService(
+            namespace=self.config_manager.get_kubernetes_namespace(),
+            use_informer=self.config_manager.get_kubernetes_informer_enabled(),
+            max_workers=self.config_manager.get_kubernetes_max_workers(),
+            request_timeout=self.config_manager.get_kubernetes_request_timeout(),
+            page_size=self.config_manager.get_kubernetes_page_size(),
+            max_conflict_retries=self.config_manager.get_kubernetes_max_conflict_retries()
+        )
+    
+    @provider
+    @singleton
+    def provide_key_request_store(self) -> KeyRequestStore:
+        """
+        Provide the configured KeyRequestStore backend.
+        
+        Returns:
+            KubernetesSecretService or SqliteKeyRequestStore depending on storage.backend
+        """
+        backend = self.config_manager.get_storage_backend()
+        if backend == 'sqlite':
+            return SqliteKeyRequestStore(path=self.config_manager.get_sqlite_path())
+        if backend != 'kubernetes':
+            raise ValueError(f"Unknown storage backend '{backend}', expected 'kubernetes' or 'sqlite'")
+        return self.config_manager.injector.get(KubernetesSecretService)
+    
+    @provider
+    @singleton
+    def provide_queue_coordinator(self) -> QueueCoordinator:
+        """
+        Provide the QueueCoordinator deciding which queue work this process owns.
+        
+        Returns:
+            QueueCoordinator configured from the coordination section
+        """
+        return QueueCoordinator(
+            mode=self.config_manager.get_coordination_mode(),
+            namespace=self.config_manager.get_kubernetes_namespace(),
+            lease_name=self.config_manager.get_coordination_lease_name(),
+            lease_duration=self.config_manager.get_coordination_lease_duration(),
+            renew_interval=self.config_manager.get_coordination_renew_interval(),
+            shard_count=self.config_manager.get_coordination_shard_count()
+        )
     
     @provider
     @singleton
     def provide_approval_service(
         self,
-        k8s_service: KubernetesSecretService,
+        k8s_service: KeyRequestStore,
         email_service: EmailService,
         key_manager: KeyManagement,
         litellm_config: LiteLLMConfig
@@ -128,7 +214,10 @@ class ConfigModule(Module):
             k8s_service=k8s_service,
             email_service=email_service,
             key_manager=key_manager,
-            litellm_config=litellm_config
+            litellm_config=litellm_config,
+            lease_duration=self.config_manager.get_request_lease_duration(),
+            speculative=self.config_manager.get_speculative_evaluation(),
+            decision_cache=DecisionCache(self.config_manager.get_decision_cache_size())
         )
 
 
@@ -371,14 +460,174 @@ class ConfigManager:
             smtp_verify_ssl=os.getenv('SMTP_VERIFY_SSL', str(yaml_smtp.get('verify_ssl', True))).lower() in ('true', '1', 'yes')
         )
     
-    def get_queue_interval(self) -> str:
+    def get_queue_embedded(self) -> bool:
+        """
+        Check whether the API server runs the queue and retention processors itself.
+        
+        Disable when they run in a separate worker (python -m src.background).
+        Environment variable APPROVAL_QUEUE_EMBEDDED takes precedence over YAML value.
+        """
+        yaml_approval = self._config_data.get('approval', {})
+        return os.getenv('APPROVAL_QUEUE_EMBEDDED', str(yaml_approval.get('embedded', True))).lower() in ('true', '1', 'yes')
+    
+    def get_speculative_evaluation(self) -> bool:
+        """
+        Check whether approval plugins are started concurrently instead of one after another.
+        
+        Environment variable APPROVAL_SPECULATIVE_EVALUATION takes precedence over YAML value.
+        """
+        yaml_approval = self._config_data.get('approval', {})
+        return os.getenv('APPROVAL_SPECULATIVE_EVALUATION', str(yaml_approval.get('speculative_evaluation', False))).lower() in ('true', '1', 'yes')
+    
+    def get_batch_evaluation(self) -> bool:
+        """
+        Check whether the queue evaluates each batch of pending requests with one call per plugin.
+        
+        Environment variable APPROVAL_BATCH_EVALUATION takes precedence over YAML value.
+        """
+        yaml_approval = self._config_data.get('approval', {})
+        return os.getenv('APPROVAL_BATCH_EVALUATION', str(yaml_approval.get('batch_evaluation', False))).lower() in ('true', '1', 'yes')
+    
+    def get_decision_cache_size(self) -> int:
+        """
+        Get the maximum number of cached plugin decisions.
+        
+        Environment variable APPROVAL_DECISION_CACHE_SIZE takes precedence over YAML value.
+        """
+        yaml_approval = self._config_data.get('approval', {})
+        return int(os.getenv('APPROVAL_DECISION_CACHE_SIZE', yaml_approval.get('decision_cache_size', 1024)))
+    
+    def get_inline_fast_path(self) -> bool:
+        """
+        Check whether new requests are decided at submit time when the leading plugins are local.
+        
+        Environment variable APPROVAL_INLINE_FAST_PATH takes precedence over YAML value.
+        """
+        yaml_approval = self._config_data.get('approval', {})
+        return os.getenv('APPROVAL_INLINE_FAST_PATH', str(yaml_approval.get('inline_fast_path', True))).lower() in ('true', '1', 'yes')
+    
+    def get_queue_min_interval(self) -> str:
         """
-        Get approval queue interval with environment variable override.
+        Get the shortest approval queue resync interval, used while work keeps arriving.
         
+        Environment variable APPROVAL_QUEUE_MIN_INTERVAL takes precedence over YAML value.
         Returns interval string (e.g., '30s', '1m').
         """
         yaml_approval = self._config_data.get('approval', {})
-        return os.getenv('APPROVAL_QUEUE_INTERVAL', yaml_approval.get('queue_interval', '30s'))
+        return os.getenv('APPROVAL_QUEUE_MIN_INTERVAL', yaml_approval.get('queue_min_interval', '10s'))
+    
+    def get_queue_max_interval(self) -> str:
+        """
+        Get the longest approval queue resync interval, approached while the queue is idle.
+        
+        Environment variable APPROVAL_QUEUE_MAX_INTERVAL takes precedence over YAML value.
+        The former single interval (APPROVAL_QUEUE_INTERVAL / queue_interval) is still
+        accepted as the maximum. Returns interval string (e.g., '30s', '1m').
+        """
+        yaml_approval = self._config_data.get('approval', {})
+        legacy = os.getenv('APPROVAL_QUEUE_INTERVAL', yaml_approval.get('queue_interval', '5m'))
+        return os.getenv('APPROVAL_QUEUE_MAX_INTERVAL', yaml_approval.get('queue_max_interval', legacy))
+    
+    def get_queue_batch_size(self) -> int:
+        """
+        Get the number of pending requests whose decisions are written in one batch.
+        
+        Environment variable APPROVAL_QUEUE_BATCH_SIZE takes precedence over YAML value.
+        """
+        yaml_approval = self._config_data.get('approval', {})
+        return int(os.getenv('APPROVAL_QUEUE_BATCH_SIZE', yaml_approval.get('queue_batch_size', 50)))
+    
+    def get_queue_concurrency(self) -> int:
+        """
+        Get the maximum number of pending requests evaluated concurrently.
+        
+        Environment variable APPROVAL_QUEUE_CONCURRENCY takes precedence over YAML value.
+        """
+        yaml_approval = self._config_data.get('approval', {})
+        return int(os.getenv('APPROVAL_QUEUE_CONCURRENCY', yaml_approval.get('queue_concurrency', 8)))
+    
+    def get_queue_request_timeout(self) -> float:
+        """
+        Get the timeout in seconds for evaluating a single pending request.
+        
+        Environment variable APPROVAL_REQUEST_TIMEOUT takes precedence over YAML value.
+        """
+        yaml_approval = self._config_data.get('approval', {})
+        return float(os.getenv('APPROVAL_REQUEST_TIMEOUT', yaml_approval.get('request_timeout', 60)))
+    
+    def get_queue_drain_timeout(self) -> float:
+        """
+        Get the time in seconds shutdown waits for in-flight requests.
+        
+        Environment variable APPROVAL_QUEUE_DRAIN_TIMEOUT takes precedence over YAML value.
+        """
+        yaml_approval = self._config_data.get('approval', {})
+        return float(os.getenv('APPROVAL_QUEUE_DRAIN_TIMEOUT', yaml_approval.get('drain_timeout', 30)))
+    
+    def get_queue_lanes(self) -> list[QueueLaneConfig]:
+        """
+        Get the queue lanes, in matching order.
+        
+        Requests for models matching none of the lanes use the default lane
+        (queue_concurrency / request_timeout). Lanes without a concurrency or
+        timeout inherit those defaults.
+        """
+        yaml_lanes = self._config_data.get('approval', {}).get('lanes') or []
+        return [QueueLaneConfig(**lane) for lane in yaml_lanes]
+    
+    def get_priority_config(self) -> PriorityConfig:
+        """
+        Get the pending queue ordering and deadline configuration.
+        
+        Environment variables APPROVAL_PRIORITY_ORDER (comma-separated keys), APPROVAL_DEADLINE
+        and APPROVAL_DEADLINE_ESCALATE_TO take precedence over YAML values.
+        """
+        yaml_priority = self._config_data.get('approval', {}).get('priority') or {}
+        order = os.getenv('APPROVAL_PRIORITY_ORDER')
+        return PriorityConfig(
+            order=[key.strip() for key in order.split(',') if key.strip()] if order
+            else yaml_priority.get('order', ['age']),
+            models=yaml_priority.get('models') or {},
+            domains=yaml_priority.get('domains') or {},
+            deadline=os.getenv('APPROVAL_DEADLINE', yaml_priority.get('deadline')) or None,
+            escalate_to=os.getenv('APPROVAL_DEADLINE_ESCALATE_TO', yaml_priority.get('escalate_to', 'in-review'))
+        )
+    
+    def get_request_lease_duration(self) -> float:
+        """
+        Get the time in seconds a request stays leased while an action (key generation, notification) runs.
+        
+        Environment variable APPROVAL_LEASE_DURATION takes precedence over YAML value.
+        """
+        yaml_approval = self._config_data.get('approval', {})
+        return float(os.getenv('APPROVAL_LEASE_DURATION', yaml_approval.get('lease_duration', 120)))
+    
+    def get_queue_retry_base_delay(self) -> str:
+        """
+        Get the delay before retrying an undecided request for the first time.
+        
+        Environment variable APPROVAL_RETRY_BASE_DELAY takes precedence over YAML value.
+        """
+        yaml_retry = self._config_data.get('approval', {}).get('retry', {})
+        return os.getenv('APPROVAL_RETRY_BASE_DELAY', yaml_retry.get('base_delay', '30s'))
+    
+    def get_queue_retry_max_delay(self) -> str:
+        """
+        Get the upper bound of the retry delay.
+        
+        Environment variable APPROVAL_RETRY_MAX_DELAY takes precedence over YAML value.
+        """
+        yaml_retry = self._config_data.get('approval', {}).get('retry', {})
+        return os.getenv('APPROVAL_RETRY_MAX_DELAY', yaml_retry.get('max_delay', '6h'))
+    
+    def get_queue_retry_max_attempts(self) -> int:
+        """
+        Get the number of attempts after which an undecided request is dead-lettered (0 = unlimited).
+        
+        Environment variable APPROVAL_RETRY_MAX_ATTEMPTS takes precedence over YAML value.
+        """
+        yaml_retry = self._config_data.get('approval', {}).get('retry', {})
+        return int(os.getenv('APPROVAL_RETRY_MAX_ATTEMPTS', yaml_retry.get('max_attempts', 10)))
     
     def get_kubernetes_namespace(self) -> Optional[str]:
         """
@@ -390,6 +639,135 @@ class ConfigManager:
         namespace = os.getenv('KUBERNETES_NAMESPACE', yaml_k8s.get('namespace', ''))
         return namespace if namespace else None
     
+    def get_storage_backend(self) -> str:
+        """
+        Get the key request storage backend ('kubernetes' or 'sqlite').
+        
+        Environment variable STORAGE_BACKEND takes precedence over YAML value.
+        """
+        yaml_storage = self._config_data.get('storage', {})
+        return os.getenv('STORAGE_BACKEND', yaml_storage.get('backend', 'kubernetes')).lower()
+    
+    def get_sqlite_path(self) -> str:
+        """
+        Get the SQLite database path for the sqlite storage backend.
+        
+        Environment variable SQLITE_PATH takes precedence over YAML value.
+        Use ':memory:' for an in-process store without persistence.
+        """
+        yaml_sqlite = self._config_data.get('storage', {}).get('sqlite', {})
+        return os.getenv('SQLITE_PATH', yaml_sqlite.get('path', 'key_requests.db'))
+    
+    def get_kubernetes_informer_enabled(self) -> bool:
+        """
+        Get whether reads are served from the watch-backed informer cache.
+        
+        Environment variable KUBERNETES_INFORMER takes precedence over YAML value.
+        """
+        yaml_k8s = self._config_data.get('kubernetes', {})
+        return os.getenv('KUBERNETES_INFORMER', str(yaml_k8s.get('informer', False))).lower() in ('true', '1', 'yes')
+    
+    def get_kubernetes_max_workers(self) -> int:
+        """
+        Get the size of the thread pool running Kubernetes API calls.
+        
+        Environment variable KUBERNETES_MAX_WORKERS takes precedence over YAML value.
+        """
+        yaml_k8s = self._config_data.get('kubernetes', {})
+        return int(os.getenv('KUBERNETES_MAX_WORKERS', yaml_k8s.get('max_workers', 8)))
+    
+    def get_kubernetes_request_timeout(self) -> float:
+        """
+        Get the timeout in seconds for a single Kubernetes API call.
+        
+        Environment variable KUBERNETES_REQUEST_TIMEOUT takes precedence over YAML value.
+        """
+        yaml_k8s = self._config_data.get('kubernetes', {})
+        return float(os.getenv('KUBERNETES_REQUEST_TIMEOUT', yaml_k8s.get('request_timeout', 10)))
+    
+    def get_kubernetes_page_size(self) -> int:
+        """
+        Get the number of secrets requested per list page.
+        
+        Environment variable KUBERNETES_PAGE_SIZE takes precedence over YAML value.
+        """
+        yaml_k8s = self._config_data.get('kubernetes', {})
+        return int(os.getenv('KUBERNETES_PAGE_SIZE', yaml_k8s.get('page_size', 500)))
+    
+    def get_kubernetes_max_conflict_retries(self) -> int:
+        """
+        Get the maximum number of retries of an update after a resourceVersion conflict.
+        
+        Environment variable KUBERNETES_MAX_CONFLICT_RETRIES takes precedence over YAML value.
+        """
+        yaml_k8s = self._config_data.get('kubernetes', {})
+        return int(os.getenv('KUBERNETES_MAX_CONFLICT_RETRIES', yaml_k8s.get('max_conflict_retries', 3)))
+    
+    def get_coordination_mode(self) -> str:
+        """
+        Get how queue work is coordinated between replicas ('none', 'leader' or 'sharded').
+        
+        Environment variable QUEUE_COORDINATION_MODE takes precedence over YAML value.
+        """
+        yaml_coordination = self._config_data.get('coordination', {})
+        return os.getenv('QUEUE_COORDINATION_MODE', yaml_coordination.get('mode', 'none')).lower()
+    
+    def get_coordination_lease_name(self) -> str:
+        """
+        Get the name of the queue lease (prefix of shard and member leases).
+        
+        Environment variable QUEUE_COORDINATION_LEASE_NAME takes precedence over YAML value.
+        """
+        yaml_coordination = self._config_data.get('coordination', {})
+        return os.getenv('QUEUE_COORDINATION_LEASE_NAME', yaml_coordination.get('lease_name', 'llm-key-requestor-queue'))
+    
+    def get_coordination_lease_duration(self) -> float:
+        """
+        Get the number of seconds a queue lease stays valid without renewal.
+        
+        Environment variable QUEUE_COORDINATION_LEASE_DURATION takes precedence over YAML value.
+        """
+        yaml_coordination = self._config_data.get('coordination', {})
+        return float(os.getenv('QUEUE_COORDINATION_LEASE_DURATION', yaml_coordination.get('lease_duration', 15)))
+    
+    def get_coordination_renew_interval(self) -> float:
+        """
+        Get the number of seconds between lease acquire/renew rounds.
+        
+        Environment variable QUEUE_COORDINATION_RENEW_INTERVAL takes precedence over YAML value.
+        """
+        yaml_coordination = self._config_data.get('coordination', {})
+        return float(os.getenv('QUEUE_COORDINATION_RENEW_INTERVAL', yaml_coordination.get('renew_interval', 5)))
+    
+    def get_coordination_shard_count(self) -> int:
+        """
+        Get the number of request_id shards in sharded mode.
+        
+        Environment variable QUEUE_COORDINATION_SHARDS takes precedence over YAML value.
+        """
+        yaml_coordination = self._config_data.get('coordination', {})
+        return int(os.getenv('QUEUE_COORDINATION_SHARDS', yaml_coordination.get('shards', 8)))
+    
+    def get_retention_config(self) -> RetentionConfig:
+        """
+        Get retention configuration with environment variable overrides.
+        
+        Environment variables take precedence over YAML values.
+        """
+        yaml_retention = self._config_data.get('retention', {})
+        action = os.getenv('RETENTION_ACTION', yaml_retention.get('action', 'archive')).lower()
+        if action not in ('archive', 'delete'):
+            raise ValueError(f"Unknown retention action '{action}', expected 'archive' or 'delete'")
+        
+        return RetentionConfig(
+            enabled=os.getenv('RETENTION_ENABLED', str(yaml_retention.get('enabled', False))).lower() in ('true', '1', 'yes'),
+            interval=os.getenv('RETENTION_INTERVAL', yaml_retention.get('interval', '1h')),
+            action=action,
+            batch_size=int(os.getenv('RETENTION_BATCH_SIZE', yaml_retention.get('batch_size', 100))),
+            approved=RetentionPolicy(**(yaml_retention.get('approved') or {})),
+            denied=RetentionPolicy(**(yaml_retention.get('denied') or {}))
+        )
+    
     def get_approval_plugins(self) -> list[ApprovalPlugin]:
         """
         Get list of configured approval plugins using dynamic loading.
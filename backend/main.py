@@ -4,60 +4,39 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 from pydantic import BaseModel
-from typing import Optional, List
-import logging
-import inspect
+from typing import Dict, Optional, List
 import secrets
 from loguru import logger
 from config import config_manager, LLMModel, FeaturedModel
-from src.services.kubernetes_secret_service import KubernetesSecretService
-from src.services.approval_service import ApprovalService
+from src.services.key_request_store import KeyRequestStore, RequestConflictError
+from src.services.approval_service import ApprovalService, RequestActionError, RequestNotFoundError
 from src.services.email_service import EmailService
 from src.litellm.manager import KeyManagement
 from src.background.queue_processor import QueueProcessor
+from src.background.retention_processor import RetentionProcessor
+from src.background.leader_election import QueueCoordinator
 from src.models.key_request import KeyRequestState
 from src.mcp import create_mcp_server
+from src.logging_config import setup_logging
 
 
-# Intercept standard logging and redirect to loguru
-class InterceptHandler(logging.Handler):
-    """
-    Handler to intercept standard logging and redirect to loguru.
-    This ensures all logs from libraries using standard logging (like FastMCP, uvicorn)
-    are formatted consistently with loguru.
-    """
-    def emit(self, record: logging.LogRecord) -> None:
-        # Get corresponding Loguru level if it exists
-        level: str | int
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
-
-        # Find caller from where originated the logged message
-        frame, depth = inspect.currentframe(), 0
-        while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
-            frame = frame.f_back
-            depth += 1
-
-        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
-
-
-# Configure logging to intercept standard library logging
-logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
-
-# Intercept specific loggers that might be used by dependencies
-for logger_name in ["uvicorn", "uvicorn.access", "uvicorn.error", "fastapi", "mcp"]:
-    logging_logger = logging.getLogger(logger_name)
-    logging_logger.handlers = [InterceptHandler()]
-    logging_logger.propagate = False
+# Route standard logging (uvicorn, FastMCP, ...) through loguru
+setup_logging()
 
 # Initialize services using dependency injection
-k8s_service = config_manager.injector.get(KubernetesSecretService)
+k8s_service = config_manager.injector.get(KeyRequestStore)
 approval_service = config_manager.injector.get(ApprovalService)
 email_service = config_manager.injector.get(EmailService)
 key_manager = config_manager.injector.get(KeyManagement)
-queue_processor = config_manager.injector.get(QueueProcessor)
+
+# Background processing runs here unless it is deployed as a separate worker
+if config_manager.get_queue_embedded():
+    queue_coordinator = config_manager.injector.get(QueueCoordinator)
+    queue_processor = config_manager.injector.get(QueueProcessor)
+    retention_processor = config_manager.injector.get(RetentionProcessor)
+else:
+    logger.info("Embedded queue processor disabled, expecting a separate worker (python -m src.background)")
+    queue_coordinator = queue_processor = retention_processor = None
 
 # Configure MCP server (before FastAPI app creation)
 logger.info("Creating MCP server, will mount at /mcp")
@@ -85,14 +64,25 @@ async def lifespan(app: FastAPI):
     
     # Start the MCP app's lifespan context
     async with mcp_app.lifespan(mcp_app):
-        queue_processor.start()
+        await k8s_service.start()
+        await approval_service.start()
+        if queue_processor:
+            queue_coordinator.start()
+            queue_processor.start()
+            if config_manager.get_retention_config().enabled:
+                retention_processor.start()
         logger.info("Application started successfully")
         
         yield  # Application runs here
         
         logger.info("Shutting down application...")
         # Shutdown logic
-        await queue_processor.stop()
+        if queue_processor:
+            await retention_processor.stop()
+            await queue_processor.stop()
+            await queue_coordinator.stop()
+        await approval_service.stop()
+        await k8s_service.stop()
         logger.info("Application shutdown complete")
 
 
@@ -129,6 +119,7 @@ class KeyResponse(BaseModel):
     message: str
     success: bool
     request_id: Optional[str] = None
+    state: Optional[str] = None
 
 
 class ModelsResponse(BaseModel):
@@ -175,7 +166,7 @@ async def request_key(request: KeyRequest):
     Handle key request submission.
     
     Process:
-    1. Check if a key request already exists for this user's email
+    1. Check if a key request already exists for this user's email and model
     2. If exists, return current approval state
     3. If not exists, create new pending request
     4. Return appropriate response based on outcome
@@ -183,10 +174,10 @@ async def request_key(request: KeyRequest):
     logger.info(f"Received key request for {request.llm} from {request.email}")
     
     try:
-        # Check if request already exists for this email
-        existing_request = await k8s_service.find_by_email(request.email)
+        # Check if request already exists for this email and model
+        existing_request = await k8s_service.find_by_email_and_model(request.email, request.llm)
         
-        if existing_request and existing_request.model == request.llm:
+        if existing_request:
             # Request already exists, return current state
             logger.info(f"Found existing request for {request.email} with state {existing_request.state.value} and llm {existing_request.model}")
             
@@ -196,23 +187,45 @@ async def request_key(request: KeyRequest):
                 message = f"Your key request for {request.llm} has been approved. Check your email for the API key."
             elif existing_request.state == KeyRequestState.DENIED:
                 message = f"Your key request for {request.llm} was denied. Please contact support for more information."
+            elif existing_request.state == KeyRequestState.DEAD_LETTER:
+                message = f"Your key request for {request.llm} could not be processed automatically and is waiting for an administrator."
             else:
                 message = f"Your key request for {request.llm} is being processed."
             
             return KeyResponse(
                 message=message,
                 success=True,
-                request_id=existing_request.request_id
+                request_id=existing_request.request_id,
+                state=existing_request.state.value
             )
         
         # No existing request, create new one
         new_request = await k8s_service.create(email=request.email, model=request.llm)
         logger.info(f"Created new key request for {request.email}, request_id: {new_request.request_id}")
         
+        # Settle it right away if the local plugins can decide
+        if config_manager.get_inline_fast_path():
+            decision = await approval_service.submit_inline(new_request)
+            if decision is not None and decision.state == KeyRequestState.APPROVED:
+                return KeyResponse(
+                    message=f"Your key request for {request.llm} has been approved. You will receive the API key via email shortly.",
+                    success=True,
+                    request_id=new_request.request_id,
+                    state=decision.state.value
+                )
+            if decision is not None and decision.state == KeyRequestState.DENIED:
+                return KeyResponse(
+                    message=f"Your key request for {request.llm} was denied. Please contact support for more information.",
+                    success=True,
+                    request_id=new_request.request_id,
+                    state=decision.state.value
+                )
+        
         return KeyResponse(
             message=f"Key request for {request.llm} has been created successfully. You will be notified via email once your request is processed.",
             success=True,
-            request_id=new_request.request_id
+            request_id=new_request.request_id,
+            state=new_request.state.value
         )
         
     except Exception as e:
@@ -275,6 +288,43 @@ class AdminActionResponse(BaseModel):
     message: str
 
 
+class QueueLaneStatus(BaseModel):
+    name: str
+    models: List[str]
+    concurrency: int
+    request_timeout: float
+    queued: int
+    in_flight: int
+
+
+class QueueStatusResponse(BaseModel):
+    running: bool
+    active: bool
+    interval_seconds: float
+    min_interval_seconds: float
+    max_interval_seconds: float
+    next_resync_in_seconds: Optional[float] = None
+    last_scan_at: Optional[str] = None
+    last_processed: int
+    in_flight: int
+    scheduled_retries: int
+    lanes: List[QueueLaneStatus]
+
+
+class PluginCacheStats(BaseModel):
+    hits: int
+    misses: int
+
+
+class DecisionCacheStatsResponse(BaseModel):
+    size: int
+    max_entries: int
+    hits: int
+    misses: int
+    evictions: int
+    plugins: Dict[str, PluginCacheStats]
+
+
 @app.post("/api/admin/verify")
 async def admin_verify(username: str = Depends(verify_admin_credentials)):
     """Verify admin credentials."""
@@ -292,17 +342,19 @@ async def get_admin_requests(
     Filter options:
     - pending: Only pending requests
     - review: Only in-review requests
+    - dead-letter: Only requests that stayed undecided after all retries
     - all: All requests
     """
     try:
-        all_requests = await k8s_service.list_all()
-        
+        # Listings only need metadata; API keys are loaded on the detail view
         if filter == "pending":
-            filtered = [r for r in all_requests if r.state == KeyRequestState.PENDING]
+            summaries = await k8s_service.list_summaries(KeyRequestState.PENDING)
         elif filter == "review":
-            filtered = [r for r in all_requests if r.state == KeyRequestState.REVIEW]
+            summaries = await k8s_service.list_summaries(KeyRequestState.REVIEW)
+        elif filter == "dead-letter":
+            summaries = await k8s_service.list_summaries(KeyRequestState.DEAD_LETTER)
         else:
-            filtered = all_requests
+            summaries = await k8s_service.list_summaries()
         
         return [
             KeyRequestResponse(
@@ -312,15 +364,89 @@ async def get_admin_requests(
                 state=r.state.value,
                 created_at=r.created_at.isoformat(),
                 updated_at=r.updated_at.isoformat(),
-                api_key=r.api_key if r.state == KeyRequestState.APPROVED else None
+                api_key=None
             )
-            for r in filtered
+            for r in summaries
         ]
     except Exception as e:
         logger.error(f"Error fetching admin requests: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to fetch requests")
 
 
+@app.get("/api/admin/archive", response_model=List[KeyRequestResponse])
+async def get_admin_archive(
+    email: Optional[str] = None,
+    state: Optional[str] = None,
+    limit: int = 100,
+    username: str = Depends(verify_admin_credentials)
+):
+    """
+    Query archived key requests.
+    
+    Archived requests never include API keys.
+    
+    Filter options:
+    - email: Only requests for this email address
+    - state: Only requests in this state (approved, denied)
+    - limit: Maximum number of results
+    """
+    try:
+        results = []
+        async for r in k8s_service.iter_archive():
+            if email is not None and r.email != email:
+                continue
+            if state is not None and r.state.value != state:
+                continue
+            results.append(
+                KeyRequestResponse(
+                    request_id=r.request_id,
+                    email=r.email,
+                    model=r.model,
+                    state=r.state.value,
+                    created_at=r.created_at.isoformat(),
+                    updated_at=r.updated_at.isoformat(),
+                    api_key=None
+                )
+            )
+            if len(results) >= limit:
+                break
+        
+        return results
+    except Exception as e:
+        logger.error(f"Error fetching archived requests: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch archived requests")
+
+
+@app.get("/api/admin/queue/status", response_model=QueueStatusResponse)
+async def get_queue_status(username: str = Depends(verify_admin_credentials)):
+    """Report the queue processor's current cadence and outstanding work."""
+    if queue_processor is None:
+        raise HTTPException(status_code=404, detail="Queue processor runs in a separate worker")
+    status_data = queue_processor.status()
+    last_scan_at = status_data.pop('last_scan_at')
+    return QueueStatusResponse(
+        **status_data,
+        last_scan_at=last_scan_at.isoformat() if last_scan_at else None
+    )
+
+
+@app.get("/api/admin/decision-cache", response_model=DecisionCacheStatsResponse)
+async def get_decision_cache_stats(username: str = Depends(verify_admin_credentials)):
+    """Report size and hit/miss counters of this process's plugin decision cache."""
+    return DecisionCacheStatsResponse(**approval_service.decision_cache.stats())
+
+
+@app.delete("/api/admin/decision-cache", response_model=AdminActionResponse)
+async def invalidate_decision_cache(
+    plugin: Optional[str] = None,
+    username: str = Depends(verify_admin_credentials)
+):
+    """Drop cached plugin decisions, optionally only those of one plugin ("<index>:<class name>")."""
+    dropped = approval_service.invalidate_decision_cache(plugin)
+    logger.info(f"Admin {username} invalidated the decision cache")
+    return AdminActionResponse(success=True, message=f"Dropped {dropped} cached decision(s)")
+
+
 @app.get("/api/admin/requests/{request_id}", response_model=KeyRequestResponse)
 async def get_admin_request_details(
     request_id: str,
@@ -372,7 +498,15 @@ async def approve_request(
         )
         
         # Process the approval (generate key, send email, update state)
-        await approval_service.take_action(approval_response, request)
+        try:
+            await approval_service.take_action(approval_response, request)
+        except RequestConflictError as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        except RequestNotFoundError:
+            raise HTTPException(status_code=404, detail="Request not found")
+        except RequestActionError as e:
+            logger.error(f"Failed to approve request {request_id}: {e}")
+            raise HTTPException(status_code=500, detail="Failed to approve request")
         
         logger.info(f"Request {request_id} approved by admin {username}")
         
@@ -411,7 +545,15 @@ async def deny_request(
         )
         
         # Process the denial (send email, update state)
-        await approval_service.take_action(approval_response, request)
+        try:
+            await approval_service.take_action(approval_response, request)
+        except RequestConflictError as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        except RequestNotFoundError:
+            raise HTTPException(status_code=404, detail="Request not found")
+        except RequestActionError as e:
+            logger.error(f"Failed to deny request {request_id}: {e}")
+            raise HTTPException(status_code=500, detail="Failed to deny request")
         
         logger.info(f"Request {request_id} denied by admin {username}")
         
@@ -426,6 +568,51 @@ async def deny_request(
         raise HTTPException(status_code=500, detail="Failed to deny request")
 
 
+@app.post("/api/admin/requests/{request_id}/requeue", response_model=AdminActionResponse)
+async def requeue_request(
+    request_id: str,
+    username: str = Depends(verify_admin_credentials)
+):
+    """Move a dead-lettered key request back to pending with a fresh retry schedule."""
+    try:
+        logger.info(f"Admin {username} re-queueing request {request_id}")
+        
+        request = await k8s_service.get(request_id)
+        if not request:
+            raise HTTPException(status_code=404, detail="Request not found")
+        if request.state != KeyRequestState.DEAD_LETTER:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Only {KeyRequestState.DEAD_LETTER.value} requests can be re-queued, request is {request.state.value}"
+            )
+        
+        try:
+            await k8s_service.update(
+                request_id,
+                resource_version=request.resource_version,
+                expected_state=KeyRequestState.DEAD_LETTER,
+                state=KeyRequestState.PENDING,
+                attempts=0,
+                next_attempt_at=None
+            )
+        except RequestConflictError as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        except KeyError:
+            raise HTTPException(status_code=404, detail="Request not found")
+        
+        logger.info(f"Request {request_id} re-queued by admin {username}")
+        
+        return AdminActionResponse(
+            success=True,
+            message=f"Request {request_id} re-queued successfully"
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error re-queueing request {request_id}: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to re-queue request")
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,22 @@
+"""Entry point of the standalone queue worker: python -m src.background"""
+import argparse
+import asyncio
+from src.background.worker import run_worker
+from src.logging_config import setup_logging
+
+
+def main() -> None:
+    """Parse arguments and run the worker."""
+    parser = argparse.ArgumentParser(prog="python -m src.background", description="Run the LLM key request queue worker")
+    parser.add_argument(
+        '--no-retention',
+        action='store_true',
+        help="Do not run the retention processor in this worker"
+    )
+    args = parser.parse_args()
+    setup_logging()
+    asyncio.run(run_worker(retention=not args.no_retention))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,427 @@
+"""Lease-based coordination of queue work between replicas."""
+import asyncio
+import functools
+import hashlib
+import math
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from loguru import logger
+from kubernetes import client, config
+from kubernetes.client import V1Lease, V1LeaseSpec, V1ObjectMeta, ApiException
+
+# Coordination modes
+MODE_NONE = 'none'
+MODE_LEADER = 'leader'
+MODE_SHARDED = 'sharded'
+
+# Labels on the leases created by the coordinator
+COMPONENT_LABEL = 'app.kubernetes.io/component'
+LEASE_GROUP_LABEL = 'llm-key-requestor/lease-group'
+
+# Member leases expired for this many lease durations are garbage collected
+MEMBER_GC_FACTOR = 10
+
+
+def shard_for(request_id: str, shard_count: int) -> int:
+    """
+    Map a request ID to its shard.
+
+    Shards are contiguous ranges of the 32-bit hash space, so every
+    request belongs to exactly one shard.
+
+    Args:
+        request_id: Request identifier
+        shard_count: Total number of shards
+
+    Returns:
+        Shard index in [0, shard_count)
+    """
+    digest = int(hashlib.sha256(request_id.encode('utf-8')).hexdigest()[:8], 16)
+    return (digest * shard_count) >> 32
+
+
+class QueueCoordinator:
+    """
+    Decides which queue work this process owns.
+
+    Modes:
+    - none: every process owns all requests (single replica)
+    - leader: one Lease; only its holder processes the queue
+    - sharded: one Lease per shard of the request_id hash space; live
+      replicas (tracked by per-replica member leases) split the shards
+      evenly, and shards of replicas that stop renewing are taken over
+      once their lease expires
+
+    Leases are acquired and renewed with compare-and-swap on their
+    resourceVersion. Ownership is dropped locally as soon as a lease could
+    not be renewed within its duration, before another replica can take it.
+    Like client-go, other holders' leases are timed with the local
+    monotonic clock only, so clock skew between nodes does not matter.
+    """
+
+    def __init__(
+        self,
+        mode: str = MODE_NONE,
+        namespace: Optional[str] = None,
+        lease_name: str = 'llm-key-requestor-queue',
+        lease_duration: float = 15.0,
+        renew_interval: float = 5.0,
+        shard_count: int = 8,
+        identity: Optional[str] = None,
+        request_timeout: Optional[float] = None
+    ):
+        """
+        Initialize the coordinator.
+
+        Args:
+            mode: 'none', 'leader' or 'sharded'
+            namespace: Namespace for the leases. If None, uses current namespace.
+            lease_name: Name of the leader lease, and prefix of shard/member leases
+            lease_duration: Seconds a lease stays valid without renewal
+            renew_interval: Seconds between acquire/renew rounds
+            shard_count: Number of shards in sharded mode
+            identity: Holder identity, defaults to hostname, PID and a random suffix
+            request_timeout: Timeout in seconds for a single Lease API call.
+                Defaults to half the time between a renewal and the lease
+                lapsing, so a renewal (read and replace) ends before it lapses.
+        """
+        if mode not in (MODE_NONE, MODE_LEADER, MODE_SHARDED):
+            raise ValueError(f"Unknown coordination mode '{mode}', expected 'none', 'leader' or 'sharded'")
+
+        self.mode = mode
+        self.lease_name = lease_name
+        self.lease_duration = lease_duration
+        self.renew_interval = renew_interval
+        self.request_timeout = request_timeout or max(1.0, (lease_duration - renew_interval) / 2)
+        self.shard_count = shard_count if mode == MODE_SHARDED else 1
+        self.identity = identity or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.namespace = namespace
+        self.coordination_v1: Optional[client.CoordinationV1Api] = None
+        # Lease calls of a round are sequential; timed out calls may hold a worker until their HTTP timeout
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="k8s-lease")
+
+        # Lease name -> monotonic time taken just before the last successful
+        # acquire/renew call; never later than the renewTime written to the
+        # server, so local ownership expires no later than the server lease
+        self._held: dict[str, float] = {}
+        # Lease name -> (holder identity, renewTime) last seen and the
+        # monotonic time it was first seen; the lease expires once that
+        # record has not changed for its duration
+        self._observed: dict[str, tuple[tuple[str, datetime], float]] = {}
+        self._listeners: list[Callable[[], None]] = []
+        self.running = False
+        self.task: Optional[asyncio.Task] = None
+
+        if mode != MODE_NONE:
+            self._connect()
+
+        logger.info(f"QueueCoordinator initialized in '{mode}' mode with identity {self.identity}")
+
+    def _connect(self) -> None:
+        """Load Kubernetes configuration and resolve the namespace."""
+        try:
+            config.load_incluster_config()
+        except config.ConfigException:
+            config.load_kube_config()
+        self.coordination_v1 = client.CoordinationV1Api()
+
+        if not self.namespace:
+            try:
+                with open('/var/run/secrets/kubernetes.io/serviceaccount/namespace', 'r') as f:
+                    self.namespace = f.read().strip()
+            except FileNotFoundError:
+                self.namespace = 'default'
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callback invoked when this process gains ownership of work."""
+        self._listeners.append(listener)
+
+    def _shard_lease_name(self, shard: int) -> str:
+        """Name of the lease guarding a shard."""
+        if self.mode == MODE_LEADER:
+            return self.lease_name
+        return f"{self.lease_name}-shard-{shard}"
+
+    def _member_lease_name(self) -> str:
+        """Name of this replica's membership lease."""
+        digest = hashlib.sha256(self.identity.encode('utf-8')).hexdigest()[:16]
+        return f"{self.lease_name}-member-{digest}"
+
+    def _is_valid(self, lease_name: str) -> bool:
+        """Check whether a held lease was renewed recently enough to act on it."""
+        renewed = self._held.get(lease_name)
+        return renewed is not None and time.monotonic() - renewed < self.lease_duration
+
+    def owned_shards(self) -> set[int]:
+        """Shards this process currently owns."""
+        if self.mode == MODE_NONE:
+            return set(range(self.shard_count))
+        return {shard for shard in range(self.shard_count) if self._is_valid(self._shard_lease_name(shard))}
+
+    @property
+    def is_active(self) -> bool:
+        """True if this process owns any queue work."""
+        return bool(self.owned_shards())
+
+    @property
+    def is_leader(self) -> bool:
+        """
+        True if this process owns the first shard.
+
+        Used for singleton work that cannot be split by request, such as
+        retention. Always true in 'none' mode.
+        """
+        return 0 in self.owned_shards()
+
+    def owns(self, request_id: str) -> bool:
+        """
+        Check whether this process should process a request.
+
+        Args:
+            request_id: Request identifier
+
+        Returns:
+            True if the request's shard is owned by this process
+        """
+        if self.mode == MODE_NONE:
+            return True
+        return self._is_valid(self._shard_lease_name(shard_for(request_id, self.shard_count)))
+
+    async def _call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking Lease API call on the coordinator's thread pool.
+
+        The call is bounded by request_timeout both on the HTTP request itself
+        (so the worker thread is released) and on the awaiting coroutine.
+
+        Raises:
+            asyncio.TimeoutError: If the call does not complete within request_timeout
+        """
+        kwargs.setdefault('_request_timeout', self.request_timeout)
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+        return await asyncio.wait_for(future, timeout=self.request_timeout)
+
+    # Lease primitives
+
+    def _lease_expired(self, lease: V1Lease) -> bool:
+        """
+        Check whether a lease's holder stopped renewing it.
+
+        The remote renewTime is never compared with the local clock: the
+        lease counts as expired once its holder and renewTime have not
+        changed for its duration since this process first observed them.
+        A lease seen for the first time is therefore never expired.
+        """
+        name = lease.metadata.name
+        spec = lease.spec
+        if not spec or not spec.holder_identity or not spec.renew_time:
+            self._observed.pop(name, None)
+            return True
+
+        now = time.monotonic()
+        record = (spec.holder_identity, spec.renew_time)
+        observed = self._observed.get(name)
+        if observed is None or observed[0] != record:
+            self._observed[name] = (record, now)
+            return False
+        duration = spec.lease_duration_seconds or self.lease_duration
+        return now - observed[1] >= duration
+
+    def _unchanged_for(self, name: str) -> float:
+        """Seconds since a lease's holder or renewTime was last seen to change."""
+        observed = self._observed.get(name)
+        return time.monotonic() - observed[1] if observed else math.inf
+
+    async def _try_acquire_or_renew(self, name: str, labels: dict[str, str]) -> bool:
+        """
+        Acquire a lease if it is free or expired, or renew it if held.
+
+        Returns:
+            True if this process holds the lease afterwards
+        """
+        now = datetime.now(timezone.utc)
+        try:
+            lease = await self._call(self.coordination_v1.read_namespaced_lease, name, self.namespace)
+        except ApiException as e:
+            if e.status != 404:
+                raise
+            lease = V1Lease(
+                metadata=V1ObjectMeta(name=name, namespace=self.namespace, labels=labels),
+                spec=V1LeaseSpec(
+                    holder_identity=self.identity,
+                    lease_duration_seconds=math.ceil(self.lease_duration),
+                    acquire_time=now,
+                    renew_time=now,
+                    lease_transitions=0
+                )
+            )
+            try:
+                await self._call(self.coordination_v1.create_namespaced_lease, self.namespace, lease)
+                return True
+            except ApiException as e:
+                if e.status == 409:
+                    return False
+                raise
+
+        spec = lease.spec or V1LeaseSpec()
+        if spec.holder_identity != self.identity:
+            if not self._lease_expired(lease):
+                return False
+            spec.acquire_time = now
+            spec.lease_transitions = (spec.lease_transitions or 0) + 1
+            logger.info(f"Taking over lease {name} from {spec.holder_identity or 'nobody'}")
+
+        spec.holder_identity = self.identity
+        spec.lease_duration_seconds = math.ceil(self.lease_duration)
+        spec.renew_time = now
+        lease.spec = spec
+
+        # replace carries metadata.resourceVersion, so a concurrent writer wins
+        try:
+            await self._call(self.coordination_v1.replace_namespaced_lease, name, self.namespace, lease)
+            return True
+        except ApiException as e:
+            if e.status == 409:
+                return False
+            raise
+
+    async def _release(self, name: str) -> None:
+        """Give up a lease held by this process so others can take it immediately."""
+        try:
+            lease = await self._call(self.coordination_v1.read_namespaced_lease, name, self.namespace)
+            if lease.spec and lease.spec.holder_identity == self.identity:
+                lease.spec.holder_identity = None
+                lease.spec.renew_time = None
+                await self._call(self.coordination_v1.replace_namespaced_lease, name, self.namespace, lease)
+        except ApiException as e:
+            if e.status not in (404, 409):
+                logger.warning(f"Failed to release lease {name}: {e}")
+        except asyncio.TimeoutError:
+            logger.warning(f"Timed out releasing lease {name}")
+
+    async def _live_member_count(self) -> int:
+        """Count replicas with an unexpired member lease, removing long-dead ones."""
+        leases = (await self._call(
+            self.coordination_v1.list_namespaced_lease,
+            self.namespace,
+            label_selector=f'{COMPONENT_LABEL}=queue-member,{LEASE_GROUP_LABEL}={self.lease_name}'
+        )).items
+
+        live = 0
+        for lease in leases:
+            if not self._lease_expired(lease):
+                live += 1
+                continue
+            name = lease.metadata.name
+            if self._unchanged_for(name) > self.lease_duration * MEMBER_GC_FACTOR:
+                try:
+                    await self._call(self.coordination_v1.delete_namespaced_lease, name, self.namespace)
+                    self._observed.pop(name, None)
+                except (ApiException, asyncio.TimeoutError):
+                    pass
+        return max(live, 1)
+
+    async def _sync(self) -> bool:
+        """
+        Run one acquire/renew round.
+
+        Returns:
+            True if ownership was gained during this round
+        """
+        gained = False
+        labels = {COMPONENT_LABEL: 'queue-lease', LEASE_GROUP_LABEL: self.lease_name}
+
+        target = self.shard_count
+        if self.mode == MODE_SHARDED:
+            member_labels = {COMPONENT_LABEL: 'queue-member', LEASE_GROUP_LABEL: self.lease_name}
+            try:
+                await self._try_acquire_or_renew(self._member_lease_name(), member_labels)
+                target = math.ceil(self.shard_count / await self._live_member_count())
+            except (ApiException, asyncio.TimeoutError) as e:
+                # Still renew the shards we hold, but neither rebalance nor grow this round
+                logger.warning(f"Failed to renew member lease: {str(e) or type(e).__name__}")
+                target = len(self._held)
+
+        # Renew what we hold first, then release surplus shards for rebalancing
+        held = [name for name in self._held]
+        for name in held:
+            started = time.monotonic()
+            try:
+                renewed = await self._try_acquire_or_renew(name, labels)
+            except (ApiException, asyncio.TimeoutError) as e:
+                logger.warning(f"Failed to renew lease {name}: {str(e) or type(e).__name__}")
+                continue
+            if renewed:
+                self._held[name] = started
+            else:
+                logger.warning(f"Lost lease {name}")
+                self._held.pop(name, None)
+
+        while len(self._held) > target:
+            name = sorted(self._held)[-1]
+            self._held.pop(name)
+            await self._release(name)
+            logger.info(f"Released lease {name} to rebalance shards")
+
+        # Try to take free or expired shards up to the fair share
+        for shard in range(self.shard_count):
+            if len(self._held) >= target:
+                break
+            name = self._shard_lease_name(shard)
+            if name in self._held:
+                continue
+            started = time.monotonic()
+            try:
+                if await self._try_acquire_or_renew(name, labels):
+                    self._held[name] = started
+                    gained = True
+                    logger.info(f"Acquired lease {name}")
+            except (ApiException, asyncio.TimeoutError) as e:
+                logger.warning(f"Failed to acquire lease {name}: {str(e) or type(e).__name__}")
+        return gained
+
+    async def run(self) -> None:
+        """Acquire/renew loop."""
+        while self.running:
+            try:
+                if await self._sync():
+                    for listener in self._listeners:
+                        listener()
+            except Exception as e:
+                logger.error(f"Error in lease coordination round: {e}", exc_info=True)
+            await asyncio.sleep(self.renew_interval)
+
+    def start(self) -> None:
+        """Start the coordination loop. No-op in 'none' mode."""
+        if self.mode == MODE_NONE or self.running:
+            return
+        self.running = True
+        self.task = asyncio.create_task(self.run())
+        logger.info(f"Queue coordination started ({self.mode}, {self.shard_count} shard(s))")
+
+    async def stop(self) -> None:
+        """Stop the coordination loop and release held leases for fast failover."""
+        if not self.running:
+            return
+        self.running = False
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+
+        held = list(self._held)
+        if self.mode == MODE_SHARDED:
+            held.append(self._member_lease_name())
+        self._held.clear()
+        for name in held:
+            await self._release(name)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("Queue coordination stopped")
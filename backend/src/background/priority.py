@@ -0,0 +1,103 @@
+"""Ordering and deadlines of pending queue work."""
+import fnmatch
+from datetime import datetime, timedelta
+from typing import Optional
+from src.models.key_request import KeyRequestState, KeyRequestSummary
+
+# Supported ordering keys
+ORDER_KEYS = ('model', 'domain', 'age')
+
+# States a request may be escalated to when its deadline passes
+ESCALATION_STATES = (KeyRequestState.REVIEW, KeyRequestState.DENIED)
+
+
+def _tier(value: str, tiers: dict[str, int]) -> int:
+    """Rank of the first matching pattern; unmatched values rank after all tiers."""
+    for pattern, rank in tiers.items():
+        if fnmatch.fnmatchcase(value, pattern):
+            return rank
+    return max(tiers.values(), default=0) + 1
+
+
+class PriorityPolicy:
+    """
+    Decides the order in which pending requests are processed.
+
+    Requests are sorted by the configured keys, in order:
+    - model: tier of the first matching model pattern (lower first)
+    - domain: tier of the first matching requester email domain (lower first)
+    - age: oldest request first
+
+    Age is always the final tie-breaker. With a deadline, requests pending
+    for longer are escalated instead of being evaluated again.
+    """
+
+    def __init__(
+        self,
+        order: list[str],
+        model_tiers: Optional[dict[str, int]] = None,
+        domain_tiers: Optional[dict[str, int]] = None,
+        deadline: Optional[float] = None,
+        escalate_to: KeyRequestState = KeyRequestState.REVIEW
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            order: Ordering keys, see ORDER_KEYS
+            model_tiers: Model pattern -> tier
+            domain_tiers: Email domain pattern -> tier
+            deadline: Seconds a request may stay pending, None for no deadline
+            escalate_to: State expired requests are moved to
+        """
+        unknown = [key for key in order if key not in ORDER_KEYS]
+        if unknown:
+            raise ValueError(f"Unknown priority key(s) {unknown}, expected any of {list(ORDER_KEYS)}")
+        if deadline is not None and deadline <= 0:
+            raise ValueError(f"Deadline must be a positive number of seconds, got {deadline}")
+        if escalate_to not in ESCALATION_STATES:
+            raise ValueError(
+                f"Cannot escalate to '{escalate_to.value}', expected any of {[s.value for s in ESCALATION_STATES]}"
+            )
+
+        self.order = list(order)
+        self.model_tiers = model_tiers or {}
+        self.domain_tiers = domain_tiers or {}
+        self.deadline = deadline
+        self.escalate_to = escalate_to
+
+    def key(self, summary: KeyRequestSummary) -> tuple:
+        """
+        Sort key of a pending request.
+
+        Args:
+            summary: Pending request
+
+        Returns:
+            Tuple sorting more urgent requests first
+        """
+        parts = []
+        for name in self.order:
+            if name == 'model':
+                parts.append(_tier(summary.model, self.model_tiers))
+            elif name == 'domain':
+                parts.append(_tier(summary.email.rsplit('@', 1)[-1].lower(), self.domain_tiers))
+            else:
+                parts.append(summary.created_at)
+        parts.append(summary.created_at)
+        return tuple(parts)
+
+    def sort(self, summaries: list[KeyRequestSummary]) -> list[KeyRequestSummary]:
+        """Return pending requests in processing order."""
+        return sorted(summaries, key=self.key)
+
+    def deadline_for(self, summary: KeyRequestSummary) -> Optional[datetime]:
+        """Time by which a request has to be decided, or None."""
+        if self.deadline is None:
+            return None
+        return summary.created_at + timedelta(seconds=self.deadline)
+
+    def is_expired(self, summary: KeyRequestSummary, now: Optional[datetime] = None) -> bool:
+        """Check whether a pending request missed its deadline."""
+        deadline = self.deadline_for(summary)
+        return deadline is not None and deadline <= (now or datetime.utcnow())
@@ -1,120 +1,756 @@
 """Background queue processor for handling pending key requests."""
 import asyncio
+import fnmatch
+import heapq
+import random
 import re
+import time
+from datetime import datetime, timedelta
 from typing import Optional
 from loguru import logger
 from injector import inject
-from config import config_manager
-from src.services.kubernetes_secret_service import KubernetesSecretService
+from config import config_manager, QueueLaneConfig
+from src.services.key_request_store import KeyRequestStore, lease_active
 from src.services.approval_service import ApprovalService
-from src.models.key_request import KeyRequestState, KeyRequestData
+from src.background.leader_election import QueueCoordinator
+from src.background.priority import PriorityPolicy
+from src.models.key_request import (
+    ApprovalResponse,
+    KeyRequestState,
+    KeyRequestData,
+    KeyRequestSummary,
+    KeyRequestUpdate,
+    WriteResult,
+)
+
+# Share of the approval lease duration the state updates of a batch may take at most
+ACTION_LEASE_FRACTION = 0.5
+
+
+def parse_interval(interval_str: str, default: Optional[int] = 30) -> int:
+    """
+    Parse interval string to seconds.
+    
+    Supports formats: "30s", "1m", "5m", "2h", "7d", etc.
+    
+    Args:
+        interval_str: Interval string (e.g., "30s", "1m")
+        default: Value returned for malformed input, None to reject it
+        
+    Returns:
+        Interval in seconds
+        
+    Raises:
+        ValueError: If the input is malformed and no default is given
+    """
+    match = re.match(r'^(\d+)([smhd])$', str(interval_str).lower())
+    if not match:
+        if default is None:
+            raise ValueError(f"Invalid interval format: {interval_str}, expected e.g. '30s', '5m', '2h' or '7d'")
+        logger.warning(f"Invalid interval format: {interval_str}, defaulting to {default}s")
+        return default
+    
+    value, unit = match.groups()
+    return int(value) * {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}[unit]
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """
+    Compute the delay before the next attempt.
+    
+    The delay doubles with every attempt up to max_delay; half of it is
+    randomized (equal jitter) so that requests failing together do not
+    retry together.
+    
+    Args:
+        attempt: Number of attempts made so far (>= 1)
+        base_delay: Delay after the first attempt in seconds
+        max_delay: Upper bound for the delay in seconds
+        
+    Returns:
+        Delay in seconds
+    """
+    delay = min(max_delay, base_delay * 2 ** (attempt - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+# Requests a lane may hold (queued or evaluating) per unit of concurrency
+LANE_QUEUE_FACTOR = 2
+
+
+class QueueLane:
+    """
+    Worker budget for the pending requests of a group of models.
+    
+    Each lane evaluates at most `concurrency` requests at once, each bounded
+    by `request_timeout`, and accepts at most `max_queued` requests before
+    further ones are left for a later scan. With batch evaluation the limits
+    apply to whole batches of up to `batch_size` requests instead.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        patterns: list[str],
+        concurrency: int,
+        request_timeout: float,
+        batch_size: int = 1
+    ):
+        """
+        Initialize a lane.
+        
+        Args:
+            name: Lane name, used in logs and status
+            patterns: fnmatch patterns of the models routed to this lane
+            concurrency: Maximum number of concurrent evaluations
+            request_timeout: Timeout in seconds for evaluating a single request
+            batch_size: Requests per evaluation, 1 unless batch evaluation is enabled
+        """
+        self.name = name
+        self.patterns = patterns
+        self.concurrency = max(1, concurrency)
+        self.request_timeout = request_timeout
+        self.max_queued = self.concurrency * LANE_QUEUE_FACTOR * max(1, batch_size)
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        # Requests dispatched to this lane and not finished yet
+        self.queued: set[str] = set()
+        # Set when requests were turned away; the next free slot triggers a rescan
+        self.saturated = False
+    
+    def matches(self, model: str) -> bool:
+        """Check whether requests for a model belong to this lane."""
+        return any(fnmatch.fnmatchcase(model, pattern) for pattern in self.patterns)
+    
+    @property
+    def full(self) -> bool:
+        """True if the lane does not accept more requests."""
+        return len(self.queued) >= self.max_queued
+
 
 class QueueProcessor:
-    """Background task processor for pending key requests."""
+    """
+    Background task processor for pending key requests.
+    
+    The processor is woken as soon as the store reports a new or changed
+    pending request; the periodic resync only covers missed notifications.
+    Its cadence adapts: min_interval while scans find work, doubling up to
+    max_interval while the queue is idle.
+    
+    Requests that stay undecided are retried with exponential backoff.
+    Their next attempt time is stored with the request and kept in a
+    min-heap, so only requests that are due are loaded and evaluated.
+    After max_attempts the request is moved to the dead-letter state.
+    
+    Each scan orders pending requests by the priority policy and escalates
+    requests that missed their deadline. Work is partitioned into lanes by model. Lanes run their batches
+    independently with their own concurrency and timeout, so requests that
+    are decided instantly never wait behind slow external evaluations.
+    """
     
     @inject
     def __init__(
         self,
-        k8s_service: KubernetesSecretService,
-        approval_service: ApprovalService
+        k8s_service: KeyRequestStore,
+        approval_service: ApprovalService,
+        coordinator: QueueCoordinator
     ):
         """
         Initialize queue processor with required services.
         
         Args:
-            k8s_service: Kubernetes secret service
+            k8s_service: Key request store
             approval_service: Approval service
+            coordinator: Decides which requests this process owns
         """
         self.k8s_service = k8s_service
         self.approval_service = approval_service
+        self.coordinator = coordinator
         self.running = False
         self.task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        
+        # Worker pool limits per lane and requests currently being evaluated
+        self.concurrency = max(1, config_manager.get_queue_concurrency())
+        self.request_timeout = config_manager.get_queue_request_timeout()
+        self.drain_timeout = config_manager.get_queue_drain_timeout()
+        self.batch_evaluation = config_manager.get_batch_evaluation()
+        self.evaluation_batch_size = max(1, config_manager.get_queue_batch_size()) if self.batch_evaluation else 1
+        self.lanes = [self._build_lane(lane) for lane in config_manager.get_queue_lanes()]
+        self.default_lane = QueueLane('default', ['*'], self.concurrency, self.request_timeout, self.evaluation_batch_size)
+        self.lanes.append(self.default_lane)
+        self.in_flight: dict[str, float] = {}
+        self._tasks: set[asyncio.Task] = set()
+        
+        # Processing order and deadline escalation of pending requests
+        priority = config_manager.get_priority_config()
+        self.priority = PriorityPolicy(
+            order=priority.order,
+            model_tiers=priority.models,
+            domain_tiers=priority.domains,
+            # A typo must not silently turn into the 30s default and escalate everything
+            deadline=parse_interval(priority.deadline, default=None) if priority.deadline else None,
+            escalate_to=KeyRequestState(priority.escalate_to)
+        )
+        
+        # Retry schedule: heap of (next_attempt_at, request_id); entries not
+        # matching _scheduled are stale and skipped
+        self.retry_base_delay = parse_interval(config_manager.get_queue_retry_base_delay())
+        self.retry_max_delay = parse_interval(config_manager.get_queue_retry_max_delay())
+        self.max_attempts = config_manager.get_queue_retry_max_attempts()
+        self._schedule: list[tuple[datetime, str]] = []
+        self._scheduled: dict[str, datetime] = {}
+        
+        # Adaptive resync cadence between min_interval and max_interval
+        self.min_interval = parse_interval(config_manager.get_queue_min_interval())
+        self.max_interval = max(self.min_interval, parse_interval(config_manager.get_queue_max_interval()))
+        self.interval = self.min_interval
+        self.last_scan_at: Optional[datetime] = None
+        self.last_processed = 0
+        self._next_resync = 0.0
+        
+        self.k8s_service.add_listener(self._on_request_changed)
+        self.coordinator.add_listener(self.wake)
         
         logger.info("QueueProcessor initialized")
     
-    def parse_interval(self, interval_str: str) -> int:
+    def _build_lane(self, lane_config: QueueLaneConfig) -> QueueLane:
+        """Create a lane, inheriting unset limits from the default lane settings."""
+        return QueueLane(
+            lane_config.name,
+            lane_config.models,
+            lane_config.concurrency or self.concurrency,
+            lane_config.request_timeout or self.request_timeout,
+            self.evaluation_batch_size
+        )
+    
+    def lane_for(self, model: str) -> QueueLane:
+        """
+        Route a model to its lane.
+        
+        Args:
+            model: LLM model identifier
+            
+        Returns:
+            The first lane matching the model, or the default lane
+        """
+        for lane in self.lanes:
+            if lane.matches(model):
+                return lane
+        return self.default_lane
+    
+    def _on_request_changed(self, summary: KeyRequestSummary) -> None:
+        """Store listener; may be called from any thread."""
+        if summary.state != KeyRequestState.PENDING:
+            return
+        # Requests waiting for a retry are picked up from the schedule
+        if summary.next_attempt_at is not None and summary.next_attempt_at > datetime.utcnow():
+            return
+        # Leased requests are being acted on; the release or decision notifies again
+        if lease_active(summary):
+            return
+        self.wake()
+    
+    def wake(self) -> None:
+        """Request an immediate queue scan. Thread-safe."""
+        if self._loop is None or self._wakeup is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            # Event loop already closed during shutdown
+            pass
+    
+    async def evaluate_request(
+        self,
+        request: KeyRequestData,
+        lane: Optional[QueueLane] = None
+    ) -> Optional[ApprovalResponse]:
         """
-        Parse interval string to seconds.
+        Evaluate a single request on its lane's worker pool.
         
-        Supports formats: "30s", "1m", "5m", etc.
+        At most `concurrency` requests of a lane are evaluated at once, each
+        bounded by the lane's `request_timeout`. A request that times out or
+        fails stays pending and is retried later.
         
         Args:
-            interval_str: Interval string (e.g., "30s", "1m")
+            request: KeyRequestData to evaluate
+            lane: Lane to evaluate on, defaults to the default lane
             
         Returns:
-            Interval in seconds
+            ApprovalResponse, or None if evaluation failed
+        """
+        lane = lane or self.default_lane
+        async with lane.semaphore:
+            self.in_flight[request.request_id] = time.monotonic()
+            try:
+                logger.info(f"Processing request {request.request_id} for {request.email}")
+                
+                # Get approval decision
+                return await asyncio.wait_for(
+                    self.approval_service.process(
+                        email=request.email,
+                        model=request.model,
+                        request_id=request.request_id
+                    ),
+                    timeout=lane.request_timeout
+                )
+                
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Evaluation of request {request.request_id} timed out after {lane.request_timeout}s "
+                    f"(lane {lane.name})"
+                )
+            except Exception as e:
+                logger.error(f"Error processing request {request.request_id}: {e}", exc_info=True)
+            finally:
+                self.in_flight.pop(request.request_id, None)
+        return None
+    
+    async def evaluate_batch(
+        self,
+        requests: list[KeyRequestData],
+        lane: Optional[QueueLane] = None
+    ) -> list[Optional[ApprovalResponse]]:
         """
-        match = re.match(r'^(\d+)([smh])$', interval_str.lower())
-        if not match:
-            logger.warning(f"Invalid interval format: {interval_str}, defaulting to 30s")
-            return 30
+        Evaluate a batch of requests with one pass through the plugin chain.
         
-        value, unit = match.groups()
-        value = int(value)
+        The batch takes one slot of the lane's worker pool and is bounded by
+        the lane's `request_timeout` as a whole.
         
-        if unit == 's':
-            return value
-        elif unit == 'm':
-            return value * 60
-        elif unit == 'h':
-            return value * 3600
+        Args:
+            requests: KeyRequestData objects to evaluate
+            lane: Lane to evaluate on, defaults to the default lane
+            
+        Returns:
+            One ApprovalResponse per request, or None for all of them if
+            evaluation failed
+        """
+        lane = lane or self.default_lane
+        async with lane.semaphore:
+            started = time.monotonic()
+            for request in requests:
+                self.in_flight[request.request_id] = started
+            try:
+                logger.info(f"Processing batch of {len(requests)} request(s) in lane {lane.name}")
+                return await asyncio.wait_for(
+                    self.approval_service.process_many(
+                        [(request.email, request.model, request.request_id) for request in requests]
+                    ),
+                    timeout=lane.request_timeout
+                )
+                
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Evaluation of batch of {len(requests)} request(s) timed out after "
+                    f"{lane.request_timeout}s (lane {lane.name})"
+                )
+            except Exception as e:
+                logger.error(f"Error processing batch of {len(requests)} request(s): {e}", exc_info=True)
+            finally:
+                for request in requests:
+                    self.in_flight.pop(request.request_id, None)
+        return [None] * len(requests)
+    
+    def _retry_update(self, request: KeyRequestData) -> KeyRequestUpdate:
+        """
+        Build the update recording an undecided attempt.
         
-        return 30
+        Args:
+            request: Request that stays pending
+            
+        Returns:
+            KeyRequestUpdate scheduling the next attempt, or moving the
+            request to the dead-letter state once max_attempts is reached
+        """
+        attempts = request.attempts + 1
+        if self.max_attempts and attempts >= self.max_attempts:
+            changes = {'state': KeyRequestState.DEAD_LETTER, 'attempts': attempts, 'next_attempt_at': None}
+        else:
+            delay = backoff_delay(attempts, self.retry_base_delay, self.retry_max_delay)
+            changes = {'attempts': attempts, 'next_attempt_at': datetime.utcnow() + timedelta(seconds=delay)}
+        
+        return KeyRequestUpdate(
+            request_id=request.request_id,
+            changes=changes,
+            resource_version=request.resource_version,
+            expected_state=request.state
+        )
+    
+    def _schedule_retry(self, request_id: str, next_attempt_at: datetime) -> None:
+        """Add or move a request in the retry schedule."""
+        self._scheduled[request_id] = next_attempt_at
+        heapq.heappush(self._schedule, (next_attempt_at, request_id))
     
-    async def process_single_request(self, request: KeyRequestData) -> None:
+    def _next_due_in(self) -> Optional[float]:
+        """Seconds until the earliest scheduled retry, or None if nothing is scheduled."""
+        while self._schedule:
+            next_attempt_at, request_id = self._schedule[0]
+            if self._scheduled.get(request_id) == next_attempt_at:
+                return max(0.0, (next_attempt_at - datetime.utcnow()).total_seconds())
+            heapq.heappop(self._schedule)
+        return None
+    
+    def _pop_due(self) -> list[str]:
+        """Remove and return all scheduled requests that are due."""
+        now = datetime.utcnow()
+        due = []
+        while self._schedule and self._schedule[0][0] <= now:
+            next_attempt_at, request_id = heapq.heappop(self._schedule)
+            if self._scheduled.get(request_id) == next_attempt_at:
+                del self._scheduled[request_id]
+                due.append(request_id)
+        return due
+    
+    async def process_batch(self, requests: list[KeyRequestData], lane: Optional[QueueLane] = None) -> None:
         """
-        Process a single pending request.
+        Process a batch of pending requests.
+        
+        Requests are evaluated concurrently on the lane's worker pool, or
+        together with batch evaluation; the resulting state transitions are
+        handed to the approval service as one batch, and their state updates
+        are bounded by _action_timeout(). Requests that stay
+        undecided (PENDING outcome, timeout or error) are rescheduled with
+        backoff.
         
         Args:
-            request: KeyRequestData to process
+            requests: KeyRequestData objects to process
+            lane: Lane to evaluate on, defaults to the default lane
         """
+        if self.batch_evaluation:
+            responses = await self.evaluate_batch(requests, lane)
+        else:
+            responses = await asyncio.gather(*(self.evaluate_request(request, lane) for request in requests))
+        decisions = []
+        retries = []
+        for approval_response, request in zip(responses, requests):
+            if approval_response is None or approval_response.state == KeyRequestState.PENDING:
+                retries.append(self._retry_update(request))
+            else:
+                decisions.append((approval_response, request))
+        
+        # Take action based on decisions; requests whose action failed are retried like undecided ones
         try:
-            logger.info(f"Processing request {request.request_id} for {request.email}")
+            results = await self.approval_service.take_action_many(
+                decisions,
+                timeout=self._action_timeout(lane or self.default_lane)
+            )
+        except Exception as e:
+            logger.error(f"Error taking action for batch of {len(decisions)} request(s): {e}", exc_info=True)
+            results = [
+                WriteResult(request_id=request.request_id, success=False, error=str(e) or type(e).__name__)
+                for _, request in decisions
+            ]
+        failed = self._failed_actions(results)
+        retries.extend(self._retry_update(request) for _, request in decisions if request.request_id in failed)
+        
+        if not retries:
+            return
+        
+        for result in await self.k8s_service.update_many(retries):
+            if not result.success:
+                logger.warning(f"Failed to reschedule request {result.request_id}: {result.error}")
+            elif result.data.state == KeyRequestState.DEAD_LETTER:
+                logger.warning(
+                    f"Request {result.request_id} still undecided after {result.data.attempts} attempt(s), "
+                    f"moved to {KeyRequestState.DEAD_LETTER.value}"
+                )
+            else:
+                self._schedule_retry(result.request_id, result.data.next_attempt_at)
+                logger.info(
+                    f"Request {result.request_id} still pending after attempt {result.data.attempts}, "
+                    f"next attempt at {result.data.next_attempt_at.isoformat()}"
+                )
+    
+    def _action_timeout(self, lane: QueueLane) -> float:
+        """
+        Seconds the approval service may take to write a batch's decisions.
+        
+        The lane's request_timeout, capped well below the approval lease
+        duration so updates are never written after the leases expired.
+        """
+        return min(lane.request_timeout, self.approval_service.lease_duration * ACTION_LEASE_FRACTION)
+    
+    def _failed_actions(self, results: list[WriteResult]) -> set[str]:
+        """
+        Log failed actions of a take_action_many call.
+        
+        Conflicts (another actor got there first) and requests that no
+        longer exist are expected and not retried.
+        
+        Args:
+            results: WriteResults returned by take_action_many
             
-            # Get approval decision
-            approval_response = await self.approval_service.process(
-                email=request.email,
-                model=request.model,
-                request_id=request.request_id
+        Returns:
+            IDs of the requests whose action failed and should be retried
+        """
+        failed = set()
+        for result in results:
+            if result.success or result.conflict:
+                continue
+            if result.not_found:
+                logger.info(f"Request {result.request_id} no longer exists, skipping action")
+            else:
+                logger.error(f"Action for request {result.request_id} failed: {result.error}")
+                failed.add(result.request_id)
+        return failed
+    
+    def _is_queued(self, request_id: str) -> bool:
+        """Check whether a request was dispatched to a lane and is not finished."""
+        return any(request_id in lane.queued for lane in self.lanes)
+    
+    def _dispatch(self, lane: QueueLane, batch: list[KeyRequestData]) -> None:
+        """Run a batch on its lane in the background."""
+        task = asyncio.create_task(self._run_batch(lane, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _run_batch(self, lane: QueueLane, batch: list[KeyRequestData]) -> None:
+        """Process a lane batch and free its slots."""
+        try:
+            await self.process_batch(batch, lane)
+        except Exception as e:
+            logger.error(
+                f"Error processing batch of {len(batch)} request(s) in lane {lane.name}: {e}",
+                exc_info=True
             )
+        finally:
+            lane.queued.difference_update(request.request_id for request in batch)
+            if lane.saturated:
+                # Pick up the requests that were turned away
+                lane.saturated = False
+                self.wake()
+    
+    async def _process_requests(self, requests, batch_size: int) -> int:
+        """
+        Load pending requests and dispatch them to their lanes in batches.
+        
+        Requests are routed by model before being loaded where possible;
+        requests for a full lane are skipped and picked up by the rescan
+        triggered once the lane has room again.
+        
+        Args:
+            requests: Async iterator of (request_id, model) pairs that are due;
+                model may be None if not known before loading
+            batch_size: Number of requests per batch
             
-            # Take action based on decision
-            await self.approval_service.take_action(approval_response, request)
+        Returns:
+            Number of dispatched requests
+        """
+        dispatched = 0
+        batches: dict[str, list[KeyRequestData]] = {}
+        lanes_by_name = {lane.name: lane for lane in self.lanes}
+        async for request_id, model in requests:
+            if not self.running:
+                break
+            if self._is_queued(request_id):
+                continue
+            lane = self.lane_for(model) if model is not None else None
+            if lane is not None and lane.full:
+                lane.saturated = True
+                continue
             
-        except Exception as e:
-            logger.error(f"Error processing request {request.request_id}: {e}", exc_info=True)
+            request = await self.k8s_service.get(request_id)
+            if request is None or request.state != KeyRequestState.PENDING or lease_active(request):
+                continue
+            if request.next_attempt_at is not None and request.next_attempt_at > datetime.utcnow():
+                self._schedule_retry(request.request_id, request.next_attempt_at)
+                continue
+            if lane is None:
+                lane = self.lane_for(request.model)
+                if lane.full:
+                    lane.saturated = True
+                    continue
+            
+            batch = batches.setdefault(lane.name, [])
+            batch.append(request)
+            lane.queued.add(request.request_id)
+            dispatched += 1
+            if len(batch) >= batch_size or lane.full:
+                self._dispatch(lane, batches.pop(lane.name))
+        
+        for name, batch in batches.items():
+            self._dispatch(lanes_by_name[name], batch)
+        return dispatched
+    
+    async def _scan(self):
+        """
+        Scan pending request metadata and yield due requests by priority.
+        
+        Requests waiting for a retry are put on the schedule instead of
+        being loaded; requests of shards owned by other replicas are skipped.
+        Requests past their deadline are escalated first.
+        
+        Yields:
+            (request_id, model) pairs of requests that are due, most urgent first
+        """
+        due = []
+        expired = []
+        now = datetime.utcnow()
+        async for summary in self.k8s_service.iter_summaries(KeyRequestState.PENDING):
+            if not self.coordinator.owns(summary.request_id) or lease_active(summary):
+                continue
+            if self._is_queued(summary.request_id):
+                continue
+            if self.priority.is_expired(summary, now):
+                expired.append(summary)
+                continue
+            if summary.next_attempt_at is not None and summary.next_attempt_at > now:
+                self._schedule_retry(summary.request_id, summary.next_attempt_at)
+                continue
+            due.append(summary)
+        
+        if expired:
+            await self.escalate(expired)
+        
+        for summary in self.priority.sort(due):
+            yield summary.request_id, summary.model
+    
+    async def escalate(self, summaries: list[KeyRequestSummary]) -> None:
+        """
+        Move requests that missed their deadline to the escalation state.
+        
+        Args:
+            summaries: Pending requests past their deadline
+        """
+        decisions = []
+        for summary in self.priority.sort(summaries):
+            request = await self.k8s_service.get(summary.request_id)
+            if request is None or request.state != KeyRequestState.PENDING:
+                continue
+            self._scheduled.pop(request.request_id, None)
+            decisions.append((
+                ApprovalResponse(
+                    state=self.priority.escalate_to,
+                    reason=f"Not decided within {self.priority.deadline}s",
+                    can_retry=False
+                ),
+                request
+            ))
+        
+        results = await self.approval_service.take_action_many(
+            decisions,
+            timeout=self._action_timeout(self.default_lane)
+        )
+        self._failed_actions(results)
+        escalated = sum(result.success for result in results)
+        if escalated:
+            logger.warning(
+                f"Escalated {escalated} request(s) past their deadline to {self.priority.escalate_to.value}"
+            )
+    
+    async def _due(self, request_ids: list[str]):
+        """Yield (request_id, None) pairs of scheduled requests that are still owned."""
+        for request_id in request_ids:
+            if self.coordinator.owns(request_id):
+                yield request_id, None
+    
+    def _adapt_interval(self, processed: int) -> None:
+        """
+        Adjust the resync cadence after a full scan.
+        
+        While scans find work the queue is resynced every min_interval;
+        every idle scan doubles the interval up to max_interval.
+        
+        Args:
+            processed: Number of requests the scan processed
+        """
+        previous = self.interval
+        if processed:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * 2)
+        if self.interval != previous:
+            logger.debug(f"Queue resync interval changed from {previous}s to {self.interval}s")
+    
+    def status(self) -> dict:
+        """
+        Describe the processor state for observability.
+        
+        Returns:
+            Current cadence, bounds, last scan outcome and outstanding work
+        """
+        return {
+            'running': self.running,
+            'active': self.coordinator.is_active,
+            'interval_seconds': self.interval,
+            'min_interval_seconds': self.min_interval,
+            'max_interval_seconds': self.max_interval,
+            'next_resync_in_seconds': max(0.0, self._next_resync - time.monotonic()) if self.running else None,
+            'last_scan_at': self.last_scan_at,
+            'last_processed': self.last_processed,
+            'in_flight': len(self.in_flight),
+            'scheduled_retries': len(self._scheduled),
+            'lanes': [
+                {
+                    'name': lane.name,
+                    'models': lane.patterns,
+                    'concurrency': lane.concurrency,
+                    'request_timeout': lane.request_timeout,
+                    'queued': len(lane.queued),
+                    'in_flight': sum(1 for request_id in lane.queued if request_id in self.in_flight),
+                }
+                for lane in self.lanes
+            ],
+        }
     
     async def process_queue(self) -> None:
         """Main queue processing loop."""
-        interval_str = config_manager.get_queue_interval()
-        interval_seconds = self.parse_interval(interval_str)
+        batch_size = max(1, config_manager.get_queue_batch_size())
         
-        logger.info(f"Starting queue processor with interval {interval_str} ({interval_seconds}s)")
+        logger.info(
+            f"Starting queue processor with resync interval {self.min_interval}s-{self.max_interval}s, "
+            f"batch size {batch_size}, lanes {', '.join(f'{lane.name} ({lane.concurrency})' for lane in self.lanes)}"
+        )
         
+        self._next_resync = 0.0
         while self.running:
+            # Full scan on notification or resync; otherwise only the due retries
+            full_scan = self._wakeup.is_set() or time.monotonic() >= self._next_resync
+            # Notifications arriving during the scan trigger another scan
+            self._wakeup.clear()
             try:
-                # Get all pending requests
-                pending_requests = await self.k8s_service.find_by_status(KeyRequestState.PENDING)
+                if not self.coordinator.is_active:
+                    logger.debug("Not owning any queue work, skipping scan")
+                    self._next_resync = time.monotonic() + self.max_interval
+                    await self._wait(self.max_interval)
+                    continue
+                
+                # Load the full request only when it is about to be processed.
+                # Decisions are written in batches of batch_size.
+                if full_scan:
+                    processed = await self._process_requests(self._scan(), batch_size)
+                    self.last_scan_at = datetime.utcnow()
+                    self.last_processed = processed
+                    self._adapt_interval(processed)
+                    self._next_resync = time.monotonic() + self.interval
+                else:
+                    processed = await self._process_requests(self._due(self._pop_due()), batch_size)
                 
-                if pending_requests:
-                    logger.info(f"Found {len(pending_requests)} pending request(s) to process")
-                    
-                    # Process each pending request
-                    for request in pending_requests:
-                        if not self.running:
-                            break
-                        await self.process_single_request(request)
+                if processed:
+                    logger.info(f"Dispatched {processed} pending request(s)")
                 else:
                     logger.debug("No pending requests to process")
                 
             except Exception as e:
                 logger.error(f"Error in queue processing cycle: {e}", exc_info=True)
             
-            # Wait for next cycle
-            await asyncio.sleep(interval_seconds)
+            # Wait for new work, the next scheduled retry or the next resync
+            timeout = max(0.0, self._next_resync - time.monotonic())
+            due_in = self._next_due_in()
+            if due_in is not None:
+                timeout = min(timeout, due_in)
+            await self._wait(timeout)
         
         logger.info("Queue processor stopped")
     
+    async def _wait(self, timeout: float) -> None:
+        """Sleep until woken or until the timeout expires."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+    
     def start(self) -> None:
         """Start the queue processor background task."""
         if self.running:
@@ -122,6 +758,8 @@ class QueueProcessor:
             return
         
         self.running = True
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
         self.task = asyncio.create_task(self.process_queue())
         logger.info("Queue processor started")
     
@@ -133,11 +771,13 @@ class QueueProcessor:
         
         logger.info("Stopping queue processor...")
         self.running = False
+        self._wakeup.set()
         
+        deadline = time.monotonic() + self.drain_timeout
         if self.task:
-            # Wait for current cycle to complete (with timeout)
+            # No new requests are picked up
             try:
-                await asyncio.wait_for(self.task, timeout=10.0)
+                await asyncio.wait_for(asyncio.shield(self.task), timeout=self.drain_timeout)
             except asyncio.TimeoutError:
                 logger.warning("Queue processor did not stop gracefully, cancelling task")
                 self.task.cancel()
@@ -146,4 +786,14 @@ class QueueProcessor:
                 except asyncio.CancelledError:
                     pass
         
+        if self._tasks:
+            # Let dispatched batches finish (with timeout)
+            logger.info(f"Draining {len(self.in_flight)} in-flight request(s)")
+            _, pending = await asyncio.wait(set(self._tasks), timeout=max(0.0, deadline - time.monotonic()))
+            if pending:
+                logger.warning(f"Cancelling {len(pending)} batch(es) that did not finish in time")
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        
         logger.info("Queue processor stopped")
@@ -0,0 +1,179 @@
+"""Background retention processor for finished key requests."""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
+from loguru import logger
+from injector import inject
+from config import config_manager, RetentionConfig, RetentionPolicy
+from src.background.queue_processor import parse_interval
+from src.background.leader_election import QueueCoordinator
+from src.services.key_request_store import KeyRequestStore
+from src.models.key_request import KeyRequestState, KeyRequestSummary
+
+
+class RetentionProcessor:
+    """
+    Background task that archives or deletes old approved/denied requests.
+
+    Requests are selected per state from their metadata using an age limit
+    and a count limit, then archived in chunks (if configured) and removed
+    from the live store with batched deletes. Full records are only loaded
+    for the batch being archived.
+    """
+
+    @inject
+    def __init__(self, k8s_service: KeyRequestStore, coordinator: QueueCoordinator):
+        """
+        Initialize retention processor.
+
+        Args:
+            k8s_service: Key request store
+            coordinator: Restricts retention to a single replica
+        """
+        self.k8s_service = k8s_service
+        self.coordinator = coordinator
+        self.running = False
+        self.task: Optional[asyncio.Task] = None
+
+        logger.info("RetentionProcessor initialized")
+
+    async def select_expired(
+        self,
+        state: KeyRequestState,
+        policy: RetentionPolicy,
+        now: Optional[datetime] = None
+    ) -> list[KeyRequestSummary]:
+        """
+        Select requests in a state that exceed the policy limits.
+
+        Args:
+            state: Terminal state to inspect
+            policy: Age and count limits for the state
+            now: Reference time for the age limit
+
+        Returns:
+            Expired requests, oldest first
+        """
+        if policy.max_age is None and policy.max_count is None:
+            return []
+
+        requests = await self.k8s_service.list_summaries(state)
+        requests.sort(key=lambda r: r.updated_at, reverse=True)
+
+        cutoff = None
+        if policy.max_age is not None:
+            cutoff = (now or datetime.utcnow()) - timedelta(seconds=parse_interval(policy.max_age))
+
+        expired = []
+        for position, request in enumerate(requests):
+            over_count = policy.max_count is not None and position >= policy.max_count
+            too_old = cutoff is not None and request.updated_at < cutoff
+            if over_count or too_old:
+                expired.append(request)
+
+        expired.reverse()
+        return expired
+
+    async def apply_policy(
+        self,
+        state: KeyRequestState,
+        policy: RetentionPolicy,
+        config: RetentionConfig
+    ) -> int:
+        """
+        Archive and/or delete expired requests of one state.
+
+        Batches are processed oldest first and a failure stops the pass, so
+        the next pass starts with the same batch; as archive chunks are named
+        after their request ids, that batch is not archived twice.
+
+        Args:
+            state: Terminal state to compact
+            policy: Age and count limits for the state
+            config: Retention configuration (action, batch size)
+
+        Returns:
+            Number of requests removed from the live store
+        """
+        expired = await self.select_expired(state, policy)
+        if not expired:
+            return 0
+
+        removed = 0
+        batch_size = max(1, config.batch_size)
+        for i in range(0, len(expired), batch_size):
+            batch = [summary.request_id for summary in expired[i:i + batch_size]]
+            if config.action == 'archive':
+                records = [await self.k8s_service.get(request_id) for request_id in batch]
+                records = [record for record in records if record is not None and record.state == state]
+                if records:
+                    await self.k8s_service.archive(records)
+                batch = [record.request_id for record in records]
+            # Only delete requests still in the expected state
+            if batch:
+                removed += await self.k8s_service.delete_many(batch, state=state)
+
+        logger.info(f"Retention removed {removed} {state.value} request(s) (action: {config.action})")
+        return removed
+
+    async def run_once(self) -> int:
+        """
+        Run a single retention pass over all terminal states.
+
+        Returns:
+            Number of requests removed from the live store
+        """
+        config = config_manager.get_retention_config()
+        removed = 0
+        for state, policy in (
+            (KeyRequestState.APPROVED, config.approved),
+            (KeyRequestState.DENIED, config.denied),
+        ):
+            removed += await self.apply_policy(state, policy, config)
+        return removed
+
+    async def process_retention(self) -> None:
+        """Main retention loop."""
+        interval_str = config_manager.get_retention_config().interval
+        interval_seconds = parse_interval(interval_str, default=3600)
+
+        logger.info(f"Starting retention processor with interval {interval_str} ({interval_seconds}s)")
+
+        while self.running:
+            try:
+                if self.coordinator.is_leader:
+                    await self.run_once()
+                else:
+                    logger.debug("Not the queue leader, skipping retention")
+            except Exception as e:
+                logger.error(f"Error in retention cycle: {e}", exc_info=True)
+
+            await asyncio.sleep(interval_seconds)
+
+    def start(self) -> None:
+        """Start the retention processor background task."""
+        if self.running:
+            logger.warning("Retention processor is already running")
+            return
+
+        self.running = True
+        self.task = asyncio.create_task(self.process_retention())
+        logger.info("Retention processor started")
+
+    async def stop(self) -> None:
+        """Stop the retention processor background task."""
+        if not self.running:
+            return
+
+        logger.info("Stopping retention processor...")
+        self.running = False
+
+        if self.task:
+            # The loop mostly sleeps; cancel instead of waiting for the interval
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+
+        logger.info("Retention processor stopped")
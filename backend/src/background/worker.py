@@ -0,0 +1,52 @@
+"""Standalone background worker running the queue and retention processors."""
+import asyncio
+import signal
+from loguru import logger
+from config import config_manager
+from src.services.key_request_store import KeyRequestStore
+from src.services.approval_service import ApprovalService
+from src.background.queue_processor import QueueProcessor
+from src.background.retention_processor import RetentionProcessor
+from src.background.leader_election import QueueCoordinator
+
+
+async def run_worker(retention: bool = True) -> None:
+    """
+    Run the background processors until SIGINT or SIGTERM.
+
+    Uses the same configuration and dependency wiring as the API server,
+    without the HTTP and MCP layers. Approval and denial emails are sent
+    by the worker, as part of taking action on a decision.
+
+    Args:
+        retention: Also run the retention processor (if enabled in config)
+    """
+    k8s_service = config_manager.injector.get(KeyRequestStore)
+    approval_service = config_manager.injector.get(ApprovalService)
+    queue_coordinator = config_manager.injector.get(QueueCoordinator)
+    queue_processor = config_manager.injector.get(QueueProcessor)
+    retention_processor = config_manager.injector.get(RetentionProcessor)
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    logger.info("Starting queue worker...")
+    await k8s_service.start()
+    await approval_service.start()
+    queue_coordinator.start()
+    queue_processor.start()
+    if retention and config_manager.get_retention_config().enabled:
+        retention_processor.start()
+    logger.info("Queue worker started")
+
+    await stop_event.wait()
+
+    logger.info("Shutting down queue worker...")
+    await retention_processor.stop()
+    await queue_processor.stop()
+    await queue_coordinator.stop()
+    await approval_service.stop()
+    await k8s_service.stop()
+    logger.info("Queue worker shutdown complete")
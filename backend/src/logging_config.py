@@ -0,0 +1,43 @@
+"""Logging setup shared by the API server and the standalone worker."""
+import inspect
+import logging
+from loguru import logger
+
+# Loggers of dependencies that install their own handlers
+INTERCEPTED_LOGGERS = ["uvicorn", "uvicorn.access", "uvicorn.error", "fastapi", "mcp"]
+
+
+# Intercept standard logging and redirect to loguru
+class InterceptHandler(logging.Handler):
+    """
+    Handler to intercept standard logging and redirect to loguru.
+    This ensures all logs from libraries using standard logging (like FastMCP, uvicorn)
+    are formatted consistently with loguru.
+    """
+    def emit(self, record: logging.LogRecord) -> None:
+        # Get corresponding Loguru level if it exists
+        level: str | int
+        try:
+            level = logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+
+        # Find caller from where originated the logged message
+        frame, depth = inspect.currentframe(), 0
+        while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
+            frame = frame.f_back
+            depth += 1
+
+        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+
+
+def setup_logging() -> None:
+    """Route standard library logging, including that of dependencies, through loguru."""
+    # Configure logging to intercept standard library logging
+    logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
+
+    # Intercept specific loggers that might be used by dependencies
+    for logger_name in INTERCEPTED_LOGGERS:
+        logging_logger = logging.getLogger(logger_name)
+        logging_logger.handlers = [InterceptHandler()]
+        logging_logger.propagate = False
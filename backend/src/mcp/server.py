@@ -4,7 +4,7 @@ from fastmcp import FastMCP
 from fastmcp.server.auth.providers.jwt import StaticTokenVerifier
 from loguru import logger
 from config import config_manager
-from src.services.kubernetes_secret_service import KubernetesSecretService
+from src.services.key_request_store import KeyRequestStore
 from .tools import (
     list_pending_requests,
     list_review_requests,
@@ -16,12 +16,12 @@ from .tools import (
     get_available_models
 )
 
-def create_mcp_server(k8s_service: KubernetesSecretService,) -> FastMCP:
+def create_mcp_server(k8s_service: KeyRequestStore,) -> FastMCP:
     """
     Create and configure an MCP server for LLM Key Requestor administration.
     
     Args:
-        k8s_service: Kubernetes secret service for managing key requests
+        k8s_service: Key request store for managing key requests
 
     Returns:
         Configured FastMCP server instance
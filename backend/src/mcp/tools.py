@@ -1,14 +1,64 @@
 """MCP tools for managing LLM key requests."""
 
+import uuid
 from datetime import datetime
 from loguru import logger
 from fastmcp.server import Context
 
-from src.models.key_request import KeyRequestState
-from src.services.kubernetes_secret_service import KubernetesSecretService
+from src.models.key_request import KeyRequestData, KeyRequestState
+from src.services.key_request_store import KeyRequestStore, RequestLeaseError
 from config import config_manager
 
-async def list_pending_requests(ctx: Context, k8s_service: KubernetesSecretService) -> list[dict]:
+
+async def _write_under_lease(k8s_service: KeyRequestStore, request: KeyRequestData, **changes) -> KeyRequestData:
+    """
+    Apply an admin state change while holding the request's lease.
+    
+    The lease is taken with the state the admin saw as precondition and
+    cleared by the write itself, so a queue worker can neither start on the
+    request in between nor have its own write silently overwritten.
+    
+    Args:
+        k8s_service: Store for accessing key requests
+        request: Request as read by the tool
+        **changes: Fields to update
+        
+    Returns:
+        Updated KeyRequestData
+        
+    Raises:
+        ValueError: If the request is gone or being processed by someone else
+        RequestConflictError: If the request was modified concurrently
+    """
+    owner = f"mcp-{uuid.uuid4().hex[:8]}"
+    try:
+        leased = await k8s_service.acquire_lease(
+            request.request_id,
+            owner,
+            config_manager.get_request_lease_duration(),
+            expected_state=request.state
+        )
+    except RequestLeaseError as e:
+        raise ValueError(f"{e}, try again later") from e
+    if leased is None:
+        raise ValueError(f"Request not found: {request.request_id}")
+    
+    try:
+        return await k8s_service.update(
+            request.request_id,
+            resource_version=leased.resource_version,
+            expected_state=leased.state,
+            lease_holder=owner,
+            lease_owner=None,
+            lease_expires_at=None,
+            **changes
+        )
+    except Exception:
+        await k8s_service.release_lease(request.request_id, owner)
+        raise
+
+
+async def list_pending_requests(ctx: Context, k8s_service: KeyRequestStore) -> list[dict]:
     """
     List all key requests in PENDING state.
     
@@ -16,7 +66,7 @@ async def list_pending_requests(ctx: Context, k8s_service: KubernetesSecretServi
     
     Args:
         ctx: MCP context for authentication
-        k8s_service: Service for accessing Kubernetes secrets
+        k8s_service: Store for accessing key requests
         
     Returns:
         List of pending key requests with their details
@@ -24,7 +74,7 @@ async def list_pending_requests(ctx: Context, k8s_service: KubernetesSecretServi
     logger.info("Listing pending key requests")
     
     try:
-        pending_requests = await k8s_service.find_by_status(KeyRequestState.PENDING)
+        pending_requests = await k8s_service.list_summaries(KeyRequestState.PENDING)
         
         result = [
             {
@@ -46,7 +96,7 @@ async def list_pending_requests(ctx: Context, k8s_service: KubernetesSecretServi
         raise
 
 
-async def list_review_requests(ctx: Context, k8s_service: KubernetesSecretService) -> list[dict]:
+async def list_review_requests(ctx: Context, k8s_service: KeyRequestStore) -> list[dict]:
     """
     List all key requests in REVIEW state.
     
@@ -54,7 +104,7 @@ async def list_review_requests(ctx: Context, k8s_service: KubernetesSecretServic
     
     Args:
         ctx: MCP context for authentication
-        k8s_service: Service for accessing Kubernetes secrets
+        k8s_service: Store for accessing key requests
         
     Returns:
         List of key requests in review with their details
@@ -62,7 +112,7 @@ async def list_review_requests(ctx: Context, k8s_service: KubernetesSecretServic
     logger.info("Listing review key requests")
     
     try:
-        review_requests = await k8s_service.find_by_status(KeyRequestState.REVIEW)
+        review_requests = await k8s_service.list_summaries(KeyRequestState.REVIEW)
         
         result = [
             {
@@ -84,7 +134,7 @@ async def list_review_requests(ctx: Context, k8s_service: KubernetesSecretServic
         raise
 
 
-async def approve_request(ctx: Context, request_id: str, k8s_service: KubernetesSecretService) -> dict:
+async def approve_request(ctx: Context, request_id: str, k8s_service: KeyRequestStore) -> dict:
     """
     Approve a key request by changing its state to APPROVED.
     
@@ -93,7 +143,7 @@ async def approve_request(ctx: Context, request_id: str, k8s_service: Kubernetes
     Args:
         ctx: MCP context for authentication
         request_id: The ID of the request to approve
-        k8s_service: Service for accessing Kubernetes secrets
+        k8s_service: Store for accessing key requests
         
     Returns:
         Updated request details
@@ -107,11 +157,12 @@ async def approve_request(ctx: Context, request_id: str, k8s_service: Kubernetes
             raise ValueError(f"Request not found: {request_id}")
         
         # Update state to APPROVED
-        request.state = KeyRequestState.APPROVED
-        request.updated_at = datetime.now()
+        updated_at = datetime.now()
         
         # Save the updated request
-        await k8s_service.update(request.request_id, state=request.state, updated_at=request.updated_at)
+        request = await _write_under_lease(
+            k8s_service, request, state=KeyRequestState.APPROVED, updated_at=updated_at
+        )
 
         result = {
             "request_id": request.request_id,
@@ -129,7 +180,7 @@ async def approve_request(ctx: Context, request_id: str, k8s_service: Kubernetes
         raise
 
 
-async def deny_request(ctx: Context, request_id: str, k8s_service: KubernetesSecretService) -> dict:
+async def deny_request(ctx: Context, request_id: str, k8s_service: KeyRequestStore) -> dict:
     """
     Deny a key request by changing its state to DENIED.
     
@@ -138,7 +189,7 @@ async def deny_request(ctx: Context, request_id: str, k8s_service: KubernetesSec
     Args:
         ctx: MCP context for authentication
         request_id: The ID of the request to deny
-        k8s_service: Service for accessing Kubernetes secrets
+        k8s_service: Store for accessing key requests
         
     Returns:
         Updated request details
@@ -152,11 +203,12 @@ async def deny_request(ctx: Context, request_id: str, k8s_service: KubernetesSec
             raise ValueError(f"Request not found: {request_id}")
         
         # Update state to DENIED
-        request.state = KeyRequestState.DENIED
-        request.updated_at = datetime.now()
+        updated_at = datetime.now()
         
         # Save the updated request
-        await k8s_service.update(request.request_id, state=request.state, updated_at=request.updated_at)
+        request = await _write_under_lease(
+            k8s_service, request, state=KeyRequestState.DENIED, updated_at=updated_at
+        )
         
         result = {
             "request_id": request.request_id,
@@ -174,7 +226,7 @@ async def deny_request(ctx: Context, request_id: str, k8s_service: KubernetesSec
         raise
 
 
-async def set_pending(ctx: Context, request_id: str, k8s_service: KubernetesSecretService) -> dict:
+async def set_pending(ctx: Context, request_id: str, k8s_service: KeyRequestStore) -> dict:
     """
     Set a key request state to PENDING.
     
@@ -183,7 +235,7 @@ async def set_pending(ctx: Context, request_id: str, k8s_service: KubernetesSecr
     Args:
         ctx: MCP context for authentication
         request_id: The ID of the request to set to pending
-        k8s_service: Service for accessing Kubernetes secrets
+        k8s_service: Store for accessing key requests
         
     Returns:
         Updated request details
@@ -197,11 +249,17 @@ async def set_pending(ctx: Context, request_id: str, k8s_service: KubernetesSecr
             raise ValueError(f"Request not found: {request_id}")
         
         # Update state to PENDING
-        request.state = KeyRequestState.PENDING
-        request.updated_at = datetime.now()
+        updated_at = datetime.now()
 
-        # Save the updated request
-        await k8s_service.update(request.request_id, state=request.state, updated_at=request.updated_at)
+        # Save the updated request; re-queued requests start a fresh retry schedule
+        request = await _write_under_lease(
+            k8s_service,
+            request,
+            state=KeyRequestState.PENDING,
+            updated_at=updated_at,
+            attempts=0,
+            next_attempt_at=None
+        )
         
         result = {
             "request_id": request.request_id,
@@ -219,7 +277,7 @@ async def set_pending(ctx: Context, request_id: str, k8s_service: KubernetesSecr
         raise
 
 
-async def set_review(ctx: Context, request_id: str, k8s_service: KubernetesSecretService) -> dict:
+async def set_review(ctx: Context, request_id: str, k8s_service: KeyRequestStore) -> dict:
     """
     Set a key request state to REVIEW.
     
@@ -228,7 +286,7 @@ async def set_review(ctx: Context, request_id: str, k8s_service: KubernetesSecre
     Args:
         ctx: MCP context for authentication
         request_id: The ID of the request to set to review
-        k8s_service: Service for accessing Kubernetes secrets
+        k8s_service: Store for accessing key requests
         
     Returns:
         Updated request details
@@ -242,11 +300,12 @@ async def set_review(ctx: Context, request_id: str, k8s_service: KubernetesSecre
             raise ValueError(f"Request not found: {request_id}")
         
         # Update state to REVIEW
-        request.state = KeyRequestState.REVIEW
-        request.updated_at = datetime.now()
+        updated_at = datetime.now()
         
         # Save the updated request
-        await k8s_service.update(request.request_id, state=request.state, updated_at=request.updated_at)
+        request = await _write_under_lease(
+            k8s_service, request, state=KeyRequestState.REVIEW, updated_at=updated_at
+        )
         
         result = {
             "request_id": request.request_id,
@@ -264,7 +323,7 @@ async def set_review(ctx: Context, request_id: str, k8s_service: KubernetesSecre
         raise
 
 
-async def request_new_key(email: str, model: str, k8s_service: KubernetesSecretService) -> dict:
+async def request_new_key(email: str, model: str, k8s_service: KeyRequestStore) -> dict:
     """
     Create a new key request.
     
@@ -273,7 +332,7 @@ async def request_new_key(email: str, model: str, k8s_service: KubernetesSecretS
     Args:
         email: Email address for the request
         model: Model identifier
-        k8s_service: Service for accessing Kubernetes secrets
+        k8s_service: Store for accessing key requests
         
     Returns:
         Created request details
@@ -1,6 +1,6 @@
 """Pydantic models for key request system."""
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 from pydantic import BaseModel, EmailStr
 from datetime import datetime
 
@@ -11,6 +11,7 @@ class KeyRequestState(str, Enum):
     APPROVED = "approved"
     DENIED = "denied"
     REVIEW = "in-review"
+    DEAD_LETTER = "dead-letter"
 
 
 class ApprovalResponse(BaseModel):
@@ -29,6 +30,45 @@ class KeyRequestData(BaseModel):
     created_at: datetime
     updated_at: datetime
     api_key: Optional[str] = None
+    resource_version: Optional[str] = None
+    attempts: int = 0
+    next_attempt_at: Optional[datetime] = None
+    lease_owner: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+
+
+class KeyRequestSummary(BaseModel):
+    """Key request metadata without secret fields, used for listings"""
+    request_id: str
+    email: str
+    model: str
+    state: KeyRequestState
+    created_at: datetime
+    updated_at: datetime
+    resource_version: Optional[str] = None
+    attempts: int = 0
+    next_attempt_at: Optional[datetime] = None
+    lease_owner: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+
+
+class KeyRequestUpdate(BaseModel):
+    """A pending write to a key request, as passed to update_many"""
+    request_id: str
+    changes: dict[str, Any]
+    resource_version: Optional[str] = None
+    expected_state: Optional[KeyRequestState] = None
+    lease_holder: Optional[str] = None
+
+
+class WriteResult(BaseModel):
+    """Outcome of a single write in a batch"""
+    request_id: Optional[str] = None
+    success: bool
+    data: Optional[KeyRequestData] = None
+    error: Optional[str] = None
+    conflict: bool = False
+    not_found: bool = False
 
 
 class EmailConfig(BaseModel):
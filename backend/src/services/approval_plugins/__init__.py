@@ -1,4 +1,5 @@
 """Approval plugins package for plugin-based approval system."""
 from src.services.approval_plugins.base import ApprovalDecision, ApprovalPlugin
+from src.services.approval_plugins.pattern_matcher import PatternMatcher
 
-__all__ = ["ApprovalDecision", "ApprovalPlugin"]
+__all__ = ["ApprovalDecision", "ApprovalPlugin", "PatternMatcher"]
@@ -1,6 +1,9 @@
 """Base classes and enums for approval plugins."""
+import asyncio
 from abc import ABC, abstractmethod
 from enum import Enum
+from typing import List, Tuple
+from loguru import logger
 
 
 class ApprovalDecision(str, Enum):
@@ -15,6 +18,30 @@ class ApprovalDecision(str, Enum):
 class ApprovalPlugin(ABC):
     """Abstract base class for approval plugins."""
     
+    # True if evaluate() decides from configuration alone, without I/O or
+    # side effects; leading local plugins are run inline at submit time
+    is_local: bool = False
+    
+    # True if evaluate() may be started before the earlier plugins of the
+    # chain have returned (speculative evaluation); plugins with side
+    # effects, such as sending email, must set this to False
+    speculative: bool = True
+    
+    # Seconds decisions are cached per (email, model), 0 disables caching;
+    # negative_cache_ttl applies to CONTINUE results. PENDING is never cached,
+    # so plugins report failures (e.g. an unreachable endpoint) as PENDING
+    # or by raising. Both can be set per plugin in the plugin config.
+    cache_ttl: float = 0
+    negative_cache_ttl: float = 0
+    
+    async def startup(self) -> None:
+        """Acquire resources such as connection pools; called once the app starts."""
+        pass
+    
+    async def shutdown(self) -> None:
+        """Release resources acquired in startup(); called when the app stops."""
+        pass
+    
     @abstractmethod
     async def evaluate(self, email: str, model: str, request_id: str) -> ApprovalDecision:
         """
@@ -33,3 +60,33 @@ class ApprovalPlugin(ABC):
                              PENDING to mark as pending for later
         """
         pass
+    
+    async def evaluate_many(self, items: List[Tuple[str, str, str]]) -> List[ApprovalDecision]:
+        """
+        Evaluate several approval requests at once.
+        
+        The default implementation calls evaluate() for each item
+        concurrently; plugins that can decide many requests in one round
+        trip override it. A failed item is reported as PENDING, so it is
+        retried later instead of failing the whole batch.
+        
+        Args:
+            items: (email, model, request_id) tuples
+            
+        Returns:
+            One decision per item, in the same order
+        """
+        results = await asyncio.gather(
+            *(self.evaluate(email, model, request_id) for email, model, request_id in items),
+            return_exceptions=True
+        )
+        decisions = []
+        for (_, _, request_id), result in zip(items, results):
+            if isinstance(result, BaseException):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                logger.error(f"{self.__class__.__name__} failed for request_id={request_id}: {result}")
+                decisions.append(ApprovalDecision.PENDING)
+            else:
+                decisions.append(result)
+        return decisions
@@ -1,23 +1,33 @@
 """Email pattern approval plugin."""
-import fnmatch
 from loguru import logger
 from src.services.approval_plugins.base import ApprovalPlugin, ApprovalDecision
+from src.services.approval_plugins.pattern_matcher import PatternMatcher
 
 
 class EmailApprovalPlugin(ApprovalPlugin):
     """Approval plugin that approves/denies based on email pattern matching."""
     
+    is_local = True
+    
     def __init__(self):
         """
         Initialize email plugin.
         
         Note:
             Configuration parameters (pattern) are set after instantiation
-            via setattr by the ConfigManager.
+            via setattr by the ConfigManager. The pattern may also be a list
+            of patterns, e.g. one per allowed domain.
         """
         self.pattern = ""
         logger.info(f"EmailApprovalPlugin initialized")
     
+    def __setattr__(self, name, value):
+        """Override setattr to compile the pattern(s) whenever 'pattern' is set."""
+        if name == 'pattern':
+            patterns = [value] if isinstance(value, str) else list(value or [])
+            super().__setattr__('matcher', PatternMatcher(patterns))
+        super().__setattr__(name, value)
+    
     async def evaluate(self, email: str, model: str, request_id: str) -> ApprovalDecision:
         """
         Evaluate if email matches the configured pattern.
@@ -28,11 +38,12 @@ class EmailApprovalPlugin(ApprovalPlugin):
             request_id: Request identifier
             
         Returns:
-            APPROVE if email matches pattern, DENY otherwise
+            APPROVE if email matches a pattern, DENY otherwise
         """
-        if self._matches_pattern(email, self.pattern):
+        pattern = self.matcher.match(email)
+        if pattern is not None:
             logger.info(
-                f"EmailApprovalPlugin: APPROVE - email '{email}' matches pattern '{self.pattern}' "
+                f"EmailApprovalPlugin: APPROVE - email '{email}' matches pattern '{pattern}' "
                 f"for request_id={request_id}"
             )
             return ApprovalDecision.APPROVE
@@ -42,16 +53,3 @@ class EmailApprovalPlugin(ApprovalPlugin):
             f"for request_id={request_id}"
         )
         return ApprovalDecision.DENY
-    
-    def _matches_pattern(self, email: str, pattern: str) -> bool:
-        """
-        Check if email matches pattern with wildcard support.
-        
-        Args:
-            email: Email address to check
-            pattern: Pattern to match against (supports * and ? wildcards)
-            
-        Returns:
-            True if email matches pattern, False otherwise
-        """
-        return fnmatch.fnmatch(email, pattern)
@@ -1,5 +1,7 @@
 """HTTP approval plugin."""
-import requests
+import asyncio
+from typing import List, Optional, Tuple
+import httpx
 from loguru import logger
 from src.services.approval_plugins.base import ApprovalPlugin, ApprovalDecision
 
@@ -12,13 +14,70 @@ class HttpApprovalPlugin(ApprovalPlugin):
         Initialize HTTP plugin.
         
         Note:
-            Configuration parameters (endpoint, timeout) are set after instantiation
-            via setattr by the ConfigManager.
+            Configuration parameters (endpoint, timeout, connect_timeout,
+            max_connections, max_keepalive_connections, keepalive_expiry, http2,
+            batch_endpoint, batch_size) are set after instantiation via setattr
+            by the ConfigManager.
         """
         self.endpoint = ""
+        self.batch_endpoint = ""
+        self.batch_size = 100
         self.timeout = 5
+        self.connect_timeout = None
+        self.max_connections = 20
+        self.max_keepalive_connections = 10
+        self.keepalive_expiry = 30
+        self.http2 = False
+        self._client: Optional[httpx.AsyncClient] = None
         logger.info(f"HttpApprovalPlugin initialized")
     
+    async def startup(self) -> None:
+        """Open the shared connection pool."""
+        self._get_client()
+    
+    async def shutdown(self) -> None:
+        """Close the shared connection pool."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+            logger.info(f"HttpApprovalPlugin: closed connection pool to {self.endpoint}")
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared client, creating it on first use.
+        
+        Connections are kept alive and reused across requests, so the
+        TCP/TLS handshake is only paid once per pooled connection.
+        """
+        if self._client is None:
+            http2 = bool(self.http2)
+            if http2:
+                try:
+                    import h2  # noqa: F401
+                except ImportError:
+                    logger.warning("HttpApprovalPlugin: http2 requires the 'h2' package (httpx[http2]), using HTTP/1.1")
+                    http2 = False
+            
+            # Without connect_timeout, connecting shares the overall timeout
+            timeout = httpx.Timeout(float(self.timeout))
+            if self.connect_timeout is not None:
+                timeout = httpx.Timeout(float(self.timeout), connect=float(self.connect_timeout))
+            
+            self._client = httpx.AsyncClient(
+                http2=http2,
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_connections=int(self.max_connections),
+                    max_keepalive_connections=int(self.max_keepalive_connections),
+                    keepalive_expiry=float(self.keepalive_expiry)
+                )
+            )
+            logger.info(
+                f"HttpApprovalPlugin: opened connection pool to {self.endpoint} "
+                f"(max_connections={self.max_connections}, http2={http2})"
+            )
+        return self._client
+    
     async def evaluate(self, email: str, model: str, request_id: str) -> ApprovalDecision:
         """
         Query HTTP endpoint for approval decision.
@@ -30,7 +89,8 @@ class HttpApprovalPlugin(ApprovalPlugin):
             
         Returns:
             APPROVE, DENY, or CONTINUE based on endpoint response.
-            Returns CONTINUE on error or timeout.
+            Returns PENDING on error or timeout, so the request is retried
+            later and the failure is never cached as an answer.
         """
         payload = {
             "email": email,
@@ -44,49 +104,134 @@ class HttpApprovalPlugin(ApprovalPlugin):
                 f"for request_id={request_id}"
             )
             
-            response = requests.post(
-                self.endpoint,
-                json=payload,
-                timeout=self.timeout
-            )
+            response = await self._get_client().post(self.endpoint, json=payload)
             
             response.raise_for_status()
             
             response_data = response.json()
-            decision_str = response_data.get("decision", "").upper()
+            return self._parse_decision(response_data.get("decision"), request_id)
             
-            # Validate decision
-            if decision_str not in ["APPROVE", "DENY", "CONTINUE"]:
-                logger.warning(
-                    f"HttpApprovalPlugin: Invalid decision '{decision_str}' from endpoint "
-                    f"for request_id={request_id}, returning CONTINUE"
-                )
-                return ApprovalDecision.CONTINUE
-            
-            decision = ApprovalDecision(decision_str)
-            logger.info(
-                f"HttpApprovalPlugin: {decision.value} - received from endpoint "
-                f"for request_id={request_id}"
-            )
-            return decision
-            
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             logger.warning(
                 f"HttpApprovalPlugin: Request timeout to {self.endpoint} "
-                f"for request_id={request_id}, returning CONTINUE"
+                f"for request_id={request_id}, returning PENDING"
             )
-            return ApprovalDecision.CONTINUE
+            return ApprovalDecision.PENDING
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.warning(
                 f"HttpApprovalPlugin: Request error to {self.endpoint} "
-                f"for request_id={request_id}: {e}, returning CONTINUE"
+                f"for request_id={request_id}: {e}, returning PENDING"
             )
-            return ApprovalDecision.CONTINUE
+            return ApprovalDecision.PENDING
             
         except (ValueError, KeyError) as e:
             logger.warning(
                 f"HttpApprovalPlugin: Failed to parse response from {self.endpoint} "
-                f"for request_id={request_id}: {e}, returning CONTINUE"
+                f"for request_id={request_id}: {e}, returning PENDING"
+            )
+            return ApprovalDecision.PENDING
+    
+    async def evaluate_many(self, items: List[Tuple[str, str, str]]) -> List[ApprovalDecision]:
+        """
+        Query the batch endpoint for many approval decisions at once.
+        
+        Items are sent in chunks of batch_size, one POST per chunk:
+        {"requests": [{"email": ..., "model": ..., "request_id": ...}, ...]}
+        The endpoint answers with
+        {"decisions": [{"request_id": ..., "decision": "APPROVE"}, ...]}.
+        Without a batch_endpoint each item is sent to the single endpoint.
+        
+        Args:
+            items: (email, model, request_id) tuples
+            
+        Returns:
+            One decision per item, in the same order. Items missing from the
+            response get CONTINUE; all items of a chunk that failed get
+            PENDING, so they are retried like a failed single request.
+        """
+        if not self.batch_endpoint:
+            return await super().evaluate_many(items)
+        
+        size = max(1, int(self.batch_size))
+        chunks = [items[start:start + size] for start in range(0, len(items), size)]
+        results = await asyncio.gather(*(self._evaluate_chunk(chunk) for chunk in chunks))
+        return [decision for chunk_decisions in results for decision in chunk_decisions]
+    
+    async def _evaluate_chunk(self, items: List[Tuple[str, str, str]]) -> List[ApprovalDecision]:
+        """
+        Send one batch request.
+        
+        Args:
+            items: (email, model, request_id) tuples
+            
+        Returns:
+            One decision per item, in the same order
+        """
+        payload = {
+            "requests": [
+                {"email": email, "model": model, "request_id": request_id}
+                for email, model, request_id in items
+            ]
+        }
+        
+        try:
+            logger.debug(
+                f"HttpApprovalPlugin: Sending batch POST request to {self.batch_endpoint} "
+                f"for {len(items)} request(s)"
+            )
+            
+            response = await self._get_client().post(self.batch_endpoint, json=payload)
+            response.raise_for_status()
+            
+            received = {
+                entry["request_id"]: entry.get("decision")
+                for entry in response.json()["decisions"]
+            }
+            return [self._parse_decision(received.get(request_id), request_id) for _, _, request_id in items]
+            
+        except httpx.TimeoutException:
+            logger.warning(
+                f"HttpApprovalPlugin: Batch request timeout to {self.batch_endpoint} "
+                f"for {len(items)} request(s), returning PENDING"
+            )
+            
+        except httpx.HTTPError as e:
+            logger.warning(
+                f"HttpApprovalPlugin: Batch request error to {self.batch_endpoint} "
+                f"for {len(items)} request(s): {e}, returning PENDING"
+            )
+            
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(
+                f"HttpApprovalPlugin: Failed to parse batch response from {self.batch_endpoint} "
+                f"for {len(items)} request(s): {e}, returning PENDING"
+            )
+        
+        return [ApprovalDecision.PENDING] * len(items)
+    
+    def _parse_decision(self, value, request_id: str) -> ApprovalDecision:
+        """
+        Validate a decision received from the endpoint.
+        
+        Args:
+            value: Decision string from the response
+            request_id: Request identifier
+            
+        Returns:
+            The decision, or CONTINUE if it is missing or invalid
+        """
+        decision_str = str(value or "").upper()
+        if decision_str not in ["APPROVE", "DENY", "CONTINUE"]:
+            logger.warning(
+                f"HttpApprovalPlugin: Invalid decision '{decision_str}' from endpoint "
+                f"for request_id={request_id}, returning CONTINUE"
             )
             return ApprovalDecision.CONTINUE
+        
+        decision = ApprovalDecision(decision_str)
+        logger.info(
+            f"HttpApprovalPlugin: {decision.value} - received from endpoint "
+            f"for request_id={request_id}"
+        )
+        return decision
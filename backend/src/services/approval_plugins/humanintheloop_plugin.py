@@ -1,7 +1,7 @@
 """HumanInTheLoop approval plugin."""
-import fnmatch
 from loguru import logger
 from src.services.approval_plugins.base import ApprovalPlugin, ApprovalDecision
+from src.services.approval_plugins.pattern_matcher import PatternMatcher
 from injector import inject
 
 from src.services.email_service import EmailService
@@ -10,6 +10,9 @@ from src.services.email_service import EmailService
 class HumanintheloopApprovalPlugin(ApprovalPlugin):
     """Approval plugin that denies requests matching HumanInTheLoop patterns."""
 
+    # Notifies the reviewer, so it only runs when the chain actually reaches it
+    speculative = False
+
     @inject
     def __init__(self, email_service: EmailService):
         """
@@ -27,6 +30,12 @@ class HumanintheloopApprovalPlugin(ApprovalPlugin):
         self.patterns = []
         logger.info(f"HumanInTheLoopApprovalPlugin initialized")
     
+    def __setattr__(self, name, value):
+        """Override setattr to compile the pattern list whenever 'patterns' is set."""
+        if name == 'patterns':
+            super().__setattr__('matcher', PatternMatcher(value or []))
+        super().__setattr__(name, value)
+    
     async def evaluate(self, email: str, model: str, request_id: str) -> ApprovalDecision:
         """
         Evaluate if model matches HumanInTheLoop patterns.
@@ -39,37 +48,24 @@ class HumanintheloopApprovalPlugin(ApprovalPlugin):
         Returns:
             DENY if model matches any HumanInTheLoop pattern, CONTINUE otherwise
         """
-        logger.info(f"HumanInTheLoopApprovalPlugin evaluate for {email}, {model} and patterns {self.patterns}")
-        for pattern in self.patterns:
-            if self._matches_pattern(model, pattern):
-                logger.info(f"Model is marked for human review: '{model}' matches pattern '{pattern}' ")
-                if self.email is not None:
-                    request = f"""
+        logger.info(f"HumanInTheLoopApprovalPlugin evaluate for {email}, {model} against {len(self.matcher)} patterns")
+        pattern = self.matcher.match(model)
+        if pattern is not None:
+            logger.info(f"Model is marked for human review: '{model}' matches pattern '{pattern}' ")
+            if self.email is not None:
+                request = f"""
 A request was made for a model that requires human approval.
 Please review and approve or deny the request.
 
 Request ID: {request_id}
 Model: {model}
 User Email: {email}
-                    """
-                    await self.email_service.notify(self.email, request)
-                return ApprovalDecision.REVIEW
+                """
+                await self.email_service.notify(self.email, request)
+            return ApprovalDecision.REVIEW
 
         logger.debug(
             f"HumanInTheLoopApprovalPlugin: CONTINUE - model '{model}' does not match any HumanInTheLoop patterns "
             f"for request_id={request_id}"
         )
         return ApprovalDecision.CONTINUE
-    
-    def _matches_pattern(self, model: str, pattern: str) -> bool:
-        """
-        Check if model matches pattern with wildcard support.
-        
-        Args:
-            model: Model identifier to check
-            pattern: Pattern to match against (supports * and ? wildcards)
-            
-        Returns:
-            True if model matches pattern, False otherwise
-        """
-        return fnmatch.fnmatch(model, pattern)
@@ -0,0 +1,94 @@
+"""Compiled matcher for lists of shell-style wildcard patterns."""
+import fnmatch
+import re
+from typing import Iterable, Optional
+
+WILDCARDS = frozenset('*?[')
+
+
+def _is_literal(text: str) -> bool:
+    """Check whether text contains no wildcard characters."""
+    return not WILDCARDS.intersection(text)
+
+
+class PatternMatcher:
+    """
+    Matches values against many fnmatch-style patterns at once.
+
+    Patterns are compiled once, by shape:
+    - literals ("gpt-4") go into a hash set
+    - prefix patterns ("ollama/*") into a map keyed by prefix length
+    - suffix patterns ("*@company.com") into a map keyed by suffix length,
+      which makes email domain lists a few dict lookups
+    - anything else is translated into one combined regex
+
+    Matching is case-sensitive, like fnmatch on POSIX systems. When several
+    patterns match, the one listed first is reported.
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        """
+        Compile a pattern list.
+
+        Args:
+            patterns: Patterns supporting *, ? and [...] wildcards
+        """
+        self.patterns = [pattern for pattern in patterns if isinstance(pattern, str)]
+        self._exact: dict[str, int] = {}
+        self._prefixes: dict[int, dict[str, int]] = {}
+        self._suffixes: dict[int, dict[str, int]] = {}
+        regex_parts = []
+        self._regex_index: dict[str, int] = {}
+
+        for index, pattern in enumerate(self.patterns):
+            if _is_literal(pattern):
+                self._exact.setdefault(pattern, index)
+            elif pattern.endswith('*') and _is_literal(pattern[:-1]):
+                prefix = pattern[:-1]
+                self._prefixes.setdefault(len(prefix), {}).setdefault(prefix, index)
+            elif pattern.startswith('*') and _is_literal(pattern[1:]):
+                suffix = pattern[1:]
+                self._suffixes.setdefault(len(suffix), {}).setdefault(suffix, index)
+            else:
+                group = f'p{index}'
+                regex_parts.append(f'(?P<{group}>{fnmatch.translate(pattern)})')
+                self._regex_index[group] = index
+
+        self._regex = re.compile('|'.join(regex_parts)) if regex_parts else None
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def match(self, value: str) -> Optional[str]:
+        """
+        Find the pattern matching a value.
+
+        Args:
+            value: Value to check, e.g. a model identifier or an email address
+
+        Returns:
+            The first listed matching pattern, or None if none matches
+        """
+        best = self._exact.get(value)
+
+        for length, prefixes in self._prefixes.items():
+            if length <= len(value):
+                index = prefixes.get(value[:length])
+                if index is not None and (best is None or index < best):
+                    best = index
+
+        for length, suffixes in self._suffixes.items():
+            if length <= len(value):
+                index = suffixes.get(value[len(value) - length:])
+                if index is not None and (best is None or index < best):
+                    best = index
+
+        if self._regex is not None:
+            # Alternatives are tried in list order, so this is the first matching regex pattern
+            found = self._regex.match(value)
+            if found is not None:
+                index = self._regex_index[found.lastgroup]
+                if best is None or index < best:
+                    best = index
+
+        return None if best is None else self.patterns[best]
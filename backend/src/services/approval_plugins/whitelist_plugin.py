@@ -1,12 +1,14 @@
 """Whitelist approval plugin."""
-import fnmatch
 from loguru import logger
 from src.services.approval_plugins.base import ApprovalPlugin, ApprovalDecision
+from src.services.approval_plugins.pattern_matcher import PatternMatcher
 
 
 class WhitelistApprovalPlugin(ApprovalPlugin):
     """Approval plugin that approves requests matching whitelist patterns."""
     
+    is_local = True
+    
     def __init__(self):
         """
         Initialize whitelist plugin.
@@ -16,16 +18,17 @@ class WhitelistApprovalPlugin(ApprovalPlugin):
             via setattr by the ConfigManager.
         """
         self.list = []
-        self.patterns = []
         logger.info(f"WhitelistApprovalPlugin initialized")
     
     def __setattr__(self, name, value):
-        """Override setattr to handle 'list' parameter specially."""
-        if name == 'list':
-            # When 'list' is set, also update 'patterns' for internal use
+        """Override setattr to compile the pattern list whenever 'list' or 'patterns' is set."""
+        if name in ('list', 'patterns'):
+            # Keep both names for compatibility; matching uses the compiled matcher
+            super().__setattr__('list', value)
             super().__setattr__('patterns', value)
-            super().__setattr__(name, value)
-            logger.info(f"WhitelistApprovalPlugin configured with patterns: {value}")
+            super().__setattr__('matcher', PatternMatcher(value or []))
+            if value:
+                logger.info(f"WhitelistApprovalPlugin configured with {len(value)} patterns")
         else:
             super().__setattr__(name, value)
     
@@ -41,29 +44,16 @@ class WhitelistApprovalPlugin(ApprovalPlugin):
         Returns:
             APPROVE if model matches any whitelist pattern, CONTINUE otherwise
         """
-        for pattern in self.patterns:
-            if self._matches_pattern(model, pattern):
-                logger.info(
-                    f"WhitelistApprovalPlugin: APPROVE - model '{model}' matches pattern '{pattern}' "
-                    f"for request_id={request_id}"
-                )
-                return ApprovalDecision.APPROVE
+        pattern = self.matcher.match(model)
+        if pattern is not None:
+            logger.info(
+                f"WhitelistApprovalPlugin: APPROVE - model '{model}' matches pattern '{pattern}' "
+                f"for request_id={request_id}"
+            )
+            return ApprovalDecision.APPROVE
         
         logger.debug(
             f"WhitelistApprovalPlugin: CONTINUE - model '{model}' does not match any whitelist patterns "
             f"for request_id={request_id}"
         )
         return ApprovalDecision.CONTINUE
-    
-    def _matches_pattern(self, model: str, pattern: str) -> bool:
-        """
-        Check if model matches pattern with wildcard support.
-        
-        Args:
-            model: Model identifier to check
-            pattern: Pattern to match against (supports * and ? wildcards)
-            
-        Returns:
-            True if model matches pattern, False otherwise
-        """
-        return fnmatch.fnmatch(model, pattern)
@@ -1,12 +1,35 @@
 """Approval Service for processing key request approvals."""
-from typing import List
+import asyncio
+import functools
+import os
+import socket
+import uuid
+from typing import Awaitable, Callable, List, Optional, Tuple, Union
 from loguru import logger
-from src.models.key_request import ApprovalResponse, KeyRequestState, KeyRequestData
+from src.models.key_request import (
+    ApprovalResponse,
+    KeyRequestState,
+    KeyRequestData,
+    KeyRequestUpdate,
+    WriteResult,
+)
 from src.services.approval_plugins.base import ApprovalPlugin, ApprovalDecision
-from src.services.kubernetes_secret_service import KubernetesSecretService
+from src.services.decision_cache import DecisionCache
+from src.services.key_request_store import KeyRequestStore, RequestConflictError, RequestLeaseError
 from src.services.email_service import EmailService
 from src.litellm.manager import KeyManagement
 
+# Maximum number of notification emails sent concurrently
+NOTIFICATION_CONCURRENCY = 4
+
+
+class RequestActionError(RuntimeError):
+    """Raised when a decision could not be carried out for a request."""
+
+
+class RequestNotFoundError(RequestActionError):
+    """Raised when the request to act on does not exist (anymore)."""
+
 
 class ApprovalService:
     """Service for handling approval workflow using chain-of-responsibility pattern."""
@@ -14,26 +37,38 @@ class ApprovalService:
     def __init__(
         self,
         plugins: List[ApprovalPlugin],
-        k8s_service: KubernetesSecretService,
+        k8s_service: KeyRequestStore,
         email_service: EmailService,
         key_manager: KeyManagement,
         litellm_config: dict,
+        lease_duration: float = 120.0,
+        speculative: bool = False,
+        decision_cache: Optional[DecisionCache] = None,
     ):
         """
         Initialize approval service with plugins and dependencies.
         
         Args:
             plugins: List of approval plugins to evaluate in sequence
-            k8s_service: Kubernetes secret service for state updates
+            k8s_service: Key request store for state updates
             email_service: Email service for notifications
             key_manager: LiteLLM key management service
             litellm_config: LiteLLM configuration
+            lease_duration: Seconds a request stays leased while its action runs
+            speculative: Start plugins concurrently instead of one after another
+            decision_cache: Cache for the decisions of plugins that opt in
         """
         self.plugins = plugins
         self.k8s_service = k8s_service
         self.email_service = email_service
         self.key_manager = key_manager
         self.litellm_config = litellm_config
+        self.lease_duration = lease_duration
+        self.speculative = speculative
+        self.decision_cache = decision_cache or DecisionCache()
+        self.identity = f"{socket.gethostname()}-{os.getpid()}"
+        self._notification_semaphore = asyncio.Semaphore(NOTIFICATION_CONCURRENCY)
+        self._background_tasks: set[asyncio.Task] = set()
         logger.info(f"ApprovalService initialized with {len(plugins)} plugins")
     
     async def process(self, email: str, model: str, request_id: str) -> ApprovalResponse:
@@ -43,6 +78,10 @@ class ApprovalService:
         Plugins are evaluated in sequence until one returns APPROVE or DENY.
         If all plugins return CONTINUE, the request is denied by default.
         
+        In speculative mode, plugins that allow it are started concurrently
+        up front; the decision is still the first non-CONTINUE result in
+        chain order, and evaluations that are no longer needed are cancelled.
+        
         Args:
             email: User email address
             model: LLM model identifier
@@ -64,61 +103,294 @@ class ApprovalService:
                 can_retry=False
             )
         
+        # Speculative evaluations, started before their turn in the chain
+        started: dict[int, asyncio.Task] = {}
+        if self.speculative and len(self.plugins) > 1:
+            started = {
+                i: asyncio.create_task(self._evaluate_plugin(i, plugin, email, model, request_id))
+                for i, plugin in enumerate(self.plugins)
+                if plugin.speculative
+            }
+        
+        try:
+            for i, plugin in enumerate(self.plugins):
+                plugin_name = plugin.__class__.__name__
+                logger.debug(
+                    f"Evaluating plugin {i+1}/{len(self.plugins)}: {plugin_name} "
+                    f"for request_id={request_id}"
+                )
+                
+                if i in started:
+                    decision = await started.pop(i)
+                else:
+                    decision = await self._evaluate_plugin(i, plugin, email, model, request_id)
+                logger.debug(f"decision={decision}")
+                
+                response = self._decision_response(decision, plugin_name, request_id)
+                if response is not None:
+                    return response
+                
+                # decision == ApprovalDecision.CONTINUE, continue to next plugin
+                logger.debug(
+                    f"{plugin_name} returned CONTINUE for request_id={request_id}"
+                )
+            
+            return self._default_response(request_id)
+        finally:
+            await self._cancel_speculative(list(started.values()))
+    
+    async def process_many(self, items: List[Tuple[str, str, str]]) -> List[ApprovalResponse]:
+        """
+        Process several approval requests through the plugin chain.
+        
+        Each plugin is asked once, via evaluate_many(), about all requests
+        that are still undecided when the chain reaches it. Decisions are
+        the same as calling process() per request; speculative evaluation
+        does not apply.
+        
+        Args:
+            items: (email, model, request_id) tuples
+            
+        Returns:
+            One ApprovalResponse per item, in the same order
+        """
+        if not items:
+            return []
+        logger.info(f"Processing approval for batch of {len(items)} request(s)")
+        
+        if not self.plugins:
+            logger.warning(f"No approval plugins configured - denying {len(items)} request(s)")
+            return [
+                ApprovalResponse(
+                    state=KeyRequestState.DENIED,
+                    reason="No approval plugins configured",
+                    can_retry=False
+                )
+                for _ in items
+            ]
+        
+        responses: List[Optional[ApprovalResponse]] = [None] * len(items)
+        undecided = list(range(len(items)))
         for i, plugin in enumerate(self.plugins):
+            if not undecided:
+                break
             plugin_name = plugin.__class__.__name__
             logger.debug(
                 f"Evaluating plugin {i+1}/{len(self.plugins)}: {plugin_name} "
-                f"for request_id={request_id}"
+                f"for {len(undecided)} request(s)"
             )
             
-            decision = await plugin.evaluate(email, model, request_id)
-            logger.debug(f"decision={decision}")
+            decisions = await self._evaluate_plugin_many(i, plugin, [items[j] for j in undecided])
+            still_undecided = []
+            for j, decision in zip(undecided, decisions):
+                response = self._decision_response(decision, plugin_name, items[j][2])
+                if response is None:
+                    still_undecided.append(j)
+                else:
+                    responses[j] = response
+            undecided = still_undecided
+        
+        for j in undecided:
+            responses[j] = self._default_response(items[j][2])
+        return responses
+    
+    async def _evaluate_plugin(
+        self,
+        index: int,
+        plugin: ApprovalPlugin,
+        email: str,
+        model: str,
+        request_id: str
+    ) -> ApprovalDecision:
+        """
+        Evaluate a plugin, using the decision cache if the plugin opted in.
+        
+        Args:
+            index: Position of the plugin in the chain
+            plugin: Plugin to evaluate
+            email: User email address
+            model: LLM model identifier
+            request_id: Request identifier
             
-            if decision == ApprovalDecision.APPROVE:
-                logger.info(
-                    f"Request approved by {plugin_name} for request_id={request_id}"
-                )
-                return ApprovalResponse(
-                    state=KeyRequestState.APPROVED,
-                    reason=f"Approved by {plugin_name}",
-                    can_retry=False
-                )
-
-            elif decision == ApprovalDecision.REVIEW:
-                logger.info(
-                    f"Request marked REVIEW by {plugin_name} for request_id={request_id}"
-                )
-                return ApprovalResponse(
-                    state=KeyRequestState.REVIEW,
-                    reason=f"review by {plugin_name}",
-                    can_retry=False
-                )
-
-            elif decision == ApprovalDecision.PENDING:
-                logger.info(
-                    f"Request marked PENDING by {plugin_name} for request_id={request_id}"
-                )
-                return ApprovalResponse(
-                    state=KeyRequestState.PENDING,
-                    reason=f"Pending by {plugin_name}",
-                    can_retry=True
-                )
+        Returns:
+            The plugin's (possibly cached) decision
+        """
+        if not (plugin.cache_ttl or plugin.negative_cache_ttl):
+            return await plugin.evaluate(email, model, request_id)
+        
+        key = self._plugin_key(index, plugin)
+        cached = self.decision_cache.get(key, email, model)
+        if cached is not None:
+            logger.debug(f"Using cached decision {cached.value} of {key} for request_id={request_id}")
+            return cached
+        
+        decision = await plugin.evaluate(email, model, request_id)
+        self.decision_cache.put(key, email, model, decision, self._cache_ttl(plugin, decision))
+        return decision
+    
+    async def _evaluate_plugin_many(
+        self,
+        index: int,
+        plugin: ApprovalPlugin,
+        items: List[Tuple[str, str, str]]
+    ) -> List[ApprovalDecision]:
+        """
+        Batch variant of _evaluate_plugin; only cache misses reach the plugin.
+        
+        Args:
+            index: Position of the plugin in the chain
+            plugin: Plugin to evaluate
+            items: (email, model, request_id) tuples
             
-            elif decision == ApprovalDecision.DENY:
-                logger.info(
-                    f"Request denied by {plugin_name} for request_id={request_id}"
-                )
-                return ApprovalResponse(
-                    state=KeyRequestState.DENIED,
-                    reason=f"Denied by {plugin_name}",
-                    can_retry=False
-                )
+        Returns:
+            One (possibly cached) decision per item, in the same order
+        """
+        if not (plugin.cache_ttl or plugin.negative_cache_ttl):
+            return await plugin.evaluate_many(items)
+        
+        key = self._plugin_key(index, plugin)
+        decisions: List[Optional[ApprovalDecision]] = [
+            self.decision_cache.get(key, email, model) for email, model, _ in items
+        ]
+        misses = [j for j, decision in enumerate(decisions) if decision is None]
+        if misses:
+            evaluated = await plugin.evaluate_many([items[j] for j in misses])
+            for j, decision in zip(misses, evaluated):
+                decisions[j] = decision
+                email, model, _ = items[j]
+                self.decision_cache.put(key, email, model, decision, self._cache_ttl(plugin, decision))
+        return decisions
+    
+    @staticmethod
+    def _cache_ttl(plugin: ApprovalPlugin, decision: ApprovalDecision) -> float:
+        """Seconds a plugin's decision may be cached; PENDING is never cached."""
+        if decision == ApprovalDecision.CONTINUE:
+            return plugin.negative_cache_ttl
+        if decision == ApprovalDecision.PENDING:
+            return 0
+        return plugin.cache_ttl
+    
+    @staticmethod
+    def _plugin_key(index: int, plugin: ApprovalPlugin) -> str:
+        """Cache key of a plugin; the chain position tells apart plugins of the same class."""
+        return f"{index}:{plugin.__class__.__name__}"
+    
+    def invalidate_decision_cache(self, plugin: Optional[str] = None) -> int:
+        """
+        Drop cached plugin decisions, e.g. after a plugin's policy changed.
+        
+        Args:
+            plugin: Only drop the decisions of this plugin key ("<index>:<class name>")
             
-            # decision == ApprovalDecision.CONTINUE, continue to next plugin
-            logger.debug(
-                f"{plugin_name} returned CONTINUE for request_id={request_id}"
+        Returns:
+            Number of dropped entries
+        """
+        dropped = self.decision_cache.invalidate(plugin)
+        logger.info(f"Invalidated {dropped} cached decision(s)" + (f" of {plugin}" if plugin else ""))
+        return dropped
+    
+    async def _cancel_speculative(self, tasks: List[asyncio.Task]) -> None:
+        """Cancel speculative evaluations whose result is not needed."""
+        for task in tasks:
+            task.cancel()
+        # Collect results and errors so unneeded failures are not reported
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def evaluate_local(self, email: str, model: str, request_id: str) -> Optional[ApprovalResponse]:
+        """
+        Run the leading local plugins of the chain.
+        
+        Evaluation stops at the first plugin that is not local. Only final
+        decisions (APPROVED, DENIED) are returned; REVIEW and PENDING are
+        left to the queue processor, which runs the whole chain.
+        
+        Args:
+            email: User email address
+            model: LLM model identifier
+            request_id: Request identifier
+            
+        Returns:
+            ApprovalResponse if the local plugins decided, None otherwise
+        """
+        if not self.plugins:
+            return None
+        
+        for i, plugin in enumerate(self.plugins):
+            if not plugin.is_local:
+                return None
+            
+            decision = await self._evaluate_plugin(i, plugin, email, model, request_id)
+            response = self._decision_response(decision, plugin.__class__.__name__, request_id)
+            if response is None:
+                continue
+            if response.state in (KeyRequestState.APPROVED, KeyRequestState.DENIED):
+                return response
+            return None
+        
+        # The whole chain is local and returned CONTINUE
+        return self._default_response(request_id)
+    
+    def _decision_response(
+        self,
+        decision: ApprovalDecision,
+        plugin_name: str,
+        request_id: str
+    ) -> Optional[ApprovalResponse]:
+        """
+        Map a plugin decision to an ApprovalResponse.
+        
+        Args:
+            decision: Decision returned by the plugin
+            plugin_name: Name of the deciding plugin
+            request_id: Request identifier
+            
+        Returns:
+            ApprovalResponse, or None for CONTINUE
+        """
+        if decision == ApprovalDecision.APPROVE:
+            logger.info(
+                f"Request approved by {plugin_name} for request_id={request_id}"
+            )
+            return ApprovalResponse(
+                state=KeyRequestState.APPROVED,
+                reason=f"Approved by {plugin_name}",
+                can_retry=False
+            )
+
+        elif decision == ApprovalDecision.REVIEW:
+            logger.info(
+                f"Request marked REVIEW by {plugin_name} for request_id={request_id}"
+            )
+            return ApprovalResponse(
+                state=KeyRequestState.REVIEW,
+                reason=f"review by {plugin_name}",
+                can_retry=False
+            )
+
+        elif decision == ApprovalDecision.PENDING:
+            logger.info(
+                f"Request marked PENDING by {plugin_name} for request_id={request_id}"
+            )
+            return ApprovalResponse(
+                state=KeyRequestState.PENDING,
+                reason=f"Pending by {plugin_name}",
+                can_retry=True
             )
         
+        elif decision == ApprovalDecision.DENY:
+            logger.info(
+                f"Request denied by {plugin_name} for request_id={request_id}"
+            )
+            return ApprovalResponse(
+                state=KeyRequestState.DENIED,
+                reason=f"Denied by {plugin_name}",
+                can_retry=False
+            )
+        
+        return None
+    
+    def _default_response(self, request_id: str) -> ApprovalResponse:
+        """Response when all plugins returned CONTINUE."""
         # All plugins returned CONTINUE - deny by default
         logger.info(
             f"All plugins returned CONTINUE - denying request_id={request_id} by default"
@@ -133,9 +405,282 @@ class ApprovalService:
         """
         Execute actions based on approval decision.
         
+        The request's processing lease is taken first, so the same request
+        is never acted on twice concurrently (e.g. by an admin and the queue).
+        
         Args:
             approval_response: The decision from the process() method
             request: The key request data to process
+            
+        Raises:
+            RequestConflictError: If the request is leased by another actor
+                or was moved to another state concurrently
+            RequestNotFoundError: If the request does not exist
+            RequestActionError: If the decision could not be written
+        """
+        for result in await self.take_action_many([(approval_response, request)]):
+            if result.success:
+                continue
+            if result.conflict:
+                raise RequestConflictError(result.error)
+            if result.not_found:
+                raise RequestNotFoundError(result.error)
+            raise RequestActionError(result.error)
+    
+    async def take_action_many(
+        self,
+        decisions: List[Tuple[ApprovalResponse, KeyRequestData]],
+        timeout: Optional[float] = None
+    ) -> List[WriteResult]:
+        """
+        Execute actions for a batch of approval decisions.
+        
+        Every request is leased before any external call is made; requests
+        leased by someone else or no longer in the state the decision was
+        based on are skipped. API keys are then generated concurrently, all
+        state updates (which also clear the leases) are written with a single
+        update_many call, and notifications are sent only for requests whose
+        update succeeded.
+        
+        Args:
+            decisions: (approval_response, request) pairs
+            timeout: Seconds the leased requests may take until their state
+                update is written; should be shorter than the lease duration.
+                Requests not written in time are reported as failed.
+            
+        Returns:
+            WriteResults of the lease acquisitions that failed and of the
+            state updates
+        """
+        # One owner per batch: concurrent batches of this process exclude each other too
+        owner = self._lease_owner()
+        leases = await asyncio.gather(*(self._acquire_lease(request, owner) for _, request in decisions))
+        
+        results: List[WriteResult] = []
+        leased: List[Tuple[ApprovalResponse, KeyRequestData]] = []
+        for (approval_response, _), lease in zip(decisions, leases):
+            if isinstance(lease, WriteResult):
+                results.append(lease)
+            else:
+                leased.append((approval_response, lease))
+        
+        results.extend(await self._act_on_leased(leased, owner, timeout))
+        return results
+    
+    async def submit_inline(self, request: KeyRequestData) -> Optional[ApprovalResponse]:
+        """
+        Decide a newly created request with the local plugins, if possible.
+        
+        When the leading local plugins decide, the request is leased right
+        away (so the queue processor leaves it alone) and key generation,
+        the state update and the notification run in the background.
+        
+        Args:
+            request: Newly created pending request
+            
+        Returns:
+            The decision, or None if the request is left to the queue
+        """
+        approval_response = await self.evaluate_local(request.email, request.model, request.request_id)
+        if approval_response is None:
+            return None
+        
+        owner = self._lease_owner()
+        lease = await self._acquire_lease(request, owner)
+        if isinstance(lease, WriteResult):
+            # The queue processor got there first
+            return None
+        
+        task = asyncio.create_task(self._act_on_leased([(approval_response, lease)], owner))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        logger.info(f"Request {request.request_id} decided inline: {approval_response.state.value}")
+        return approval_response
+    
+    async def start(self) -> None:
+        """Start up all plugins, e.g. to open their connection pools."""
+        for plugin in self.plugins:
+            await plugin.startup()
+    
+    async def stop(self, timeout: float = 30.0) -> None:
+        """
+        Wait for actions running in the background, then shut down all plugins.
+        
+        Leases of actions that do not finish in time expire, and the queue
+        processor picks the requests up again.
+        
+        Args:
+            timeout: Seconds to wait
+        """
+        if self._background_tasks:
+            logger.info(f"Waiting for {len(self._background_tasks)} background action(s)")
+            _, pending = await asyncio.wait(set(self._background_tasks), timeout=timeout)
+            for task in pending:
+                task.cancel()
+        
+        for plugin in self.plugins:
+            try:
+                await plugin.shutdown()
+            except Exception as e:
+                logger.warning(f"Failed to shut down {plugin.__class__.__name__}: {e}")
+    
+    def _lease_owner(self) -> str:
+        """New lease owner identity for one batch of actions."""
+        return f"{self.identity}-{uuid.uuid4().hex[:8]}"
+    
+    async def _act_on_leased(
+        self,
+        leased: List[Tuple[ApprovalResponse, KeyRequestData]],
+        owner: str,
+        timeout: Optional[float] = None
+    ) -> List[WriteResult]:
+        """
+        Carry out decisions for requests leased by owner.
+        
+        Args:
+            leased: (approval_response, leased request) pairs
+            owner: Lease owner the requests were leased with
+            timeout: Seconds until the state updates must be written;
+                notifications are sent afterwards and are not bounded by it
+            
+        Returns:
+            WriteResults of the state updates and of the decisions that
+            failed before writing; decisions that leave the request pending
+            have none
+        """
+        try:
+            results, notifications, unwritten = await asyncio.wait_for(self._write_decisions(leased, owner), timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Actions for {len(leased)} request(s) were not written within {timeout}s")
+            # Leases of requests that were written are already cleared, releasing them is a no-op
+            await asyncio.gather(*(self.k8s_service.release_lease(r.request_id, owner) for _, r in leased))
+            return [
+                WriteResult(request_id=request.request_id, success=False, error=f"Not written within {timeout}s")
+                for _, request in leased
+            ]
+        
+        # Give back leases of requests that were not written, so they can be retried right away
+        await asyncio.gather(*(self.k8s_service.release_lease(r.request_id, owner) for r in unwritten))
+        await asyncio.gather(*(self._send_notification(request, notify) for request, notify in notifications))
+        return results
+    
+    async def _write_decisions(
+        self,
+        leased: List[Tuple[ApprovalResponse, KeyRequestData]],
+        owner: str
+    ) -> Tuple[
+        List[WriteResult],
+        List[Tuple[KeyRequestData, Callable[[], Awaitable[bool]]]],
+        List[KeyRequestData]
+    ]:
+        """
+        Plan the decisions for leased requests and write their state updates.
+        
+        Args:
+            leased: (approval_response, leased request) pairs
+            owner: Lease owner the requests were leased with
+            
+        Returns:
+            WriteResults as returned by _act_on_leased, the (request,
+            notification) pairs of the successful updates, and the requests
+            that were not written and are still leased
+        """
+        results: List[WriteResult] = []
+        notifications: List[Tuple[KeyRequestData, Callable[[], Awaitable[bool]]]] = []
+        plans = await asyncio.gather(
+            *(self._plan_action(approval_response, request, owner) for approval_response, request in leased),
+            return_exceptions=True
+        )
+        
+        planned: List[Tuple[KeyRequestData, KeyRequestUpdate, Optional[Callable[[], Awaitable[bool]]]]] = []
+        unplanned: List[KeyRequestData] = []
+        for (_, request), plan in zip(leased, plans):
+            if isinstance(plan, Exception):
+                logger.error(f"Error taking action for request {request.request_id}: {plan}", exc_info=plan)
+                results.append(WriteResult(
+                    request_id=request.request_id,
+                    success=False,
+                    error=str(plan) or type(plan).__name__
+                ))
+                unplanned.append(request)
+            elif plan is None:
+                unplanned.append(request)
+            else:
+                planned.append((request, *plan))
+        
+        if planned:
+            write_results = await self.k8s_service.update_many([update for _, update, _ in planned])
+            results.extend(write_results)
+            results_by_id = {result.request_id: result for result in write_results}
+            
+            for request, update, notify in planned:
+                result = results_by_id[request.request_id]
+                if result.conflict:
+                    logger.warning(f"Skipping action for request {request.request_id}: {result.error}")
+                elif not result.success:
+                    logger.error(f"Error taking action for request {request.request_id}: {result.error}")
+                    unplanned.append(request)
+                else:
+                    if update.changes['state'] == KeyRequestState.REVIEW:
+                        logger.info(f"Request {request.request_id} marked for review")
+                    if notify is not None:
+                        notifications.append((request, notify))
+        
+        return results, notifications, unplanned
+    
+    async def _acquire_lease(self, request: KeyRequestData, owner: str) -> Union[KeyRequestData, WriteResult]:
+        """
+        Lease a request for taking action on it.
+        
+        Args:
+            request: The key request the decision was based on
+            owner: Lease owner of the current batch
+            
+        Returns:
+            The leased request, or a failed WriteResult
+        """
+        try:
+            leased = await self.k8s_service.acquire_lease(
+                request.request_id,
+                owner,
+                self.lease_duration,
+                expected_state=request.state
+            )
+        except RequestLeaseError as e:
+            logger.warning(f"Skipping action for request {request.request_id}: {e}")
+            return WriteResult(request_id=request.request_id, success=False, error=str(e), conflict=True)
+        except Exception as e:
+            logger.error(f"Error leasing request {request.request_id}: {e}")
+            return WriteResult(request_id=request.request_id, success=False, error=str(e) or type(e).__name__)
+        
+        if leased is None:
+            return WriteResult(
+                request_id=request.request_id,
+                success=False,
+                error=f"Request not found: {request.request_id}",
+                not_found=True
+            )
+        return leased
+    
+    async def _plan_action(
+        self,
+        approval_response: ApprovalResponse,
+        request: KeyRequestData,
+        owner: str
+    ) -> Optional[Tuple[KeyRequestUpdate, Optional[Callable[[], Awaitable[bool]]]]]:
+        """
+        Prepare the state update and notification for a decision.
+        
+        For approvals the API key is generated here; if that fails the
+        request is denied instead. The update releases the lease.
+        
+        Args:
+            approval_response: The decision from the process() method
+            request: The leased key request
+            owner: Lease owner of the current batch
+            
+        Returns:
+            (update, notification) pair, or None if nothing is written
         """
         key_alias = f"user-{request.email}-{request.model}"
         
@@ -144,95 +689,97 @@ class ApprovalService:
             f"state={approval_response.state.value}, reason={approval_response.reason}"
         )
         
-        try:
-            if approval_response.state == KeyRequestState.APPROVED:
-                # Generate API key using LiteLLM
-                try:
-                    # Delete existing key if any
-                    self.key_manager.delete_key(
-                        litellm_host=self.litellm_config.base_url,
-                        litellm_api_key=self.litellm_config.api_key,
-                        key_alias=key_alias,
-                    )
-                    logger.info(f"Deleted existing API key for request {request.request_id}")
-
-                    # Generate new key
-                    api_key = self.key_manager.generate_key(
-                        litellm_host=self.litellm_config.base_url,
-                        litellm_api_key=self.litellm_config.api_key,
-                        user_id=request.email,
-                        key_alias=key_alias,
-                        key_name=f"{request.email} - {request.model}",
-                        models=[request.model]
-                    )
-                    
-                    logger.info(f"Generated API key for request {request.request_id}")
-                    
-                    # Send approval email with API key
-                    email_sent = await self.email_service.send_approval_notification(
-                        email=request.email,
-                        model=request.model,
-                        api_key=api_key,
-                        gateway_url=self.litellm_config.gateway_url
-                    )
-
-                    if email_sent:
-                        logger.info(f"Approval notification sent to {request.email}")
-                    else:
-                        logger.warning(f"Failed to send approval notification to {request.email}")
-
-                    # Update secret with approved state and API key
-                    await self.k8s_service.update(
-                        request.request_id,
-                        state=KeyRequestState.APPROVED,
-                        api_key=api_key
-                    )
-                    
-                except Exception as e:
-                    logger.error(f"Error generating API key for {request.request_id}: {e}", exc_info=True)
-                    # Update to denied state on key generation failure
-                    await self.k8s_service.update(
-                        request.request_id,
-                        state=KeyRequestState.DENIED
-                    )
-                    
-                    # Send denial email
-                    await self.email_service.send_denial_notification(
-                        email=request.email,
-                        model=request.model,
-                        reason=f"Failed to generate API key: {str(e)}"
-                    )
-            
-            elif approval_response.state == KeyRequestState.DENIED:
-                # Update to denied state
-                await self.k8s_service.update(
-                    request.request_id,
-                    state=KeyRequestState.DENIED
+        def state_update(state: KeyRequestState, **changes) -> KeyRequestUpdate:
+            return KeyRequestUpdate(
+                request_id=request.request_id,
+                changes={'state': state, 'lease_owner': None, 'lease_expires_at': None, **changes},
+                resource_version=request.resource_version,
+                expected_state=request.state,
+                lease_holder=owner
+            )
+        
+        def denial(reason: str) -> Callable[[], Awaitable[bool]]:
+            return functools.partial(
+                self.email_service.send_denial_notification,
+                email=request.email,
+                model=request.model,
+                reason=reason
+            )
+        
+        if approval_response.state == KeyRequestState.APPROVED:
+            # Generate API key using LiteLLM
+            try:
+                # Delete existing key if any (LiteLLM calls are blocking, run them off the event loop)
+                await asyncio.to_thread(
+                    self.key_manager.delete_key,
+                    litellm_host=self.litellm_config.base_url,
+                    litellm_api_key=self.litellm_config.api_key,
+                    key_alias=key_alias,
                 )
+                logger.info(f"Deleted existing API key for request {request.request_id}")
                 
-                # Send denial email
-                email_sent = await self.email_service.send_denial_notification(
-                    email=request.email,
-                    model=request.model,
-                    reason=approval_response.reason
+                # Generate new key
+                api_key = await asyncio.to_thread(
+                    self.key_manager.generate_key,
+                    litellm_host=self.litellm_config.base_url,
+                    litellm_api_key=self.litellm_config.api_key,
+                    user_id=request.email,
+                    key_alias=key_alias,
+                    key_name=f"{request.email} - {request.model}",
+                    models=[request.model]
                 )
                 
-                if email_sent:
-                    logger.info(f"Denial notification sent to {request.email}")
-                else:
-                    logger.warning(f"Failed to send denial notification to {request.email}")
+                logger.info(f"Generated API key for request {request.request_id}")
+            except Exception as e:
+                logger.error(f"Error generating API key for {request.request_id}: {e}", exc_info=True)
+                # Update to denied state on key generation failure
+                return (
+                    state_update(KeyRequestState.DENIED),
+                    denial(f"Failed to generate API key: {str(e)}")
+                )
             
-            elif approval_response.state == KeyRequestState.PENDING:
-                # Still pending, will retry in next cycle
-                logger.info(f"Request {request.request_id} still pending, will retry in next cycle")
-
-            elif approval_response.state == KeyRequestState.REVIEW:
-                # Update secret with review state
-                await self.k8s_service.update(
-                    request.request_id,
-                    state=KeyRequestState.REVIEW,
+            # Update secret with approved state and API key, then send approval email
+            return (
+                state_update(KeyRequestState.APPROVED, api_key=api_key),
+                functools.partial(
+                    self.email_service.send_approval_notification,
+                    email=request.email,
+                    model=request.model,
+                    api_key=api_key,
+                    gateway_url=self.litellm_config.gateway_url
                 )
-                logger.info(f"Request {request.request_id} marked for review")
-                
-        except Exception as e:
-            logger.error(f"Error taking action for request {request.request_id}: {e}", exc_info=True)
+            )
+        
+        elif approval_response.state == KeyRequestState.DENIED:
+            return state_update(KeyRequestState.DENIED), denial(approval_response.reason)
+        
+        elif approval_response.state == KeyRequestState.REVIEW:
+            return state_update(KeyRequestState.REVIEW), None
+        
+        # Still pending, will retry in next cycle
+        logger.info(f"Request {request.request_id} still pending, will retry in next cycle")
+        return None
+    
+    async def _send_notification(
+        self,
+        request: KeyRequestData,
+        notify: Callable[[], Awaitable[bool]]
+    ) -> None:
+        """
+        Send a notification email with bounded concurrency.
+        
+        Args:
+            request: The key request the notification is about
+            notify: Coroutine function sending the email
+        """
+        async with self._notification_semaphore:
+            try:
+                email_sent = await notify()
+            except Exception as e:
+                logger.error(f"Error sending notification for request {request.request_id}: {e}", exc_info=True)
+                return
+        
+        if email_sent:
+            logger.info(f"Notification for request {request.request_id} sent to {request.email}")
+        else:
+            logger.warning(f"Failed to send notification for request {request.request_id} to {request.email}")
@@ -0,0 +1,114 @@
+"""TTL cache for approval plugin decisions."""
+import time
+from collections import OrderedDict
+from typing import Optional
+from src.services.approval_plugins.base import ApprovalDecision
+
+
+class DecisionCache:
+    """
+    Bounded LRU cache of plugin decisions per (plugin, email, model).
+
+    Entries expire after the TTL given when they are stored. Once the cache
+    is full the least recently used entry is evicted. Hits and misses are
+    counted per plugin.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached decisions
+        """
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[tuple[str, str, str], tuple[ApprovalDecision, float]] = OrderedDict()
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+        self.evictions = 0
+
+    def get(self, plugin: str, email: str, model: str) -> Optional[ApprovalDecision]:
+        """
+        Look up a cached decision.
+
+        Args:
+            plugin: Plugin key
+            email: User email address
+            model: LLM model identifier
+
+        Returns:
+            The cached decision, or None on a miss or expired entry
+        """
+        key = (plugin, email, model)
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] <= time.monotonic():
+            del self._entries[key]
+            entry = None
+
+        if entry is None:
+            self._misses[plugin] = self._misses.get(plugin, 0) + 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits[plugin] = self._hits.get(plugin, 0) + 1
+        return entry[0]
+
+    def put(self, plugin: str, email: str, model: str, decision: ApprovalDecision, ttl: float) -> None:
+        """
+        Store a decision.
+
+        Args:
+            plugin: Plugin key
+            email: User email address
+            model: LLM model identifier
+            decision: Decision to cache
+            ttl: Seconds the decision stays valid; nothing is stored if <= 0
+        """
+        if ttl <= 0:
+            return
+        key = (plugin, email, model)
+        self._entries[key] = (decision, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, plugin: Optional[str] = None) -> int:
+        """
+        Drop cached decisions.
+
+        Args:
+            plugin: Only drop the decisions of this plugin key
+
+        Returns:
+            Number of dropped entries
+        """
+        if plugin is None:
+            dropped = len(self._entries)
+            self._entries.clear()
+        else:
+            keys = [key for key in self._entries if key[0] == plugin]
+            for key in keys:
+                del self._entries[key]
+            dropped = len(keys)
+        return dropped
+
+    def stats(self) -> dict:
+        """
+        Cache counters.
+
+        Returns:
+            Size, limits, totals and per-plugin hit/miss counts
+        """
+        plugins = sorted(set(self._hits) | set(self._misses))
+        return {
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': sum(self._hits.values()),
+            'misses': sum(self._misses.values()),
+            'evictions': self.evictions,
+            'plugins': {
+                plugin: {'hits': self._hits.get(plugin, 0), 'misses': self._misses.get(plugin, 0)}
+                for plugin in plugins
+            },
+        }
@@ -0,0 +1,594 @@
+"""Storage backend interface for key requests."""
+import asyncio
+import gzip
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from loguru import logger
+
+from src.models.key_request import (
+    KeyRequestData,
+    KeyRequestState,
+    KeyRequestSummary,
+    KeyRequestUpdate,
+    WriteResult,
+)
+
+# Fields that may be changed by update(); everything else is fixed at creation
+MUTABLE_FIELDS = ('state', 'api_key', 'attempts', 'next_attempt_at', 'lease_owner', 'lease_expires_at')
+
+# Fields left out of archived records; API keys have already been delivered
+ARCHIVE_EXCLUDED_FIELDS = {'api_key', 'resource_version', 'lease_owner', 'lease_expires_at'}
+
+
+def summarize(data: KeyRequestData) -> KeyRequestSummary:
+    """
+    Build the listing summary of a key request.
+
+    Args:
+        data: Full key request
+
+    Returns:
+        KeyRequestSummary without the API key
+    """
+    return KeyRequestSummary(
+        request_id=data.request_id,
+        email=data.email,
+        model=data.model,
+        state=data.state,
+        created_at=data.created_at,
+        updated_at=data.updated_at,
+        resource_version=data.resource_version,
+        attempts=data.attempts,
+        next_attempt_at=data.next_attempt_at,
+        lease_owner=data.lease_owner,
+        lease_expires_at=data.lease_expires_at
+    )
+
+
+def lease_active(record, now: Optional[datetime] = None) -> bool:
+    """
+    Check whether a request is currently leased.
+
+    Leases without an expiry, or with an expiry in the past, are stale
+    and may be reclaimed.
+
+    Args:
+        record: KeyRequestData or KeyRequestSummary
+        now: Reference time (naive UTC)
+
+    Returns:
+        True if some actor holds an unexpired lease
+    """
+    return (
+        record.lease_owner is not None
+        and record.lease_expires_at is not None
+        and record.lease_expires_at > (now or datetime.utcnow())
+    )
+
+
+def encode_archive(records: list[KeyRequestData]) -> bytes:
+    """
+    Serialize records into a compressed archive chunk.
+
+    Args:
+        records: Key requests to archive
+
+    Returns:
+        Gzip-compressed JSON array of records
+    """
+    payload = [record.model_dump(mode='json', exclude=ARCHIVE_EXCLUDED_FIELDS) for record in records]
+    return gzip.compress(json.dumps(payload, separators=(',', ':')).encode('utf-8'))
+
+
+def archive_chunk_id(records: list[KeyRequestData]) -> str:
+    """
+    Deterministic identifier of an archive chunk.
+
+    Derived from the archived request ids, so writing the same batch again
+    (e.g. after its delete failed) targets the same chunk.
+
+    Args:
+        records: Key requests in the chunk
+
+    Returns:
+        Hex digest of the sorted request ids
+    """
+    digest = hashlib.sha256('\n'.join(sorted(record.request_id for record in records)).encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+
+def decode_archive(chunk: bytes) -> list[KeyRequestData]:
+    """
+    Deserialize a compressed archive chunk.
+
+    Args:
+        chunk: Output of encode_archive
+
+    Returns:
+        Archived key requests
+    """
+    return [KeyRequestData(**record) for record in json.loads(gzip.decompress(chunk))]
+
+
+# Callback invoked with the summary of a created or changed request
+RequestListener = Callable[[KeyRequestSummary], None]
+
+
+class RequestConflictError(Exception):
+    """Raised when an update's resource version precondition does not hold."""
+
+
+class RequestLeaseError(RequestConflictError):
+    """Raised when a request's processing lease is held by another actor."""
+
+
+class KeyRequestStore(ABC):
+    """
+    Abstract base class for key request storage backends.
+
+    Every record carries an opaque resource_version that changes on each
+    write; update() can use it as a precondition for optimistic concurrency.
+    """
+
+    # Maximum number of concurrent writes issued by create_many/update_many
+    write_concurrency: int = 8
+
+    def __init__(self):
+        """Initialize listener registry."""
+        self._listeners: list[RequestListener] = []
+
+    def add_listener(self, listener: RequestListener) -> None:
+        """
+        Register a callback for created or changed requests.
+
+        Listeners are called for writes made through this store and, where
+        the backend supports it, for changes made by other processes.
+        They may be called from any thread and must not block.
+
+        Args:
+            listener: Callback receiving a KeyRequestSummary
+        """
+        self._listeners.append(listener)
+
+    def _notify_listeners(self, summary: KeyRequestSummary) -> None:
+        """Call every registered listener, logging listener errors."""
+        for listener in self._listeners:
+            try:
+                listener(summary)
+            except Exception as e:
+                logger.error(f"Key request listener failed: {e}", exc_info=True)
+
+    async def start(self) -> None:
+        """Start background resources (caches, connections). No-op by default."""
+        pass
+
+    async def stop(self) -> None:
+        """Release background resources. No-op by default."""
+        pass
+
+    @abstractmethod
+    async def create(self, email: str, model: str) -> KeyRequestData:
+        """
+        Create new key request with pending state.
+
+        Args:
+            email: User email address
+            model: LLM model identifier
+
+        Returns:
+            Created KeyRequestData
+        """
+        pass
+
+    @abstractmethod
+    async def find(self, request_id: str) -> Optional[KeyRequestData]:
+        """
+        Find key request by request ID.
+
+        Args:
+            request_id: Unique request identifier
+
+        Returns:
+            KeyRequestData if found, None otherwise
+        """
+        pass
+
+    async def get(self, request_id: str) -> Optional[KeyRequestData]:
+        """
+        Get key request by request ID (alias for find).
+
+        Args:
+            request_id: Unique request identifier
+
+        Returns:
+            KeyRequestData if found, None otherwise
+        """
+        return await self.find(request_id)
+
+    @abstractmethod
+    async def find_by_email(self, email: str) -> Optional[KeyRequestData]:
+        """
+        Find the most recent key request for an email address.
+
+        Args:
+            email: User email address
+
+        Returns:
+            KeyRequestData if found, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def find_by_email_and_model(self, email: str, model: str) -> Optional[KeyRequestData]:
+        """
+        Find the most recent key request for an email address and model.
+
+        Args:
+            email: User email address
+            model: LLM model identifier
+
+        Returns:
+            KeyRequestData if found, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    def iter_by_status(self, state: KeyRequestState) -> AsyncIterator[KeyRequestData]:
+        """
+        Lazily iterate over all key requests with given state.
+
+        Args:
+            state: Key request state to filter by
+
+        Yields:
+            KeyRequestData objects
+        """
+        pass
+
+    @abstractmethod
+    def iter_all(self) -> AsyncIterator[KeyRequestData]:
+        """
+        Lazily iterate over all key requests.
+
+        Yields:
+            KeyRequestData objects
+        """
+        pass
+
+    async def iter_summaries(self, state: Optional[KeyRequestState] = None) -> AsyncIterator[KeyRequestSummary]:
+        """
+        Lazily iterate over key request summaries.
+
+        Summaries carry no API key. Backends should override this with a
+        read path that does not load full records.
+
+        Args:
+            state: If given, only requests in this state
+
+        Yields:
+            KeyRequestSummary objects
+        """
+        records = self.iter_all() if state is None else self.iter_by_status(state)
+        async for data in records:
+            yield summarize(data)
+
+    async def list_summaries(self, state: Optional[KeyRequestState] = None) -> list[KeyRequestSummary]:
+        """
+        List key request summaries.
+
+        Args:
+            state: If given, only requests in this state
+
+        Returns:
+            List of KeyRequestSummary objects
+        """
+        return [summary async for summary in self.iter_summaries(state)]
+
+    async def find_by_status(self, state: KeyRequestState) -> list[KeyRequestData]:
+        """
+        Find all key requests with given state.
+
+        Args:
+            state: Key request state to filter by
+
+        Returns:
+            List of KeyRequestData objects
+        """
+        return [data async for data in self.iter_by_status(state)]
+
+    async def list_all(self) -> list[KeyRequestData]:
+        """
+        List all key requests.
+
+        Returns:
+            List of all KeyRequestData objects
+        """
+        return [data async for data in self.iter_all()]
+
+    @abstractmethod
+    async def update(
+        self,
+        request_id: str,
+        resource_version: Optional[str] = None,
+        expected_state: Optional[KeyRequestState] = None,
+        lease_holder: Optional[str] = None,
+        **kwargs
+    ) -> KeyRequestData:
+        """
+        Update key request fields (state, api_key, retry and lease fields).
+
+        When resource_version is given the write only succeeds if the record
+        has not been modified since. If expected_state is also given, a
+        conflict caused by a write that left the state unchanged is retried;
+        with lease_holder, only as long as that actor still holds the lease.
+
+        Args:
+            request_id: Request identifier
+            resource_version: Expected resource version of the record
+            expected_state: State the caller based the update on
+            lease_holder: Lease owner the caller acts as
+            **kwargs: Fields to update (see MUTABLE_FIELDS)
+
+        Returns:
+            Updated KeyRequestData
+
+        Raises:
+            RequestConflictError: If the record was modified concurrently
+        """
+        pass
+
+    async def update_state(self, request_id: str, state: KeyRequestState) -> KeyRequestData:
+        """
+        Update the state of a key request.
+
+        Args:
+            request_id: Request identifier
+            state: New state for the request
+
+        Returns:
+            Updated KeyRequestData
+        """
+        return await self.update(request_id, state=state)
+
+    async def acquire_lease(
+        self,
+        request_id: str,
+        owner: str,
+        duration: float,
+        expected_state: Optional[KeyRequestState] = None
+    ) -> Optional[KeyRequestData]:
+        """
+        Take the processing lease of a request.
+
+        The lease is written with the record's resource version as a
+        precondition, so of two concurrent callers only one succeeds.
+        Expired leases are reclaimed; a lease already held by owner is
+        extended.
+
+        Args:
+            request_id: Request identifier
+            owner: Identity of the acting process and operation
+            duration: Seconds until the lease expires if not released
+            expected_state: If given, the request must still be in this state
+
+        Returns:
+            The leased KeyRequestData, or None if the request does not exist
+
+        Raises:
+            RequestLeaseError: If the lease is held by another owner, the
+                state changed, or a concurrent writer won
+        """
+        current = await self.find(request_id)
+        if current is None:
+            return None
+
+        now = datetime.utcnow()
+        if expected_state is not None and current.state != expected_state:
+            raise RequestLeaseError(
+                f"Request {request_id} changed state from {expected_state.value} to {current.state.value}"
+            )
+        if current.lease_owner not in (None, owner):
+            if lease_active(current, now):
+                raise RequestLeaseError(
+                    f"Request {request_id} is being processed by {current.lease_owner} "
+                    f"until {current.lease_expires_at.isoformat()}"
+                )
+            logger.info(f"Reclaiming stale lease of request {request_id} from {current.lease_owner}")
+
+        try:
+            return await self.update(
+                request_id,
+                resource_version=current.resource_version,
+                lease_owner=owner,
+                lease_expires_at=now + timedelta(seconds=duration)
+            )
+        except RequestConflictError as e:
+            raise RequestLeaseError(f"Request {request_id} was leased concurrently") from e
+
+    async def release_lease(self, request_id: str, owner: str) -> bool:
+        """
+        Give up the processing lease of a request.
+
+        Nothing is written if the lease is no longer held by owner.
+
+        Args:
+            request_id: Request identifier
+            owner: Identity the lease was acquired with
+
+        Returns:
+            True if the lease was released
+        """
+        current = await self.find(request_id)
+        if current is None or current.lease_owner != owner:
+            return False
+        try:
+            await self.update(
+                request_id,
+                resource_version=current.resource_version,
+                lease_owner=None,
+                lease_expires_at=None
+            )
+            return True
+        except RequestConflictError:
+            # Someone else wrote in between; the lease expires on its own
+            logger.debug(f"Could not release lease of request {request_id}, leaving it to expire")
+            return False
+
+    async def _run_writes(
+        self,
+        writes: list[tuple[Optional[str], Callable[[], Awaitable[KeyRequestData]]]]
+    ) -> list[WriteResult]:
+        """
+        Run writes with bounded concurrency and collect per-item results.
+
+        Args:
+            writes: (request_id, write) pairs; request_id may be None for creates
+
+        Returns:
+            One WriteResult per write, in input order
+        """
+        semaphore = asyncio.Semaphore(max(1, self.write_concurrency))
+
+        async def run(request_id: Optional[str], write: Callable[[], Awaitable[KeyRequestData]]) -> WriteResult:
+            async with semaphore:
+                try:
+                    data = await write()
+                    return WriteResult(request_id=data.request_id, success=True, data=data)
+                except RequestConflictError as e:
+                    return WriteResult(request_id=request_id, success=False, error=str(e), conflict=True)
+                except Exception as e:
+                    logger.error(f"Batch write for request {request_id} failed: {e}")
+                    return WriteResult(
+                        request_id=request_id,
+                        success=False,
+                        error=str(e) or type(e).__name__,
+                        # KeyError from the SQLite store, a 404 ApiException from Kubernetes
+                        not_found=isinstance(e, KeyError) or getattr(e, 'status', None) == 404
+                    )
+
+        return list(await asyncio.gather(*(run(request_id, write) for request_id, write in writes)))
+
+    async def create_many(self, requests: list[tuple[str, str]]) -> list[WriteResult]:
+        """
+        Create several key requests with bounded concurrency.
+
+        Args:
+            requests: (email, model) pairs
+
+        Returns:
+            One WriteResult per request, in input order
+        """
+        results = await self._run_writes([
+            (None, lambda email=email, model=model: self.create(email, model))
+            for email, model in requests
+        ])
+        logger.info(f"Created {sum(r.success for r in results)}/{len(results)} key request(s)")
+        return results
+
+    async def update_many(self, updates: list[KeyRequestUpdate]) -> list[WriteResult]:
+        """
+        Apply several updates with bounded concurrency.
+
+        Updates to the same request are coalesced into a single write: their
+        changes are merged in order (later values win) and the preconditions
+        of the first update are used.
+
+        Args:
+            updates: Updates to apply
+
+        Returns:
+            One WriteResult per distinct request, in order of first appearance
+        """
+        coalesced: dict[str, KeyRequestUpdate] = {}
+        for update in updates:
+            current = coalesced.get(update.request_id)
+            if current is None:
+                coalesced[update.request_id] = update.model_copy(update={'changes': dict(update.changes)})
+            else:
+                current.changes.update(update.changes)
+
+        results = await self._run_writes([
+            (
+                update.request_id,
+                lambda update=update: self.update(
+                    update.request_id,
+                    resource_version=update.resource_version,
+                    expected_state=update.expected_state,
+                    lease_holder=update.lease_holder,
+                    **update.changes
+                )
+            )
+            for update in coalesced.values()
+        ])
+        logger.info(
+            f"Updated {sum(r.success for r in results)}/{len(results)} key request(s) "
+            f"({len(updates)} update(s) submitted)"
+        )
+        return results
+
+    @abstractmethod
+    async def delete(self, request_id: str) -> bool:
+        """
+        Delete a key request.
+
+        Args:
+            request_id: Request identifier
+
+        Returns:
+            True if deleted, False if it did not exist
+        """
+        pass
+
+    async def delete_many(self, request_ids: list[str], state: Optional[KeyRequestState] = None) -> int:
+        """
+        Delete several key requests.
+
+        Backends should override this with a batched delete.
+
+        Args:
+            request_ids: Request identifiers to delete
+            state: If given, only requests currently in this state are deleted
+
+        Returns:
+            Number of deleted requests
+        """
+        deleted = 0
+        for request_id in request_ids:
+            if state is not None:
+                current = await self.find(request_id)
+                if current is None or current.state != state:
+                    continue
+            if await self.delete(request_id):
+                deleted += 1
+        return deleted
+
+    @abstractmethod
+    async def archive(self, records: list[KeyRequestData]) -> str:
+        """
+        Write records to a single compressed archive chunk.
+
+        Archived records do not include API keys. The chunk is named by
+        archive_chunk_id(), and writing a chunk that already exists is a
+        no-op, so retrying a batch does not archive it twice.
+
+        Args:
+            records: Key requests to archive
+
+        Returns:
+            Identifier of the written archive chunk
+        """
+        pass
+
+    @abstractmethod
+    def iter_archive(self) -> AsyncIterator[KeyRequestData]:
+        """
+        Lazily iterate over all archived key requests.
+
+        Yields:
+            Archived KeyRequestData objects, one chunk at a time
+        """
+        pass
@@ -1,25 +1,90 @@
 """Kubernetes Secret Service for managing key request state."""
+import asyncio
 import base64
+import functools
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Any, AsyncIterator, Callable, Optional
 
 from kubernetes import client, config
 from kubernetes.client import V1Secret, V1ObjectMeta, ApiException
 
-from src.models.key_request import KeyRequestData, KeyRequestState
+from src.models.key_request import KeyRequestData, KeyRequestState, KeyRequestSummary
+from src.services.key_request_store import (
+    KeyRequestStore,
+    MUTABLE_FIELDS,
+    RequestConflictError,
+    RequestLeaseError,
+    archive_chunk_id,
+    decode_archive,
+    encode_archive,
+    summarize,
+)
+from src.services.secret_informer import SecretInformer
 
-class KubernetesSecretService:
+# Label selector matching every key request secret
+REQUEST_LABEL_SELECTOR = 'app.kubernetes.io/component=llm-key-request'
+
+# Index labels holding label-safe hashes of the email and (email, model) pair
+EMAIL_HASH_LABEL = 'email-hash'
+EMAIL_MODEL_HASH_LABEL = 'email-model-hash'
+
+# Request states by their serialized value, for decoding without validation
+STATES_BY_VALUE = {state.value: state for state in KeyRequestState}
+
+# Mutable fields stored as annotations rather than secret data
+ANNOTATION_FIELDS = ('attempts', 'next_attempt_at', 'lease_owner', 'lease_expires_at')
+
+# Label holding the request ID, used to select batches of secrets
+REQUEST_ID_LABEL = 'request-id'
+
+# Label selector matching archive chunks
+ARCHIVE_LABEL_SELECTOR = 'app.kubernetes.io/component=llm-key-request-archive'
+
+# Accept header asking the API server for object metadata only (no secret data)
+PARTIAL_METADATA_LIST_ACCEPT = 'application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1'
+
+# Maximum number of request IDs in one set-based selector
+DELETE_BATCH_SIZE = 100
+
+# Archive secrets are large, so they are listed in small pages
+ARCHIVE_PAGE_SIZE = 10
+
+
+class KubernetesSecretService(KeyRequestStore):
     """Service for managing key request secrets in Kubernetes."""
     
-    def __init__(self, namespace: Optional[str] = None):
+    def __init__(
+        self,
+        namespace: Optional[str] = None,
+        use_informer: bool = False,
+        max_workers: int = 8,
+        request_timeout: float = 10.0,
+        page_size: int = 500,
+        max_conflict_retries: int = 3
+    ):
         """
         Initialize Kubernetes client and set namespace.
         
+        The kubernetes client is synchronous, so every API call runs on a
+        dedicated bounded thread pool instead of blocking the event loop.
+        
         Args:
             namespace: Kubernetes namespace to use. If None, uses current namespace.
+            use_informer: Serve reads from a watch-backed cache instead of
+                listing the namespace on every call.
+            max_workers: Maximum number of concurrent Kubernetes API calls
+            request_timeout: Timeout in seconds for a single API call
+            page_size: Number of secrets requested per list page
+            max_conflict_retries: Maximum number of retries of an update after
+                a resourceVersion conflict
         """
+        super().__init__()
+        
         try:
             # Try to load in-cluster config first (when running in k8s)
             config.load_incluster_config()
@@ -30,6 +95,12 @@ class KubernetesSecretService:
             logger.info("Loaded Kubernetes configuration from kubeconfig")
         
         self.core_v1 = client.CoreV1Api()
+        self.request_timeout = request_timeout
+        self.page_size = page_size
+        self.max_conflict_retries = max_conflict_retries
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="k8s-api")
+        # Batch writes can use every API worker
+        self.write_concurrency = max_workers
         
         # Determine namespace
         if namespace:
@@ -45,39 +116,215 @@ class KubernetesSecretService:
                 self.namespace = 'default'
                 logger.info(f"Using default namespace: {self.namespace}")
         
+        self.informer: Optional[SecretInformer] = None
+        if use_informer:
+            self.informer = SecretInformer(
+                core_v1=self.core_v1,
+                namespace=self.namespace,
+                label_selector=REQUEST_LABEL_SELECTOR,
+                index_labels=(EMAIL_HASH_LABEL, EMAIL_MODEL_HASH_LABEL, 'request-state'),
+                request_timeout=self.request_timeout,
+                on_event=self._on_secret_event
+            )
+        
+        # Without the informer cache, changes made by other processes are
+        # observed through a watch on pending secrets only
+        self.pending_watch: Optional[SecretInformer] = None
+        if not use_informer:
+            self.pending_watch = SecretInformer(
+                core_v1=self.core_v1,
+                namespace=self.namespace,
+                label_selector=f'{REQUEST_LABEL_SELECTOR},request-state={KeyRequestState.PENDING.value}',
+                request_timeout=self.request_timeout,
+                on_event=self._on_secret_event
+            )
+        
         logger.info(f"KubernetesSecretService initialized with namespace: {self.namespace}")
     
+    async def start(self) -> None:
+        """Backfill index labels and start the informer cache, if enabled."""
+        try:
+            await self.backfill_index_labels()
+        except (ApiException, asyncio.TimeoutError) as e:
+            logger.error(f"Failed to backfill index labels: {e}")
+        
+        if self.informer:
+            self.informer.start()
+        elif self.pending_watch and self._listeners:
+            self.pending_watch.start()
+    
+    async def stop(self) -> None:
+        """Stop the informer cache, if enabled, and release the API thread pool."""
+        if self.informer:
+            await asyncio.to_thread(self.informer.stop)
+        elif self.pending_watch and self._listeners:
+            await asyncio.to_thread(self.pending_watch.stop)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+    
+    async def _call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking Kubernetes API call on the API thread pool.
+        
+        The call is bounded by request_timeout both on the HTTP request itself
+        (so the worker thread is released) and on the awaiting coroutine.
+        Cancelling the caller cancels the call if it has not started yet.
+        
+        Args:
+            func: Bound CoreV1Api method
+            *args: Positional arguments for the call
+            **kwargs: Keyword arguments for the call
+            
+        Returns:
+            Result of the API call
+            
+        Raises:
+            asyncio.TimeoutError: If the call does not complete within request_timeout
+        """
+        kwargs.setdefault('_request_timeout', self.request_timeout)
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+        try:
+            return await asyncio.wait_for(future, timeout=self.request_timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Kubernetes API call {func.__name__} timed out after {self.request_timeout}s")
+            raise
+    
+    def _on_secret_event(self, event_type: str, secret: V1Secret) -> None:
+        """Forward watch events for existing requests to the listeners. Runs on the informer thread."""
+        if event_type == 'DELETED' or not self._listeners:
+            return
+        
+        metadata = secret.metadata
+        summary = self._metadata_to_summary(
+            metadata.name,
+            metadata.labels or {},
+            metadata.annotations or {},
+            metadata.resource_version
+        ) or summarize(self._secret_to_request_data(secret))
+        self._notify_listeners(summary)
+    
+    def _use_cache(self) -> bool:
+        """
+        Check whether reads can be served from the informer cache.
+        
+        Until the initial list completes (or while the informer is
+        recovering from an error) reads fall back to the API server.
+        """
+        return self.informer is not None and self.informer.has_synced
+    
     def _generate_secret_name(self, request_id: str) -> str:
         """Generate secret name from request ID."""
         return f"llm-key-request-{request_id}"
     
-    def _secret_to_request_data(self, secret: V1Secret) -> KeyRequestData:
+    @staticmethod
+    def _hash_label_value(*parts: str) -> str:
+        """
+        Hash values into a label-safe string.
+        
+        Label values are limited to 63 alphanumeric characters, so emails
+        and models cannot be stored as labels directly.
+        """
+        return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()[:40]
+    
+    def _index_labels(self, data: KeyRequestData) -> dict[str, str]:
+        """Build the lookup index labels for a key request."""
+        return {
+            REQUEST_ID_LABEL: data.request_id,
+            EMAIL_HASH_LABEL: self._hash_label_value(data.email),
+            EMAIL_MODEL_HASH_LABEL: self._hash_label_value(data.email, data.model),
+        }
+    
+    @staticmethod
+    def _secret_to_request_data(secret: V1Secret, validate: bool = False) -> KeyRequestData:
         """
         Convert Kubernetes secret to KeyRequestData model.
         
+        Secrets written by this service are trusted: fields are decoded in a
+        single pass and the model is built without re-running validation.
+        Secrets with an unknown state fall back to the validated path.
+        
         Args:
             secret: Kubernetes V1Secret object
+            validate: Run full model validation (for secrets of unknown origin)
             
         Returns:
             KeyRequestData model
         """
         # Decode base64 data
-        data = {}
-        if secret.data:
-            for key, value in secret.data.items():
-                data[key] = base64.b64decode(value).decode('utf-8')
+        b64decode = base64.b64decode
+        data = {key: b64decode(value).decode('utf-8') for key, value in (secret.data or {}).items()}
         
         # Parse dates from annotations
         annotations = secret.metadata.annotations or {}
+        created_at = annotations.get('created_at')
+        updated_at = annotations.get('updated_at')
+        if created_at is None or updated_at is None:
+            now = datetime.now().isoformat()
+            created_at = created_at or now
+            updated_at = updated_at or now
         
-        return KeyRequestData(
+        state = STATES_BY_VALUE.get(data.get('state', KeyRequestState.PENDING.value))
+        fields = dict(
             request_id=data.get('request_id', ''),
             email=data.get('email', ''),
             model=data.get('model', ''),
-            state=KeyRequestState(data.get('state', KeyRequestState.PENDING)),
-            created_at=datetime.fromisoformat(annotations.get('created_at', datetime.now().isoformat())),
-            updated_at=datetime.fromisoformat(annotations.get('updated_at', datetime.now().isoformat())),
-            api_key=data.get('api_key') if 'api_key' in data else None
+            state=state if state is not None else data['state'],
+            created_at=datetime.fromisoformat(created_at),
+            updated_at=datetime.fromisoformat(updated_at),
+            api_key=data.get('api_key'),
+            resource_version=secret.metadata.resource_version,
+            **KubernetesSecretService._retry_fields(annotations)
+        )
+        
+        if validate or state is None:
+            return KeyRequestData(**fields)
+        return KeyRequestData.model_construct(**fields)
+    
+    @staticmethod
+    def _retry_fields(annotations: dict[str, str]) -> dict:
+        """Decode the retry scheduling and processing lease annotations."""
+        next_attempt_at = annotations.get('next_attempt_at')
+        lease_expires_at = annotations.get('lease_expires_at')
+        return {
+            'attempts': int(annotations.get('attempts', 0)),
+            'next_attempt_at': datetime.fromisoformat(next_attempt_at) if next_attempt_at else None,
+            'lease_owner': annotations.get('lease_owner'),
+            'lease_expires_at': datetime.fromisoformat(lease_expires_at) if lease_expires_at else None,
+        }
+    
+    def _metadata_to_summary(
+        self,
+        name: str,
+        labels: dict[str, str],
+        annotations: dict[str, str],
+        resource_version: Optional[str]
+    ) -> Optional[KeyRequestSummary]:
+        """
+        Build a summary from secret metadata alone.
+        
+        Args:
+            name: Secret name
+            labels: Secret labels
+            annotations: Secret annotations
+            resource_version: Secret resourceVersion
+            
+        Returns:
+            KeyRequestSummary, or None if the metadata is incomplete (secrets
+            created before the model annotation existed)
+        """
+        if 'model' not in annotations or 'email' not in annotations:
+            return None
+        
+        state = labels.get('request-state', annotations.get('state', KeyRequestState.PENDING.value))
+        return KeyRequestSummary.model_construct(
+            request_id=labels.get(REQUEST_ID_LABEL) or name.removeprefix('llm-key-request-'),
+            email=annotations['email'],
+            model=annotations['model'],
+            state=STATES_BY_VALUE.get(state) or KeyRequestState(state),
+            created_at=datetime.fromisoformat(annotations['created_at']),
+            updated_at=datetime.fromisoformat(annotations['updated_at']),
+            resource_version=resource_version,
+            **self._retry_fields(annotations)
         )
     
     def _request_data_to_secret(self, data: KeyRequestData) -> V1Secret:
@@ -105,6 +352,7 @@ class KubernetesSecretService:
         annotations = {
             'app.kubernetes.io/component': 'llm-key-request',
             'email': data.email,
+            'model': data.model,
             'state': data.state.value,
             'created_at': data.created_at.isoformat(),
             'updated_at': data.updated_at.isoformat(),
@@ -115,6 +363,7 @@ class KubernetesSecretService:
             'app.kubernetes.io/name': 'llm-key-requestor',
             'app.kubernetes.io/component': 'llm-key-request',
             'request-state': data.state.value,
+            **self._index_labels(data),
         }
         
         return V1Secret(
@@ -138,9 +387,17 @@ class KubernetesSecretService:
         Returns:
             KeyRequestData if found, None otherwise
         """
+        secret_name = self._generate_secret_name(request_id)
+        
+        if self._use_cache():
+            secret = self.informer.get(secret_name)
+            if secret is None:
+                logger.debug(f"Secret not found for request_id: {request_id}")
+                return None
+            return self._secret_to_request_data(secret)
+        
         try:
-            secret_name = self._generate_secret_name(request_id)
-            secret = self.core_v1.read_namespaced_secret(secret_name, self.namespace)
+            secret = await self._call(self.core_v1.read_namespaced_secret, secret_name, self.namespace)
             return self._secret_to_request_data(secret)
         except ApiException as e:
             if e.status == 404:
@@ -149,6 +406,32 @@ class KubernetesSecretService:
             logger.error(f"Error finding secret for request_id {request_id}: {e}")
             raise
     
+    async def _find_by_index(self, label: str, value: str) -> list[V1Secret]:
+        """
+        Find secrets by an index label using the cache or a server-side selector.
+        
+        Args:
+            label: Index label key
+            value: Index label value
+            
+        Returns:
+            List of matching secrets
+        """
+        if self._use_cache():
+            return self.informer.by_index(label, value)
+        
+        secrets = await self._call(
+            self.core_v1.list_namespaced_secret,
+            self.namespace,
+            label_selector=f'{REQUEST_LABEL_SELECTOR},{label}={value}'
+        )
+        return secrets.items
+    
+    @staticmethod
+    def _newest(secrets: list[V1Secret]) -> V1Secret:
+        """Pick the most recently created secret."""
+        return max(secrets, key=lambda secret: (secret.metadata.annotations or {}).get('created_at', ''))
+    
     async def find_by_email(self, email: str) -> Optional[KeyRequestData]:
         """
         Find secret by email address.
@@ -157,55 +440,301 @@ class KubernetesSecretService:
             email: User email address
             
         Returns:
-            KeyRequestData if found, None otherwise
+            Most recent KeyRequestData for the email if found, None otherwise
         """
         try:
-            # List secrets with component label and filter by email annotation
-            label_selector = 'app.kubernetes.io/component=llm-key-request'
-            secrets = self.core_v1.list_namespaced_secret(
-                self.namespace,
-                label_selector=label_selector
-            )
+            secrets = [
+                secret for secret in await self._find_by_index(EMAIL_HASH_LABEL, self._hash_label_value(email))
+                if (secret.metadata.annotations or {}).get('email') == email
+            ]
             
-            # Filter by email annotation
-            for secret in secrets.items:
-                annotations = secret.metadata.annotations or {}
-                if annotations.get('email') == email:
-                    return self._secret_to_request_data(secret)
+            if not secrets:
+                logger.debug(f"No secret found for email: {email}")
+                return None
             
-            logger.debug(f"No secret found for email: {email}")
-            return None
+            return self._secret_to_request_data(self._newest(secrets))
             
         except ApiException as e:
             logger.error(f"Error finding secret by email {email}: {e}")
             raise
     
-    async def find_by_status(self, state: KeyRequestState) -> list[KeyRequestData]:
+    async def find_by_email_and_model(self, email: str, model: str) -> Optional[KeyRequestData]:
         """
-        Find all secrets with given state.
+        Find secret by email address and model.
         
         Args:
-            state: Key request state to filter by
+            email: User email address
+            model: LLM model identifier
             
         Returns:
-            List of KeyRequestData objects
+            Most recent KeyRequestData for the email and model if found, None otherwise
         """
         try:
+            secrets = await self._find_by_index(EMAIL_MODEL_HASH_LABEL, self._hash_label_value(email, model))
+            
+            # Guard against hash collisions
+            results = [
+                data for data in (self._secret_to_request_data(secret) for secret in secrets)
+                if data.email == email and data.model == model
+            ]
+            
+            if not results:
+                logger.debug(f"No secret found for email {email} and model {model}")
+                return None
+            
+            return max(results, key=lambda data: data.created_at)
+            
+        except ApiException as e:
+            logger.error(f"Error finding secret by email {email} and model {model}: {e}")
+            raise
+    
+    async def backfill_index_labels(self) -> int:
+        """
+        Add index labels to secrets created before they were introduced.
+        
+        Only secrets missing the request-id label (the most recently added
+        index label) are listed, so this is cheap once all secrets have been
+        migrated.
+        
+        Returns:
+            Number of secrets patched
+        """
+        secrets = (await self._call(
+            self.core_v1.list_namespaced_secret,
+            self.namespace,
+            label_selector=f'{REQUEST_LABEL_SELECTOR},!{REQUEST_ID_LABEL}'
+        )).items
+        
+        patched = 0
+        for secret in secrets:
+            try:
+                # Legacy secrets may predate the current format
+                data = self._secret_to_request_data(secret, validate=True)
+                await self._call(
+                    self.core_v1.patch_namespaced_secret,
+                    secret.metadata.name,
+                    self.namespace,
+                    {'metadata': {
+                        'labels': self._index_labels(data),
+                        'annotations': {'model': data.model},
+                    }}
+                )
+                patched += 1
+            except Exception as e:
+                logger.error(f"Error backfilling index labels on secret {secret.metadata.name}: {e}")
+        
+        if patched:
+            logger.info(f"Backfilled index labels on {patched} key request secret(s)")
+        return patched
+    
+    async def _iter_secrets(self, label_selector: str, page_size: Optional[int] = None) -> AsyncIterator[V1Secret]:
+        """
+        Iterate over secrets page by page using limit/continue chunking.
+        
+        Each page is requested only when the previous one has been consumed,
+        so at most page_size secrets are held in memory at a time.
+        
+        Args:
+            label_selector: Label selector for the list call
+            page_size: Secrets per page, defaults to the configured page_size
+            
+        Yields:
+            V1Secret objects in API server order
+        """
+        continue_token = None
+        while True:
+            kwargs = {'label_selector': label_selector, 'limit': page_size or self.page_size}
+            if continue_token:
+                kwargs['_continue'] = continue_token
+            
+            page = await self._call(self.core_v1.list_namespaced_secret, self.namespace, **kwargs)
+            for secret in page.items:
+                yield secret
+            
+            continue_token = page.metadata._continue
+            if not continue_token:
+                return
+    
+    async def _iter_request_data(self, secrets: AsyncIterator[V1Secret]) -> AsyncIterator[KeyRequestData]:
+        """Convert secrets to KeyRequestData, skipping secrets that cannot be parsed."""
+        async for secret in secrets:
+            try:
+                yield self._secret_to_request_data(secret)
+            except Exception as e:
+                logger.error(f"Error parsing secret {secret.metadata.name}: {e}")
+    
+    async def _iter_cached(self, secrets: list[V1Secret]) -> AsyncIterator[V1Secret]:
+        """Adapt a list of cached secrets to the paginated iterator interface."""
+        for secret in secrets:
+            yield secret
+    
+    async def iter_by_status(self, state: KeyRequestState) -> AsyncIterator[KeyRequestData]:
+        """
+        Lazily iterate over all secrets with given state.
+        
+        Args:
+            state: Key request state to filter by
+            
+        Yields:
+            KeyRequestData objects, fetched one page at a time
+        """
+        if self._use_cache():
+            secrets = self._iter_cached(self.informer.by_index('request-state', state.value))
+        else:
             # Use label selector to filter by state
-            label_selector = f'app.kubernetes.io/component=llm-key-request,request-state={state.value}'
-            secrets = self.core_v1.list_namespaced_secret(
+            secrets = self._iter_secrets(f'{REQUEST_LABEL_SELECTOR},request-state={state.value}')
+        
+        async for data in self._iter_request_data(secrets):
+            yield data
+    
+    async def iter_all(self) -> AsyncIterator[KeyRequestData]:
+        """
+        Lazily iterate over all key request secrets.
+        
+        Yields:
+            KeyRequestData objects, fetched one page at a time
+        """
+        if self._use_cache():
+            secrets = self._iter_cached(self.informer.list_secrets())
+        else:
+            # Use label selector to find all llm-key-request secrets
+            secrets = self._iter_secrets(REQUEST_LABEL_SELECTOR)
+        
+        async for data in self._iter_request_data(secrets):
+            yield data
+    
+    def _list_secret_metadata(
+        self,
+        namespace: str,
+        label_selector: str,
+        limit: int,
+        _continue: Optional[str] = None,
+        _request_timeout: Optional[float] = None
+    ) -> dict:
+        """
+        List secret metadata as a PartialObjectMetadataList.
+        
+        The generated client has no method for this, so the request is made
+        through the underlying ApiClient and the JSON response is returned
+        undeserialized.
+        
+        Args:
+            namespace: Namespace to list
+            label_selector: Label selector for the list call
+            limit: Maximum number of items in the page
+            _continue: Continue token of the previous page
+            _request_timeout: HTTP request timeout in seconds
+            
+        Returns:
+            Decoded PartialObjectMetadataList
+        """
+        query_params = [('labelSelector', label_selector), ('limit', limit)]
+        if _continue:
+            query_params.append(('continue', _continue))
+        
+        response = self.core_v1.api_client.call_api(
+            '/api/v1/namespaces/{namespace}/secrets', 'GET',
+            path_params={'namespace': namespace},
+            query_params=query_params,
+            header_params={'Accept': PARTIAL_METADATA_LIST_ACCEPT},
+            auth_settings=['BearerToken'],
+            _return_http_data_only=True,
+            _preload_content=False,
+            _request_timeout=_request_timeout
+        )
+        return json.loads(response.data)
+    
+    async def _iter_metadata_summaries(self, label_selector: str) -> AsyncIterator[KeyRequestSummary]:
+        """
+        Iterate over summaries built from paginated metadata-only list calls.
+        
+        Secrets whose metadata is incomplete are read in full.
+        
+        Args:
+            label_selector: Label selector for the list call
+            
+        Yields:
+            KeyRequestSummary objects in API server order
+        """
+        continue_token = None
+        while True:
+            page = await self._call(
+                self._list_secret_metadata,
                 self.namespace,
-                label_selector=label_selector
+                label_selector,
+                self.page_size,
+                _continue=continue_token
             )
+            for item in page.get('items') or []:
+                metadata = item.get('metadata', {})
+                try:
+                    summary = self._metadata_to_summary(
+                        metadata.get('name', ''),
+                        metadata.get('labels') or {},
+                        metadata.get('annotations') or {},
+                        metadata.get('resourceVersion')
+                    )
+                    if summary is None:
+                        data = await self.find(metadata.get('name', '').removeprefix('llm-key-request-'))
+                        if data is None:
+                            continue
+                        summary = summarize(data)
+                except Exception as e:
+                    logger.error(f"Error parsing metadata of secret {metadata.get('name')}: {e}")
+                    continue
+                yield summary
+            
+            continue_token = (page.get('metadata') or {}).get('continue')
+            if not continue_token:
+                return
+    
+    async def iter_summaries(self, state: Optional[KeyRequestState] = None) -> AsyncIterator[KeyRequestSummary]:
+        """
+        Lazily iterate over key request summaries without reading secret data.
+        
+        Args:
+            state: If given, only requests in this state
             
-            results = []
-            for secret in secrets.items:
+        Yields:
+            KeyRequestSummary objects
+        """
+        if self._use_cache():
+            secrets = (
+                self.informer.list_secrets() if state is None
+                else self.informer.by_index('request-state', state.value)
+            )
+            for secret in secrets:
                 try:
-                    results.append(self._secret_to_request_data(secret))
+                    summary = self._metadata_to_summary(
+                        secret.metadata.name,
+                        secret.metadata.labels or {},
+                        secret.metadata.annotations or {},
+                        secret.metadata.resource_version
+                    ) or summarize(self._secret_to_request_data(secret))
                 except Exception as e:
                     logger.error(f"Error parsing secret {secret.metadata.name}: {e}")
                     continue
+                yield summary
+            return
+        
+        label_selector = REQUEST_LABEL_SELECTOR
+        if state is not None:
+            label_selector += f',request-state={state.value}'
+        async for summary in self._iter_metadata_summaries(label_selector):
+            yield summary
+    
+    async def find_by_status(self, state: KeyRequestState) -> list[KeyRequestData]:
+        """
+        Find all secrets with given state.
+        
+        Args:
+            state: Key request state to filter by
             
+        Returns:
+            List of KeyRequestData objects
+        """
+        try:
+            results = [data async for data in self.iter_by_status(state)]
             logger.trace(f"Found {len(results)} secrets with state {state.value}")
             return results
             
@@ -221,21 +750,7 @@ class KubernetesSecretService:
             List of all KeyRequestData objects
         """
         try:
-            # Use label selector to find all llm-key-request secrets
-            label_selector = 'app.kubernetes.io/component=llm-key-request'
-            secrets = self.core_v1.list_namespaced_secret(
-                self.namespace,
-                label_selector=label_selector
-            )
-            
-            results = []
-            for secret in secrets.items:
-                try:
-                    results.append(self._secret_to_request_data(secret))
-                except Exception as e:
-                    logger.error(f"Error parsing secret {secret.metadata.name}: {e}")
-                    continue
-            
+            results = [data async for data in self.iter_all()]
             logger.info(f"Found {len(results)} total key request secrets")
             return results
             
@@ -269,85 +784,151 @@ class KubernetesSecretService:
         
         try:
             secret = self._request_data_to_secret(data)
-            created_secret = self.core_v1.create_namespaced_secret(
+            created_secret = await self._call(
+                self.core_v1.create_namespaced_secret,
                 self.namespace,
                 secret
             )
+            if self.informer:
+                self.informer.upsert(created_secret)
             logger.info(f"Created key request secret for email {email}, request_id {request_id}")
-            return self._secret_to_request_data(created_secret)
+            created = self._secret_to_request_data(created_secret)
+            self._notify_listeners(summarize(created))
+            return created
             
         except ApiException as e:
             logger.error(f"Error creating secret for email {email}: {e}")
             raise
     
-    async def get(self, request_id: str) -> Optional[KeyRequestData]:
+    def _build_patch(self, changes: dict, resource_version: Optional[str]) -> dict:
         """
-        Get secret by request ID (alias for find).
+        Build a strategic merge patch touching only the changed fields.
         
         Args:
-            request_id: Unique request identifier
+            changes: Field values to set
+            resource_version: Expected resourceVersion, sent as a precondition
             
         Returns:
-            KeyRequestData if found, None otherwise
+            Patch body
         """
-        return await self.find(request_id)
-    
-    async def update(self, request_id: str, **kwargs) -> KeyRequestData:
-        """
-        Update secret fields (state, api_key, etc.).
+        string_data = {}
+        data = {}
+        labels = {}
+        annotations = {'updated_at': datetime.utcnow().isoformat()}
         
-        Args:
-            request_id: Request identifier
-            **kwargs: Fields to update (state, api_key, etc.)
-            
-        Returns:
-            Updated KeyRequestData
-        """
-        try:
-            # Get existing secret
-            secret_name = self._generate_secret_name(request_id)
-            secret = self.core_v1.read_namespaced_secret(secret_name, self.namespace)
-            
-            # Convert to data model
-            data = self._secret_to_request_data(secret)
-            
-            # Update fields
-            for key, value in kwargs.items():
-                if hasattr(data, key):
-                    setattr(data, key, value)
-            
-            # Update timestamp
-            data.updated_at = datetime.utcnow()
-            
-            # Convert back to secret
-            updated_secret = self._request_data_to_secret(data)
-            
-            # Replace the secret
-            self.core_v1.replace_namespaced_secret(
-                secret_name,
-                self.namespace,
-                updated_secret
-            )
-            
-            logger.info(f"Updated secret for request_id {request_id}")
-            return data
+        for key, value in changes.items():
+            if key == 'updated_at':
+                # Always set to the time of the write
+                continue
+            if key not in MUTABLE_FIELDS:
+                raise ValueError(f"Field '{key}' cannot be updated")
             
-        except ApiException as e:
-            logger.error(f"Error updating secret for request_id {request_id}: {e}")
-            raise
+            if key == 'state':
+                state = KeyRequestState(value).value
+                string_data['state'] = state
+                labels['request-state'] = state
+                annotations['state'] = state
+            elif key in ANNOTATION_FIELDS:
+                # None removes the annotation
+                annotations[key] = value.isoformat() if isinstance(value, datetime) else (
+                    None if value is None else str(value)
+                )
+            elif value is None:
+                # Remove the key from the secret
+                data[key] = None
+            else:
+                string_data[key] = value
+        
+        metadata = {'labels': labels, 'annotations': annotations}
+        if resource_version:
+            metadata['resourceVersion'] = resource_version
+        
+        patch = {'metadata': metadata}
+        if string_data:
+            patch['stringData'] = string_data
+        if data:
+            patch['data'] = data
+        return patch
     
-    async def update_state(self, request_id: str, state: KeyRequestState) -> KeyRequestData:
+    async def update(
+        self,
+        request_id: str,
+        resource_version: Optional[str] = None,
+        expected_state: Optional[KeyRequestState] = None,
+        lease_holder: Optional[str] = None,
+        **kwargs
+    ) -> KeyRequestData:
         """
-        Update the state of a key request.
+        Update secret fields (state, api_key) with a single patch call.
+        
+        Only the changed data keys, labels and annotations are sent. When
+        resource_version is given the write only succeeds if the secret has
+        not been modified since. If expected_state is also given, a conflict
+        caused by a write that left the state (and, with lease_holder, the
+        lease) unchanged is retried against the latest resourceVersion, up
+        to max_conflict_retries times.
         
         Args:
             request_id: Request identifier
-            state: New state for the request
+            resource_version: Expected resourceVersion of the secret
+            expected_state: State the caller based the update on
+            lease_holder: Lease owner the caller acts as
+            **kwargs: Fields to update (state, api_key, retry and lease fields)
             
         Returns:
             Updated KeyRequestData
+            
+        Raises:
+            RequestConflictError: If the secret was modified concurrently
         """
-        return await self.update(request_id, state=state)
+        secret_name = self._generate_secret_name(request_id)
+        attempt = 0
+        
+        while True:
+            patch = self._build_patch(kwargs, resource_version)
+            try:
+                patched_secret = await self._call(
+                    self.core_v1.patch_namespaced_secret,
+                    secret_name,
+                    self.namespace,
+                    patch
+                )
+                break
+                
+            except ApiException as e:
+                if e.status != 409 or not resource_version:
+                    logger.error(f"Error updating secret for request_id {request_id}: {e}")
+                    raise
+                
+                if expected_state is None or attempt >= self.max_conflict_retries:
+                    raise RequestConflictError(
+                        f"Request {request_id} was modified concurrently (expected resourceVersion {resource_version})"
+                    ) from e
+                
+                # Re-read and retry only if the concurrent write left the state alone
+                current = await self._call(self.core_v1.read_namespaced_secret, secret_name, self.namespace)
+                current_state = (current.metadata.labels or {}).get('request-state')
+                if current_state != expected_state.value:
+                    raise RequestConflictError(
+                        f"Request {request_id} changed state from {expected_state.value} to {current_state}"
+                    ) from e
+                current_owner = (current.metadata.annotations or {}).get('lease_owner')
+                if lease_holder is not None and current_owner != lease_holder:
+                    raise RequestLeaseError(
+                        f"Request {request_id} lease was taken over by {current_owner or 'nobody'}"
+                    ) from e
+                
+                attempt += 1
+                resource_version = current.metadata.resource_version
+                logger.debug(f"Retrying update of request_id {request_id} after conflict (attempt {attempt})")
+        
+        if self.informer:
+            self.informer.upsert(patched_secret)
+        
+        logger.info(f"Updated secret for request_id {request_id}")
+        updated = self._secret_to_request_data(patched_secret)
+        self._notify_listeners(summarize(updated))
+        return updated
     
     async def delete(self, request_id: str) -> bool:
         """
@@ -361,7 +942,9 @@ class KubernetesSecretService:
         """
         try:
             secret_name = self._generate_secret_name(request_id)
-            self.core_v1.delete_namespaced_secret(secret_name, self.namespace)
+            await self._call(self.core_v1.delete_namespaced_secret, secret_name, self.namespace)
+            if self.informer:
+                self.informer.remove(secret_name)
             logger.info(f"Deleted secret for request_id {request_id}")
             return True
             
@@ -371,3 +954,105 @@ class KubernetesSecretService:
                 return False
             logger.error(f"Error deleting secret for request_id {request_id}: {e}")
             raise
+    
+    async def delete_many(self, request_ids: list[str], state: Optional[KeyRequestState] = None) -> int:
+        """
+        Delete several key request secrets with batched delete_collection calls.
+        
+        Args:
+            request_ids: Request identifiers to delete
+            state: If given, only secrets currently in this state are deleted
+            
+        Returns:
+            Number of deleted secrets
+        """
+        base_selector = REQUEST_LABEL_SELECTOR
+        if state is not None:
+            base_selector += f',request-state={state.value}'
+        
+        deleted = 0
+        for i in range(0, len(request_ids), DELETE_BATCH_SIZE):
+            batch = request_ids[i:i + DELETE_BATCH_SIZE]
+            try:
+                # The API server responds with the list of deleted secrets,
+                # which the generated client cannot deserialize as V1Status
+                response = await self._call(
+                    self.core_v1.delete_collection_namespaced_secret,
+                    self.namespace,
+                    label_selector=f"{base_selector},{REQUEST_ID_LABEL} in ({','.join(batch)})",
+                    _preload_content=False
+                )
+            except ApiException as e:
+                logger.error(f"Error deleting batch of {len(batch)} secrets: {e}")
+                raise
+            
+            deleted += len(json.loads(response.data).get('items') or [])
+            if self.informer:
+                for request_id in batch:
+                    self.informer.remove(self._generate_secret_name(request_id))
+        
+        logger.info(f"Deleted {deleted} key request secret(s)")
+        return deleted
+    
+    async def archive(self, records: list[KeyRequestData]) -> str:
+        """
+        Write records to a single compressed archive secret.
+        
+        The secret name is derived from the request ids; if it already
+        exists the batch was archived before and nothing is written.
+        
+        Args:
+            records: Key requests to archive
+            
+        Returns:
+            Name of the archive secret
+        """
+        now = datetime.utcnow()
+        # Prefixing the newest update time keeps listings roughly chronological
+        newest = max(record.updated_at for record in records)
+        name = f"llm-key-request-archive-{newest.strftime('%Y%m%d%H%M%S')}-{archive_chunk_id(records)}"
+        secret = V1Secret(
+            metadata=V1ObjectMeta(
+                name=name,
+                namespace=self.namespace,
+                labels={
+                    'app.kubernetes.io/name': 'llm-key-requestor',
+                    'app.kubernetes.io/component': 'llm-key-request-archive',
+                },
+                annotations={
+                    'archived_at': now.isoformat(),
+                    'record_count': str(len(records)),
+                }
+            ),
+            data={'records.json.gz': base64.b64encode(encode_archive(records)).decode('ascii')},
+            type='Opaque'
+        )
+        
+        try:
+            await self._call(self.core_v1.create_namespaced_secret, self.namespace, secret)
+        except ApiException as e:
+            if e.status == 409:
+                logger.info(f"Archive secret {name} already exists, not writing it again")
+                return name
+            logger.error(f"Error creating archive secret {name}: {e}")
+            raise
+        
+        logger.info(f"Archived {len(records)} key request(s) to {name}")
+        return name
+    
+    async def iter_archive(self) -> AsyncIterator[KeyRequestData]:
+        """
+        Lazily iterate over all archived key requests.
+        
+        Yields:
+            Archived KeyRequestData objects, one archive secret at a time
+        """
+        async for secret in self._iter_secrets(ARCHIVE_LABEL_SELECTOR, page_size=ARCHIVE_PAGE_SIZE):
+            try:
+                chunk = base64.b64decode((secret.data or {})['records.json.gz'])
+                records = decode_archive(chunk)
+            except Exception as e:
+                logger.error(f"Error reading archive secret {secret.metadata.name}: {e}")
+                continue
+            for record in records:
+                yield record
@@ -0,0 +1,272 @@
+"""Watch-backed in-memory cache of key request secrets."""
+import threading
+from typing import Callable, Iterable, Optional
+
+from loguru import logger
+from kubernetes import watch
+from kubernetes.client import CoreV1Api, V1Secret, ApiException
+
+
+class SecretInformer:
+    """
+    Informer-style cache for secrets matching a label selector.
+
+    Performs one initial list, then follows a watch from the returned
+    resourceVersion and applies ADDED/MODIFIED/DELETED events to an
+    in-memory store. When the watch reports 410 Gone the store is rebuilt
+    from a fresh list.
+
+    Secrets can additionally be indexed by label value so that lookups by
+    an indexed label do not scan the whole store.
+    """
+
+    def __init__(
+        self,
+        core_v1: CoreV1Api,
+        namespace: str,
+        label_selector: str,
+        index_labels: Iterable[str] = (),
+        watch_timeout: int = 300,
+        retry_backoff: float = 5.0,
+        request_timeout: float = 10.0,
+        on_event: Optional[Callable[[str, V1Secret], None]] = None
+    ):
+        """
+        Initialize the informer.
+
+        Args:
+            core_v1: Kubernetes CoreV1Api client
+            namespace: Namespace to watch
+            label_selector: Label selector limiting the watched secrets
+            index_labels: Label keys to maintain value -> secret indexes for
+            watch_timeout: Server-side timeout for a single watch call in seconds
+            retry_backoff: Seconds to wait before retrying after an error
+            request_timeout: Client-side timeout in seconds for the list call and
+                for connecting the watch; a watch that stays silent past
+                watch_timeout plus this timeout is considered hung
+            on_event: Called from the informer thread with the event type and
+                secret for every ADDED/MODIFIED/DELETED watch event
+        """
+        self.core_v1 = core_v1
+        self.namespace = namespace
+        self.label_selector = label_selector
+        self.watch_timeout = watch_timeout
+        self.retry_backoff = retry_backoff
+        self.request_timeout = request_timeout
+        self.on_event = on_event
+
+        self._store: dict[str, V1Secret] = {}
+        self._indexes: dict[str, dict[str, set[str]]] = {label: {} for label in index_labels}
+        self._lock = threading.RLock()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._resource_version: Optional[str] = None
+        self._watch: Optional[watch.Watch] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def has_synced(self) -> bool:
+        """True once the store reflects a complete list of the watched secrets."""
+        return self._synced.is_set()
+
+    def start(self) -> None:
+        """Start the list/watch loop in a background thread."""
+        if self._thread and self._thread.is_alive():
+            logger.warning("SecretInformer is already running")
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="secret-informer", daemon=True)
+        self._thread.start()
+        logger.info(f"SecretInformer started for selector '{self.label_selector}' in namespace {self.namespace}")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the list/watch loop."""
+        self._stopped.set()
+        if self._watch:
+            self._watch.stop()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+        self._synced.clear()
+        logger.info("SecretInformer stopped")
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the initial list has been loaded.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            True if the store is synced
+        """
+        return self._synced.wait(timeout)
+
+    def get(self, name: str) -> Optional[V1Secret]:
+        """Get a cached secret by name."""
+        with self._lock:
+            return self._store.get(name)
+
+    def list_secrets(self, predicate: Optional[Callable[[V1Secret], bool]] = None) -> list[V1Secret]:
+        """
+        List cached secrets.
+
+        Args:
+            predicate: Optional filter applied to each secret
+
+        Returns:
+            List of matching secrets
+        """
+        with self._lock:
+            secrets = list(self._store.values())
+        if predicate is None:
+            return secrets
+        return [secret for secret in secrets if predicate(secret)]
+
+    def by_index(self, label: str, value: str) -> list[V1Secret]:
+        """
+        List cached secrets whose indexed label has the given value.
+
+        Args:
+            label: Label key passed in index_labels
+            value: Label value to look up
+
+        Returns:
+            List of matching secrets
+        """
+        with self._lock:
+            names = self._indexes[label].get(value, ())
+            return [self._store[name] for name in names]
+
+    def upsert(self, secret: V1Secret) -> None:
+        """
+        Write a secret returned by the API server into the store.
+
+        Used for read-your-writes after create/update; the matching watch
+        event will arrive later and is a no-op. Older versions never
+        replace newer ones.
+        """
+        with self._lock:
+            current = self._store.get(secret.metadata.name)
+            if current is not None and self._is_newer(current, secret):
+                return
+            if current is not None:
+                self._unindex(current)
+            self._store[secret.metadata.name] = secret
+            self._index(secret)
+
+    def remove(self, name: str) -> None:
+        """Remove a secret from the store after a local delete."""
+        with self._lock:
+            secret = self._store.pop(name, None)
+            if secret is not None:
+                self._unindex(secret)
+
+    def _index(self, secret: V1Secret) -> None:
+        """Add a secret to the label indexes. Caller must hold the lock."""
+        labels = secret.metadata.labels or {}
+        for label, index in self._indexes.items():
+            value = labels.get(label)
+            if value is not None:
+                index.setdefault(value, set()).add(secret.metadata.name)
+
+    def _unindex(self, secret: V1Secret) -> None:
+        """Remove a secret from the label indexes. Caller must hold the lock."""
+        labels = secret.metadata.labels or {}
+        for label, index in self._indexes.items():
+            names = index.get(labels.get(label))
+            if names is not None:
+                names.discard(secret.metadata.name)
+                if not names:
+                    del index[labels[label]]
+
+    @staticmethod
+    def _is_newer(current: V1Secret, candidate: V1Secret) -> bool:
+        """Check whether the cached secret is newer than the candidate."""
+        try:
+            return int(current.metadata.resource_version) > int(candidate.metadata.resource_version)
+        except (TypeError, ValueError):
+            return False
+
+    def _run(self) -> None:
+        """List/watch loop executed in the background thread."""
+        while not self._stopped.is_set():
+            try:
+                if self._resource_version is None:
+                    self._relist()
+                self._watch_events()
+            except ApiException as e:
+                if e.status == 410:
+                    logger.info("SecretInformer watch expired (410 Gone), relisting")
+                    self._resource_version = None
+                    continue
+                logger.error(f"SecretInformer API error: {e}")
+                self._fail()
+            except Exception as e:
+                logger.error(f"SecretInformer error: {e}", exc_info=True)
+                self._fail()
+
+    def _fail(self) -> None:
+        """
+        Mark the store as out of sync and back off before relisting.
+
+        Events may have been missed, so reads go to the API server until the
+        next successful list.
+        """
+        self._synced.clear()
+        self._resource_version = None
+        self._stopped.wait(self.retry_backoff)
+
+    def _relist(self) -> None:
+        """Rebuild the store from a full list."""
+        secrets = self.core_v1.list_namespaced_secret(
+            self.namespace,
+            label_selector=self.label_selector,
+            _request_timeout=self.request_timeout
+        )
+        with self._lock:
+            self._store = {secret.metadata.name: secret for secret in secrets.items}
+            self._indexes = {label: {} for label in self._indexes}
+            for secret in secrets.items:
+                self._index(secret)
+        self._resource_version = secrets.metadata.resource_version
+        self._synced.set()
+        logger.info(f"SecretInformer synced {len(secrets.items)} secrets at resourceVersion {self._resource_version}")
+
+    def _watch_events(self) -> None:
+        """Follow the watch from the last seen resourceVersion."""
+        self._watch = watch.Watch()
+        for event in self._watch.stream(
+            self.core_v1.list_namespaced_secret,
+            self.namespace,
+            label_selector=self.label_selector,
+            resource_version=self._resource_version,
+            timeout_seconds=self.watch_timeout,
+            allow_watch_bookmarks=True,
+            # (connect, read): the server ends the watch after watch_timeout
+            _request_timeout=(self.request_timeout, self.watch_timeout + self.request_timeout)
+        ):
+            if self._stopped.is_set():
+                break
+            if not event:
+                continue
+
+            # Watch tracks the resourceVersion of every event, including bookmarks
+            self._resource_version = self._watch.resource_version
+            event_type = event['type']
+            if event_type == 'BOOKMARK':
+                continue
+
+            secret = event['object']
+            if event_type in ('ADDED', 'MODIFIED'):
+                self.upsert(secret)
+            elif event_type == 'DELETED':
+                self.remove(secret.metadata.name)
+
+            logger.trace(f"SecretInformer {event_type} {secret.metadata.name}")
+            
+            if self.on_event:
+                try:
+                    self.on_event(event_type, secret)
+                except Exception as e:
+                    logger.error(f"SecretInformer event handler failed: {e}", exc_info=True)
@@ -0,0 +1,529 @@
+"""SQLite storage backend for key requests."""
+import asyncio
+import sqlite3
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Optional
+
+from loguru import logger
+
+from src.models.key_request import KeyRequestData, KeyRequestState, KeyRequestSummary
+from src.services.key_request_store import (
+    KeyRequestStore,
+    MUTABLE_FIELDS,
+    RequestConflictError,
+    RequestLeaseError,
+    archive_chunk_id,
+    decode_archive,
+    encode_archive,
+    summarize,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS key_requests (
+    request_id TEXT PRIMARY KEY,
+    email TEXT NOT NULL,
+    model TEXT NOT NULL,
+    state TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    api_key TEXT,
+    version INTEGER NOT NULL DEFAULT 1,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at TEXT,
+    lease_owner TEXT,
+    lease_expires_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_key_requests_state ON key_requests (state);
+CREATE INDEX IF NOT EXISTS idx_key_requests_email ON key_requests (email, created_at);
+CREATE INDEX IF NOT EXISTS idx_key_requests_email_model ON key_requests (email, model, created_at);
+CREATE TABLE IF NOT EXISTS key_request_archive (
+    chunk_id TEXT PRIMARY KEY,
+    archived_at TEXT NOT NULL,
+    record_count INTEGER NOT NULL,
+    payload BLOB NOT NULL
+);
+"""
+
+COLUMNS = (
+    "request_id, email, model, state, created_at, updated_at, api_key, version, "
+    "attempts, next_attempt_at, lease_owner, lease_expires_at"
+)
+
+# Columns needed for listings; leaves out the API key
+SUMMARY_COLUMNS = (
+    "request_id, email, model, state, created_at, updated_at, version, "
+    "attempts, next_attempt_at, lease_owner, lease_expires_at"
+)
+
+# Columns added after the initial schema, with their definitions
+MIGRATIONS = {
+    "attempts": "INTEGER NOT NULL DEFAULT 0",
+    "next_attempt_at": "TEXT",
+    "lease_owner": "TEXT",
+    "lease_expires_at": "TEXT",
+}
+
+# Maximum number of request IDs bound in one DELETE statement
+DELETE_BATCH_SIZE = 500
+
+
+class SqliteKeyRequestStore(KeyRequestStore):
+    """
+    Key request store backed by an indexed SQLite database.
+
+    All database access runs on a single dedicated thread, which serialises
+    writes and keeps the event loop free. Use ':memory:' as the path for a
+    throwaway in-process store.
+    """
+
+    def __init__(self, path: str = "key_requests.db", page_size: int = 500):
+        """
+        Initialize the SQLite store.
+
+        Args:
+            path: Database file path, or ':memory:' for an in-memory database
+            page_size: Number of rows fetched per page when iterating
+        """
+        super().__init__()
+        self.path = path
+        self.page_size = page_size
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-store")
+        self.connection: Optional[sqlite3.Connection] = None
+        logger.info(f"SqliteKeyRequestStore initialized with database: {path}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema. Runs on the store thread."""
+        if self.connection is None:
+            self.connection = sqlite3.connect(self.path, check_same_thread=False)
+            self.connection.row_factory = sqlite3.Row
+            if self.path != ":memory:":
+                self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.executescript(SCHEMA)
+            self._migrate(self.connection)
+        return self.connection
+
+    @staticmethod
+    def _migrate(connection: sqlite3.Connection) -> None:
+        """Add columns missing from databases created by older versions."""
+        existing = {row["name"] for row in connection.execute("PRAGMA table_info(key_requests)")}
+        with connection:
+            for column, definition in MIGRATIONS.items():
+                if column not in existing:
+                    connection.execute(f"ALTER TABLE key_requests ADD COLUMN {column} {definition}")
+
+    async def _run(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run a function with the connection on the store thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, lambda: func(self._connect()))
+
+    async def start(self) -> None:
+        """Open the database."""
+        await self._run(lambda connection: None)
+
+    async def stop(self) -> None:
+        """Close the database."""
+        def close(connection: sqlite3.Connection) -> None:
+            connection.close()
+            self.connection = None
+
+        if self.connection is not None:
+            await self._run(close)
+        self.executor.shutdown(wait=False)
+
+    @staticmethod
+    def _row_to_request_data(row: sqlite3.Row) -> KeyRequestData:
+        """Convert a database row to KeyRequestData. Rows were validated on write."""
+        return KeyRequestData.model_construct(
+            request_id=row["request_id"],
+            email=row["email"],
+            model=row["model"],
+            state=KeyRequestState(row["state"]),
+            created_at=datetime.fromisoformat(row["created_at"]),
+            updated_at=datetime.fromisoformat(row["updated_at"]),
+            api_key=row["api_key"],
+            resource_version=str(row["version"]),
+            attempts=row["attempts"],
+            next_attempt_at=datetime.fromisoformat(row["next_attempt_at"]) if row["next_attempt_at"] else None,
+            lease_owner=row["lease_owner"],
+            lease_expires_at=datetime.fromisoformat(row["lease_expires_at"]) if row["lease_expires_at"] else None
+        )
+
+    @staticmethod
+    def _row_to_summary(row: sqlite3.Row) -> KeyRequestSummary:
+        """Convert a database row selected with SUMMARY_COLUMNS to KeyRequestSummary."""
+        return KeyRequestSummary.model_construct(
+            request_id=row["request_id"],
+            email=row["email"],
+            model=row["model"],
+            state=KeyRequestState(row["state"]),
+            created_at=datetime.fromisoformat(row["created_at"]),
+            updated_at=datetime.fromisoformat(row["updated_at"]),
+            resource_version=str(row["version"]),
+            attempts=row["attempts"],
+            next_attempt_at=datetime.fromisoformat(row["next_attempt_at"]) if row["next_attempt_at"] else None,
+            lease_owner=row["lease_owner"],
+            lease_expires_at=datetime.fromisoformat(row["lease_expires_at"]) if row["lease_expires_at"] else None
+        )
+
+    async def _fetch_one(self, query: str, params: tuple) -> Optional[KeyRequestData]:
+        """Fetch a single row and convert it."""
+        row = await self._run(lambda connection: connection.execute(query, params).fetchone())
+        return self._row_to_request_data(row) if row else None
+
+    async def _iter_rows(
+        self,
+        where: str,
+        params: tuple,
+        columns: str = COLUMNS,
+        convert: Optional[Callable[[sqlite3.Row], Any]] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over matching rows using keyset pagination on rowid.
+
+        Args:
+            where: SQL condition (may be empty)
+            params: Parameters for the condition
+            columns: Columns to select
+            convert: Row converter, defaults to _row_to_request_data
+
+        Yields:
+            Converted rows (KeyRequestData by default) in insertion order
+        """
+        convert = convert or self._row_to_request_data
+        condition = f"({where}) AND " if where else ""
+        last_rowid = 0
+        while True:
+            rows = await self._run(lambda connection: connection.execute(
+                f"SELECT rowid, {columns} FROM key_requests WHERE {condition}rowid > ? ORDER BY rowid LIMIT ?",
+                (*params, last_rowid, self.page_size)
+            ).fetchall())
+
+            for row in rows:
+                yield convert(row)
+
+            if len(rows) < self.page_size:
+                return
+            last_rowid = rows[-1]["rowid"]
+
+    async def create(self, email: str, model: str) -> KeyRequestData:
+        """
+        Create new key request with pending state.
+
+        Args:
+            email: User email address
+            model: LLM model identifier
+
+        Returns:
+            Created KeyRequestData
+        """
+        now = datetime.utcnow()
+        data = KeyRequestData(
+            request_id=str(uuid.uuid4()),
+            email=email,
+            model=model,
+            state=KeyRequestState.PENDING,
+            created_at=now,
+            updated_at=now,
+            api_key=None,
+            resource_version="1"
+        )
+
+        def insert(connection: sqlite3.Connection) -> None:
+            with connection:
+                connection.execute(
+                    f"INSERT INTO key_requests ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, 1, 0, NULL, NULL, NULL)",
+                    (data.request_id, data.email, data.model, data.state.value,
+                     data.created_at.isoformat(), data.updated_at.isoformat(), data.api_key)
+                )
+
+        await self._run(insert)
+        logger.info(f"Created key request for email {email}, request_id {data.request_id}")
+        self._notify_listeners(summarize(data))
+        return data
+
+    async def find(self, request_id: str) -> Optional[KeyRequestData]:
+        """
+        Find key request by request ID.
+
+        Args:
+            request_id: Unique request identifier
+
+        Returns:
+            KeyRequestData if found, None otherwise
+        """
+        return await self._fetch_one(
+            f"SELECT {COLUMNS} FROM key_requests WHERE request_id = ?",
+            (request_id,)
+        )
+
+    async def find_by_email(self, email: str) -> Optional[KeyRequestData]:
+        """
+        Find the most recent key request for an email address.
+
+        Args:
+            email: User email address
+
+        Returns:
+            KeyRequestData if found, None otherwise
+        """
+        return await self._fetch_one(
+            f"SELECT {COLUMNS} FROM key_requests WHERE email = ? ORDER BY created_at DESC LIMIT 1",
+            (email,)
+        )
+
+    async def find_by_email_and_model(self, email: str, model: str) -> Optional[KeyRequestData]:
+        """
+        Find the most recent key request for an email address and model.
+
+        Args:
+            email: User email address
+            model: LLM model identifier
+
+        Returns:
+            KeyRequestData if found, None otherwise
+        """
+        return await self._fetch_one(
+            f"SELECT {COLUMNS} FROM key_requests WHERE email = ? AND model = ? ORDER BY created_at DESC LIMIT 1",
+            (email, model)
+        )
+
+    async def iter_by_status(self, state: KeyRequestState) -> AsyncIterator[KeyRequestData]:
+        """
+        Lazily iterate over all key requests with given state.
+
+        Args:
+            state: Key request state to filter by
+
+        Yields:
+            KeyRequestData objects, fetched one page at a time
+        """
+        async for data in self._iter_rows("state = ?", (state.value,)):
+            yield data
+
+    async def iter_all(self) -> AsyncIterator[KeyRequestData]:
+        """
+        Lazily iterate over all key requests.
+
+        Yields:
+            KeyRequestData objects, fetched one page at a time
+        """
+        async for data in self._iter_rows("", ()):
+            yield data
+
+    async def iter_summaries(self, state: Optional[KeyRequestState] = None) -> AsyncIterator[KeyRequestSummary]:
+        """
+        Lazily iterate over key request summaries without reading API keys.
+
+        Args:
+            state: If given, only requests in this state
+
+        Yields:
+            KeyRequestSummary objects
+        """
+        where, params = ("state = ?", (state.value,)) if state is not None else ("", ())
+        async for summary in self._iter_rows(where, params, SUMMARY_COLUMNS, self._row_to_summary):
+            yield summary
+
+    async def update(
+        self,
+        request_id: str,
+        resource_version: Optional[str] = None,
+        expected_state: Optional[KeyRequestState] = None,
+        lease_holder: Optional[str] = None,
+        **kwargs
+    ) -> KeyRequestData:
+        """
+        Update key request fields (state, api_key) in a single statement.
+
+        Args:
+            request_id: Request identifier
+            resource_version: Expected resource version of the record
+            expected_state: State the caller based the update on
+            lease_holder: Lease owner the caller acts as
+            **kwargs: Fields to update (state, api_key, retry and lease fields)
+
+        Returns:
+            Updated KeyRequestData
+
+        Raises:
+            RequestConflictError: If the record was modified concurrently
+            KeyError: If the request does not exist
+        """
+        assignments = ["updated_at = ?", "version = version + 1"]
+        values: list[Any] = [datetime.utcnow().isoformat()]
+        for key, value in kwargs.items():
+            if key == 'updated_at':
+                # Always set to the time of the write
+                continue
+            if key not in MUTABLE_FIELDS:
+                raise ValueError(f"Field '{key}' cannot be updated")
+            assignments.append(f"{key} = ?")
+            if key == 'state':
+                value = KeyRequestState(value).value
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            values.append(value)
+
+        # The preconditions are part of the UPDATE, so they hold across processes sharing the database
+        where = "request_id = ?"
+        params: list[Any] = [request_id]
+        if resource_version:
+            # A stale version is only accepted if the state (and lease) is still the expected one
+            stale_ok = "0"
+            if expected_state is not None:
+                stale_ok = "state = ?"
+                params.append(expected_state.value)
+                if lease_holder is not None:
+                    stale_ok += " AND lease_owner = ?"
+                    params.append(lease_holder)
+            where += f" AND (CAST(version AS TEXT) = ? OR ({stale_ok}))"
+            params.insert(1, resource_version)
+
+        def write(connection: sqlite3.Connection) -> tuple[Optional[sqlite3.Row], Optional[RequestConflictError]]:
+            with connection:
+                cursor = connection.execute(
+                    f"UPDATE key_requests SET {', '.join(assignments)} WHERE {where}",
+                    (*values, *params)
+                )
+                if cursor.rowcount == 0:
+                    return None, self._update_conflict(connection, request_id, resource_version, expected_state)
+                row = connection.execute(
+                    f"SELECT {COLUMNS} FROM key_requests WHERE request_id = ?", (request_id,)
+                ).fetchone()
+                return row, None
+
+        row, conflict = await self._run(write)
+        if conflict is not None:
+            raise conflict
+        if row is None:
+            raise KeyError(f"Request not found: {request_id}")
+
+        logger.info(f"Updated key request {request_id}")
+        updated = self._row_to_request_data(row)
+        self._notify_listeners(summarize(updated))
+        return updated
+
+    @staticmethod
+    def _update_conflict(
+        connection: sqlite3.Connection,
+        request_id: str,
+        resource_version: Optional[str],
+        expected_state: Optional[KeyRequestState]
+    ) -> Optional[RequestConflictError]:
+        """Explain why a conditional update matched no row; None if the request does not exist."""
+        current = connection.execute(
+            "SELECT state, lease_owner FROM key_requests WHERE request_id = ?", (request_id,)
+        ).fetchone()
+        if current is None:
+            return None
+        if expected_state is not None and current["state"] == expected_state.value:
+            return RequestLeaseError(
+                f"Request {request_id} lease was taken over by {current['lease_owner'] or 'nobody'}"
+            )
+        return RequestConflictError(
+            f"Request {request_id} was modified concurrently (expected resource version {resource_version})"
+        )
+
+    async def delete(self, request_id: str) -> bool:
+        """
+        Delete a key request.
+
+        Args:
+            request_id: Request identifier
+
+        Returns:
+            True if deleted, False if it did not exist
+        """
+        def remove(connection: sqlite3.Connection) -> bool:
+            with connection:
+                return connection.execute(
+                    "DELETE FROM key_requests WHERE request_id = ?", (request_id,)
+                ).rowcount > 0
+
+        deleted = await self._run(remove)
+        if deleted:
+            logger.info(f"Deleted key request {request_id}")
+        else:
+            logger.warning(f"Key request not found for deletion: {request_id}")
+        return deleted
+
+    async def delete_many(self, request_ids: list[str], state: Optional[KeyRequestState] = None) -> int:
+        """
+        Delete several key requests in batched statements.
+
+        Args:
+            request_ids: Request identifiers to delete
+            state: If given, only requests currently in this state are deleted
+
+        Returns:
+            Number of deleted requests
+        """
+        def remove(connection: sqlite3.Connection) -> int:
+            deleted = 0
+            with connection:
+                for i in range(0, len(request_ids), DELETE_BATCH_SIZE):
+                    batch = request_ids[i:i + DELETE_BATCH_SIZE]
+                    query = f"DELETE FROM key_requests WHERE request_id IN ({', '.join('?' * len(batch))})"
+                    params = list(batch)
+                    if state is not None:
+                        query += " AND state = ?"
+                        params.append(state.value)
+                    deleted += connection.execute(query, params).rowcount
+            return deleted
+
+        deleted = await self._run(remove)
+        logger.info(f"Deleted {deleted} key request(s)")
+        return deleted
+
+    async def archive(self, records: list[KeyRequestData]) -> str:
+        """
+        Write records to a single compressed archive chunk.
+
+        The chunk id is derived from the request ids; an existing chunk with
+        the same id is kept as is.
+
+        Args:
+            records: Key requests to archive
+
+        Returns:
+            Identifier of the archive chunk
+        """
+        chunk_id = archive_chunk_id(records)
+        payload = encode_archive(records)
+
+        def insert(connection: sqlite3.Connection) -> bool:
+            with connection:
+                cursor = connection.execute(
+                    "INSERT OR IGNORE INTO key_request_archive (chunk_id, archived_at, record_count, payload) "
+                    "VALUES (?, ?, ?, ?)",
+                    (chunk_id, datetime.utcnow().isoformat(), len(records), payload)
+                )
+                return cursor.rowcount > 0
+
+        if await self._run(insert):
+            logger.info(f"Archived {len(records)} key request(s) to chunk {chunk_id}")
+        else:
+            logger.info(f"Archive chunk {chunk_id} already exists, not writing it again")
+        return chunk_id
+
+    async def iter_archive(self) -> AsyncIterator[KeyRequestData]:
+        """
+        Lazily iterate over all archived key requests.
+
+        Yields:
+            Archived KeyRequestData objects, one chunk at a time
+        """
+        last_rowid = 0
+        while True:
+            row = await self._run(lambda connection: connection.execute(
+                "SELECT rowid, payload FROM key_request_archive WHERE rowid > ? ORDER BY rowid LIMIT 1",
+                (last_rowid,)
+            ).fetchone())
+            if row is None:
+                return
+
+            for record in decode_archive(row["payload"]):
+                yield record
+            last_rowid = row["rowid"]